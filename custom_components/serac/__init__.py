@@ -1,29 +1,55 @@
 """The Serac integration."""
 from __future__ import annotations
 
+import asyncio
+from datetime import timedelta
 import logging
+import time
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
 from .api.airquality_client import AirQualityClient
-from .api.bra_client import BraApiError, BraClient
-from .api.openmeteo_client import OpenMeteoApiError, OpenMeteoClient
-from .api.vigilance_client import VigilanceApiError, VigilanceClient
+from .api.bra_client import BraClient
+from .api.openmeteo_client import OpenMeteoApiError, OpenMeteoBatchClient, OpenMeteoClient
+from .api.vigilance_client import VigilanceClient, invalidate_vigilance_feeds
+from .cache import ResponseCache
+from .circuit_breaker import get_circuit_breaker
 from .const import (
     CONF_BRA_TOKEN,
+    CONF_FAST_START,
     CONF_LOCATION_NAME,
     CONF_MASSIF_ID,
     CONF_MASSIF_IDS,
     CONF_MASSIF_NAME,
+    CONF_SENSOR_GROUPS,
     CONF_VIGILANCE_TOKEN,
+    DEFAULT_FAST_START,
+    DEFAULT_SENSOR_GROUPS,
     DOMAIN,
+    INCREMENTAL_RELOAD_KEYS,
     MASSIF_IDS,
+    SENSOR_GROUP_AVALANCHE,
+    SENSOR_GROUP_VIGILANCE,
+    SIGNAL_BRA_COORDINATORS_ADDED,
+    STARTUP_REFRESH_CONCURRENCY,
+    STARTUP_REFRESH_TIMEOUT,
+    UPSTREAM_VIGILANCE,
+)
+from .coordinator import (
+    AromeCoordinator,
+    BraCoordinator,
+    ForecastBatchCoordinator,
+    VigilanceCoordinator,
+    bra_in_season,
 )
-from .coordinator import AromeCoordinator, BraCoordinator, VigilanceCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,7 +68,7 @@ async def async_cleanup_removed_massifs(hass: HomeAssistant, entry: ConfigEntry)
     longitude = entry.data[CONF_LONGITUDE]
 
     # Get currently configured massif IDs
-    current_massifs = entry.data.get(CONF_MASSIF_IDS, [])
+    current_massifs = _configured_massifs(entry)
     # Convert to integers for comparison
     current_massifs = [int(m) if isinstance(m, str) else m for m in current_massifs]
 
@@ -203,6 +229,172 @@ async def async_migrate_entity_ids(hass: HomeAssistant, entry: ConfigEntry) -> N
 
 
 
+async def async_first_refresh_concurrently(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    location_name: str,
+    coordinators: dict[str, DataUpdateCoordinator],
+    timeout: timedelta = STARTUP_REFRESH_TIMEOUT,
+) -> set[str]:
+    """Run the first refresh of several coordinators concurrently.
+
+    At most STARTUP_REFRESH_CONCURRENCY refreshes run at once. Setup waits
+    for them until the timeout; refreshes still running then continue in
+    the background and their entities update when they finish.
+
+    These refreshes never fail setup, so they use async_refresh and check
+    last_update_success rather than async_config_entry_first_refresh: its
+    ConfigEntryNotReady would be raised from a background task (or after
+    setup finished) where nothing can act on it.
+
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry
+        location_name: Name of the location for logging
+        coordinators: Coordinators keyed by a display name
+        timeout: How long setup waits for the refreshes
+
+    Returns:
+        Names of the coordinators whose first refresh failed before the deadline
+    """
+    if not coordinators:
+        return set()
+
+    semaphore = asyncio.Semaphore(STARTUP_REFRESH_CONCURRENCY)
+    failed: set[str] = set()
+
+    async def _async_first_refresh(name: str, coordinator: DataUpdateCoordinator) -> None:
+        async with semaphore:
+            await coordinator.async_refresh()
+        if coordinator.last_update_success:
+            _LOGGER.info(
+                "Successfully set up %s coordinator for %s", name, location_name
+            )
+        else:
+            _LOGGER.warning(
+                "Error setting up %s coordinator for %s (data unavailable): %s",
+                name,
+                location_name,
+                coordinator.last_exception,
+            )
+            failed.add(name)
+
+    tasks = [
+        entry.async_create_background_task(
+            hass,
+            _async_first_refresh(name, coordinator),
+            f"{DOMAIN} {location_name} {name} first refresh",
+        )
+        for name, coordinator in coordinators.items()
+    ]
+    start_time = time.monotonic()
+    _, pending = await asyncio.wait(tasks, timeout=timeout.total_seconds())
+
+    if pending:
+        _LOGGER.log(
+            logging.WARNING if timeout else logging.DEBUG,
+            "%d of %d first refreshes for %s still running after %ds, "
+            "continuing setup while they finish in the background",
+            len(pending),
+            len(tasks),
+            location_name,
+            timeout.total_seconds(),
+        )
+    else:
+        _LOGGER.debug(
+            "First refreshes for %s completed in %.2fs",
+            location_name,
+            time.monotonic() - start_time,
+        )
+
+    # Only failures before the deadline: later ones are retried by the coordinator
+    return set(failed)
+
+
+def _sensor_group_enabled(entry: ConfigEntry, group: str) -> bool:
+    """Return whether a sensor group is turned on for a config entry.
+
+    Args:
+        entry: Config entry
+        group: Sensor group (one of SENSOR_GROUPS)
+
+    Returns:
+        True if the group's entities should be created
+    """
+    return group in entry.data.get(CONF_SENSOR_GROUPS, DEFAULT_SENSOR_GROUPS)
+
+
+def _configured_massifs(entry: ConfigEntry) -> list[int | str]:
+    """Return the massif IDs selected for a config entry.
+
+    Args:
+        entry: Config entry
+
+    Returns:
+        Massif IDs (strings when they come from the multi-select), empty
+        when the avalanche sensor group is turned off
+    """
+    if not _sensor_group_enabled(entry, SENSOR_GROUP_AVALANCHE):
+        return []
+
+    # Get massif IDs (new format) or fall back to old single massif
+    massif_ids = entry.data.get(CONF_MASSIF_IDS, [])
+    if not massif_ids and entry.data.get(CONF_MASSIF_ID):
+        # Backward compatibility: convert old single massif to list
+        massif_ids = [entry.data[CONF_MASSIF_ID]]
+    return massif_ids
+
+
+def _create_bra_coordinators(
+    hass: HomeAssistant, entry: ConfigEntry, massif_ids: list[int | str]
+) -> dict[int, BraCoordinator]:
+    """Build the BRA coordinators of some massifs (without refreshing them).
+
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry
+        massif_ids: Massif IDs
+
+    Returns:
+        Mapping of massif ID to coordinator (empty without a BRA token)
+    """
+    bra_token = entry.data.get(CONF_BRA_TOKEN)
+    if not bra_token:
+        return {}
+
+    session = async_get_clientsession(hass)
+    bra_coordinators = {}
+    for massif_id in massif_ids:
+        # Convert string ID to int if needed (from multi-select)
+        if isinstance(massif_id, str):
+            massif_id = int(massif_id)
+
+        # Get massif name from MASSIF_IDS
+        massif_name = "Unknown"
+        if massif_id in MASSIF_IDS:
+            massif_name, _ = MASSIF_IDS[massif_id]
+
+        _LOGGER.debug(
+            "Setting up BRA coordinator for massif %s (%s)",
+            massif_id,
+            massif_name,
+        )
+        bra_client = BraClient(
+            api_key=bra_token,
+            massif_id=massif_id,
+            session=session,
+        )
+        bra_coordinators[massif_id] = BraCoordinator(
+            hass=hass,
+            client=bra_client,
+            location_name=entry.data[CONF_LOCATION_NAME],
+            massif_id=massif_id,
+            massif_name=massif_name,
+            cache=hass.data[DOMAIN].get("cache"),
+        )
+    return bra_coordinators
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Serac from a config entry.
 
@@ -217,17 +409,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         ConfigEntryNotReady: If setup should be retried
     """
     # Extract configuration
-    bra_token = entry.data.get(CONF_BRA_TOKEN)
     vigilance_token = entry.data.get(CONF_VIGILANCE_TOKEN)
     latitude = entry.data[CONF_LATITUDE]
     longitude = entry.data[CONF_LONGITUDE]
     location_name = entry.data[CONF_LOCATION_NAME]
 
-    # Get massif IDs (new format) or fall back to old single massif
-    massif_ids = entry.data.get(CONF_MASSIF_IDS, [])
-    if not massif_ids and entry.data.get(CONF_MASSIF_ID):
-        # Backward compatibility: convert old single massif to list
-        massif_ids = [entry.data[CONF_MASSIF_ID]]
+    massif_ids = _configured_massifs(entry)
 
     _LOGGER.debug(
         "Setting up Serac for %s (%.4f, %.4f)",
@@ -236,29 +423,60 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         longitude,
     )
 
+    # All API clients share Home Assistant's pooled session (keep-alive, DNS cache)
+    session = async_get_clientsession(hass)
+
     # Initialize Open-Meteo client (no authentication required)
     arome_client = OpenMeteoClient(
         latitude=latitude,
         longitude=longitude,
+        session=session,
     )
 
     # Initialize Air Quality client
     airquality_client = AirQualityClient(
         latitude=latitude,
         longitude=longitude,
+        session=session,
     )
 
+    # Forecasts of all locations are refreshed together by one shared coordinator
+    hass.data.setdefault(DOMAIN, {})
+    forecast_batch = hass.data[DOMAIN].get("forecast_batch")
+    if forecast_batch is None:
+        forecast_batch = ForecastBatchCoordinator(
+            hass, OpenMeteoBatchClient(session=session)
+        )
+        hass.data[DOMAIN]["forecast_batch"] = forecast_batch
+
+    # API responses are cached on disk so reloads and restarts can skip fetches
+    cache = hass.data[DOMAIN].get("cache")
+    if cache is None:
+        cache = hass.data[DOMAIN]["cache"] = ResponseCache(hass)
+    await cache.async_load()
+
     # Initialize AROME coordinator
     arome_coordinator = AromeCoordinator(
         hass=hass,
         client=arome_client,
         location_name=location_name,
         airquality_client=airquality_client,
+        batch=forecast_batch,
+        cache=cache,
     )
 
-    # Fetch initial weather data
+    # Fetch initial weather data, unless fast start can restore the last
+    # cached forecast, in which case entities are created from it right away
+    fast_start = entry.data.get(CONF_FAST_START, DEFAULT_FAST_START)
     try:
-        await arome_coordinator.async_config_entry_first_refresh()
+        if fast_start and await arome_coordinator.async_restore_from_cache():
+            entry.async_create_background_task(
+                hass,
+                arome_coordinator.async_refresh(),
+                f"{DOMAIN} {location_name} weather refresh",
+            )
+        else:
+            await arome_coordinator.async_config_entry_first_refresh()
     except OpenMeteoApiError as err:
         _LOGGER.error("Error communicating with Open-Meteo API: %s", err)
         raise ConfigEntryNotReady(f"Error communicating with Open-Meteo API: {err}") from err
@@ -266,110 +484,74 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("Unexpected error during AROME setup: %s", err)
         raise ConfigEntryNotReady(f"Unexpected error: {err}") from err
 
+    entry.async_on_unload(forecast_batch.async_register(arome_coordinator))
+
     # Store coordinators in hass.data
-    hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
+        # Configuration the coordinators were built from (see async_reload_entry)
+        "config": dict(entry.data),
         "arome_coordinator": arome_coordinator,
         "arome_client": arome_client,
         "airquality_client": airquality_client,
     }
 
     # Initialize BRA coordinators for each selected massif
-    bra_coordinators = {}
-    if bra_token and massif_ids:
-        for massif_id in massif_ids:
-            # Convert string ID to int if needed (from multi-select)
-            if isinstance(massif_id, str):
-                massif_id = int(massif_id)
-
-            # Get massif name from MASSIF_IDS
-            massif_name = "Unknown"
-            if massif_id in MASSIF_IDS:
-                massif_name, _ = MASSIF_IDS[massif_id]
-
-            _LOGGER.debug(
-                "Setting up BRA coordinator for massif %s (%s)",
-                massif_id,
-                massif_name,
-            )
-            try:
-                bra_client = BraClient(
-                    api_key=bra_token,
-                    massif_id=massif_id,
-                )
-                bra_coordinator = BraCoordinator(
-                    hass=hass,
-                    client=bra_client,
-                    location_name=location_name,
-                    massif_id=massif_id,
-                    massif_name=massif_name,
-                )
-                # Fetch initial BRA data
-                await bra_coordinator.async_config_entry_first_refresh()
-                bra_coordinators[massif_id] = bra_coordinator
-                _LOGGER.info(
-                    "Successfully set up BRA coordinator for %s (ID: %s)",
-                    massif_name,
-                    massif_id,
-                )
-            except BraApiError as err:
-                _LOGGER.warning(
-                    "Error setting up BRA coordinator for %s (avalanche data unavailable): %s",
-                    massif_name,
-                    err,
-                )
-                # Don't fail setup if BRA is unavailable (might be out of season)
-            except Exception as err:
-                _LOGGER.warning(
-                    "Unexpected error setting up BRA coordinator for %s: %s",
-                    massif_name,
-                    err,
-                )
-
-    # Store BRA coordinators
-    if bra_coordinators:
-        hass.data[DOMAIN][entry.entry_id]["bra_coordinators"] = bra_coordinators
+    bra_coordinators = _create_bra_coordinators(hass, entry, massif_ids)
 
     # Initialize Vigilance coordinator if token is provided
     vigilance_coordinator = None
-    if vigilance_token:
+    if vigilance_token and _sensor_group_enabled(entry, SENSOR_GROUP_VIGILANCE):
         _LOGGER.debug(
             "Setting up Vigilance coordinator for %s (lat=%.4f, lon=%.4f)",
             location_name,
             latitude,
             longitude,
         )
-        try:
-            vigilance_client = VigilanceClient(
-                api_token=vigilance_token,
-                latitude=latitude,
-                longitude=longitude,
-            )
-            vigilance_coordinator = VigilanceCoordinator(
-                hass=hass,
-                client=vigilance_client,
-                location_name=location_name,
-            )
-            # Fetch initial vigilance data
-            await vigilance_coordinator.async_config_entry_first_refresh()
-            _LOGGER.info(
-                "Successfully set up Vigilance coordinator for %s (dept: %s)",
-                location_name,
-                vigilance_client._department,
-            )
-        except VigilanceApiError as err:
-            _LOGGER.warning(
-                "Error setting up Vigilance coordinator for %s (weather alerts unavailable): %s",
-                location_name,
-                err,
-            )
-            # Don't fail setup if Vigilance is unavailable
-        except Exception as err:
-            _LOGGER.warning(
-                "Unexpected error setting up Vigilance coordinator for %s: %s",
-                location_name,
-                err,
-            )
+        vigilance_client = VigilanceClient(
+            api_token=vigilance_token,
+            latitude=latitude,
+            longitude=longitude,
+            session=session,
+        )
+        vigilance_coordinator = VigilanceCoordinator(
+            hass=hass,
+            client=vigilance_client,
+            location_name=location_name,
+            cache=cache,
+        )
+
+    # Fetch initial BRA and Vigilance data concurrently
+    first_refreshes: dict[str, DataUpdateCoordinator] = {}
+    if bra_in_season(dt_util.now()):
+        for bra_coordinator in bra_coordinators.values():
+            first_refreshes[f"BRA {bra_coordinator.massif_name}"] = bra_coordinator
+    else:
+        # Out of season: don't hold up startup on empty bulletins
+        for bra_coordinator in bra_coordinators.values():
+            bra_coordinator.async_start_dormant()
+    if vigilance_coordinator:
+        first_refreshes["Vigilance"] = vigilance_coordinator
+
+    # Don't fail setup if BRA (might be out of season) or Vigilance is unavailable
+    failed = await async_first_refresh_concurrently(
+        hass,
+        entry,
+        location_name,
+        first_refreshes,
+        # Fast start doesn't wait at all: the refreshes finish in the background
+        timeout=timedelta(0) if fast_start else STARTUP_REFRESH_TIMEOUT,
+    )
+    bra_coordinators = {
+        massif_id: bra_coordinator
+        for massif_id, bra_coordinator in bra_coordinators.items()
+        if f"BRA {bra_coordinator.massif_name}" not in failed
+    }
+    if "Vigilance" in failed:
+        vigilance_coordinator = None
+
+    # Store BRA coordinators
+    if bra_coordinators:
+        hass.data[DOMAIN][entry.entry_id]["bra_coordinators"] = bra_coordinators
 
     # Store Vigilance coordinator
     if vigilance_coordinator:
@@ -384,11 +566,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Forward setup to platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Apply options flow changes
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     # Register service for vigilance updates (only once globally)
     async def handle_update_vigilance(call):
         """Handle the update_vigilance service call."""
         _LOGGER.info("Manual vigilance update requested")
 
+        # Drop the shared national map so the first refresh below downloads a
+        # new one and the others reuse it, even if the API recently failed
+        invalidate_vigilance_feeds()
+        get_circuit_breaker(UPSTREAM_VIGILANCE).reset()
+
         # Update all vigilance coordinators across all entries
         updated_count = 0
         for entry_id, entry_data in hass.data[DOMAIN].items():
@@ -438,11 +628,92 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry.
+    """Apply a configuration change.
+
+    When only the massif selection changed, the BRA coordinators and sensors
+    of added or removed massifs are created or removed in place, keeping the
+    AROME and Vigilance coordinators and their data. Any other change reloads
+    the whole entry.
+
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry
+    """
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if entry_data is None:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    old_config = entry_data["config"]
+    changed = {
+        key
+        for key in old_config.keys() | entry.data.keys()
+        if old_config.get(key) != entry.data.get(key)
+    }
+    entry_data["config"] = dict(entry.data)
+    if not changed <= INCREMENTAL_RELOAD_KEYS:
+        _LOGGER.debug("Reloading Serac after changes to %s", ", ".join(sorted(changed)))
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    await async_update_massifs(hass, entry)
+
+
+async def async_update_massifs(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Create or remove BRA coordinators to match the configured massifs.
 
     Args:
         hass: Home Assistant instance
         entry: Config entry
     """
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    bra_coordinators: dict[int, BraCoordinator] = entry_data.setdefault(
+        "bra_coordinators", {}
+    )
+    configured = (
+        {int(massif_id) for massif_id in _configured_massifs(entry)}
+        if entry.data.get(CONF_BRA_TOKEN)
+        else set()
+    )
+
+    for massif_id in set(bra_coordinators) - configured:
+        await bra_coordinators.pop(massif_id).async_shutdown()
+
+    added = _create_bra_coordinators(
+        hass, entry, sorted(configured - set(bra_coordinators))
+    )
+    _LOGGER.info(
+        "Updating massifs of %s: %d added, %d kept",
+        entry.data[CONF_LOCATION_NAME],
+        len(added),
+        len(bra_coordinators),
+    )
+
+    # Entities of removed massifs are removed with their registry entries
+    await async_cleanup_removed_massifs(hass, entry)
+    if not added:
+        return
+
+    if bra_in_season(dt_util.now()):
+        # The entry is already loaded: a plain refresh, as there is no setup
+        # for async_config_entry_first_refresh to retry
+        await asyncio.gather(
+            *(coordinator.async_refresh() for coordinator in added.values())
+        )
+        for massif_id, coordinator in list(added.items()):
+            if not coordinator.last_update_success:
+                _LOGGER.warning(
+                    "Error setting up BRA %s coordinator for %s (data unavailable): %s",
+                    coordinator.massif_name,
+                    entry.data[CONF_LOCATION_NAME],
+                    coordinator.last_exception,
+                )
+                del added[massif_id]
+    else:
+        for coordinator in added.values():
+            coordinator.async_start_dormant()
+
+    bra_coordinators.update(added)
+    async_dispatcher_send(
+        hass, SIGNAL_BRA_COORDINATORS_ADDED.format(entry.entry_id), added
+    )
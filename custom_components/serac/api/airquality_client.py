@@ -6,6 +6,8 @@ from typing import Any
 
 import aiohttp
 
+from .session import async_read_json, client_session, response_error
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -16,15 +18,22 @@ class AirQualityApiError(Exception):
 class AirQualityClient:
     """Client for Open-Meteo Air Quality API."""
 
-    def __init__(self, latitude: float, longitude: float) -> None:
+    def __init__(
+        self,
+        latitude: float,
+        longitude: float,
+        session: aiohttp.ClientSession | None = None,
+    ) -> None:
         """Initialize the Air Quality client.
 
         Args:
             latitude: Location latitude
             longitude: Location longitude
+            session: Shared aiohttp session (a temporary one is used if omitted)
         """
         self.latitude = latitude
         self.longitude = longitude
+        self._session = session
         self.base_url = "https://air-quality-api.open-meteo.com/v1/air-quality"
 
     async def async_get_air_quality(self) -> dict[str, Any]:
@@ -53,7 +62,7 @@ class AirQualityClient:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with client_session(self._session) as session:
                 async with session.get(
                     self.base_url, params=params, timeout=aiohttp.ClientTimeout(total=30)
                 ) as response:
@@ -61,43 +70,54 @@ class AirQualityClient:
                         error_text = await response.text()
                         raise AirQualityApiError(
                             f"Air Quality API returned status {response.status}: {error_text}"
-                        )
-
-                    data = await response.json()
-
-            # Extract current air quality
-            current = data.get("current", {})
-            current_aqi = {
-                "european_aqi": current.get("european_aqi"),
-                "pm2_5": current.get("pm2_5"),
-                "pm10": current.get("pm10"),
-                "nitrogen_dioxide": current.get("nitrogen_dioxide"),
-                "ozone": current.get("ozone"),
-                "sulphur_dioxide": current.get("sulphur_dioxide"),
-            }
-
-            # Extract and aggregate hourly data into daily maximums
-            hourly_data = data.get("hourly", {})
-            hourly_times = hourly_data.get("time", [])
-            hourly_aqi = hourly_data.get("european_aqi", [])
-            hourly_pm25 = hourly_data.get("pm2_5", [])
-            hourly_pm10 = hourly_data.get("pm10", [])
-
-            # Aggregate into daily max values
-            daily_forecast = self._aggregate_to_daily(
-                hourly_times, hourly_aqi, hourly_pm25, hourly_pm10
-            )
-
-            return {
-                "current": current_aqi,
-                "daily_forecast": daily_forecast,
-            }
+                        ) from response_error(response)
 
+                    return await async_read_json(response, self._parse_air_quality)
+
+        except AirQualityApiError:
+            raise
         except aiohttp.ClientError as err:
             raise AirQualityApiError(f"Error communicating with Air Quality API: {err}") from err
         except Exception as err:
             raise AirQualityApiError(f"Unexpected error fetching air quality data: {err}") from err
 
+    def _parse_air_quality(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Parse a decoded Air Quality API response.
+
+        Args:
+            data: Decoded JSON response with current and hourly blocks
+
+        Returns:
+            Dictionary with current air quality and daily forecast
+        """
+        # Extract current air quality
+        current = data.get("current", {})
+        current_aqi = {
+            "european_aqi": current.get("european_aqi"),
+            "pm2_5": current.get("pm2_5"),
+            "pm10": current.get("pm10"),
+            "nitrogen_dioxide": current.get("nitrogen_dioxide"),
+            "ozone": current.get("ozone"),
+            "sulphur_dioxide": current.get("sulphur_dioxide"),
+        }
+
+        # Extract and aggregate hourly data into daily maximums
+        hourly_data = data.get("hourly", {})
+        hourly_times = hourly_data.get("time", [])
+        hourly_aqi = hourly_data.get("european_aqi", [])
+        hourly_pm25 = hourly_data.get("pm2_5", [])
+        hourly_pm10 = hourly_data.get("pm10", [])
+
+        # Aggregate into daily max values
+        daily_forecast = self._aggregate_to_daily(
+            hourly_times, hourly_aqi, hourly_pm25, hourly_pm10
+        )
+
+        return {
+            "current": current_aqi,
+            "daily_forecast": daily_forecast,
+        }
+
     def _aggregate_to_daily(
         self,
         hourly_times: list[str],
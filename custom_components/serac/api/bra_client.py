@@ -1,12 +1,16 @@
 """BRA (Bulletin de Risque d'Avalanche) API client for Météo-France."""
 from __future__ import annotations
 
+import hashlib
 import logging
 from typing import Any
 from xml.etree import ElementTree as ET
 
 import aiohttp
 
+from .rate_limiter import get_rate_limiter
+from .session import async_parse, client_session, response_error
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -21,20 +25,57 @@ class BraClient:
         self,
         api_key: str,
         massif_id: str | int,
+        session: aiohttp.ClientSession | None = None,
     ) -> None:
         """Initialize the BRA client.
 
         Args:
             api_key: Météo-France API key
             massif_id: Massif identifier (numeric: 1=Chablais, 2=Aravis, 3=Mont-Blanc)
+            session: Shared aiohttp session (a temporary one is used if omitted)
         """
         self._api_key = api_key
         self._massif_id = str(massif_id)  # Convert to string for API
+        self._session = session
         self._api_base_url = "https://public-api.meteofrance.fr/public/DPBRA/v1"
 
+        # Validators of the last downloaded bulletin, used to skip unchanged ones
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._content_hash: str | None = None
+        self._bulletin: dict[str, Any] | None = None
+
+    @property
+    def validators(self) -> dict[str, str | None]:
+        """Return the validators of the last downloaded bulletin (see restore)."""
+        return {
+            "etag": self._etag,
+            "last_modified": self._last_modified,
+            "content_hash": self._content_hash,
+        }
+
+    def restore(self, bulletin: dict[str, Any], validators: dict[str, str | None]) -> None:
+        """Seed the client with a bulletin downloaded earlier, e.g. before a restart.
+
+        The next request is then conditional on that bulletin's validators.
+
+        Args:
+            bulletin: Parsed bulletin
+            validators: Its validators, as returned by the validators property
+        """
+        self._etag = validators.get("etag")
+        self._last_modified = validators.get("last_modified")
+        self._content_hash = validators.get("content_hash")
+        self._bulletin = bulletin
+
     async def async_get_bulletin(self) -> dict[str, Any]:
         """Get avalanche bulletin for the configured massif.
 
+        Bulletins are published once a day, so the request is conditional on
+        the ETag/Last-Modified of the previous response, and an unchanged body
+        (same content hash) is not parsed again. In both cases the previously
+        parsed bulletin object is returned.
+
         Returns:
             Dictionary with parsed bulletin data
 
@@ -45,6 +86,11 @@ class BraClient:
             headers = {
                 "apikey": self._api_key,
             }
+            if self._bulletin is not None:
+                if self._etag:
+                    headers["If-None-Match"] = self._etag
+                if self._last_modified:
+                    headers["If-Modified-Since"] = self._last_modified
 
             url = f"{self._api_base_url}/massif/BRA"
             params = {
@@ -52,24 +98,54 @@ class BraClient:
                 "format": "xml",
             }
 
-            async with aiohttp.ClientSession() as session:
+            await get_rate_limiter(self._api_key).acquire()
+            async with client_session(self._session) as session:
                 async with session.get(
                     url,
                     headers=headers,
                     params=params,
                     timeout=aiohttp.ClientTimeout(total=30),
                 ) as response:
+                    if response.status == 304 and self._bulletin is not None:
+                        _LOGGER.debug(
+                            "Bulletin for massif %s not modified", self._massif_id
+                        )
+                        return self._bulletin
+
                     if response.status != 200:
                         error_text = await response.text()
                         raise BraApiError(
                             f"Failed to get bulletin: {response.status} - {error_text}"
-                        )
+                        ) from response_error(response)
 
                     xml_content = await response.text()
-
-            # Parse XML and extract data
-            return self._parse_bulletin_xml(xml_content)
-
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+
+            content_hash = hashlib.sha256(xml_content.encode()).hexdigest()
+            if content_hash == self._content_hash and self._bulletin is not None:
+                _LOGGER.debug(
+                    "Bulletin for massif %s unchanged, skipping parsing",
+                    self._massif_id,
+                )
+                bulletin = self._bulletin
+            else:
+                # Parse XML and extract data
+                bulletin = await async_parse(
+                    self._parse_bulletin_xml,
+                    xml_content,
+                    len(xml_content),
+                    f"BRA bulletin for massif {self._massif_id}",
+                )
+
+            self._etag = etag
+            self._last_modified = last_modified
+            self._content_hash = content_hash
+            self._bulletin = bulletin
+            return bulletin
+
+        except BraApiError:
+            raise
         except aiohttp.ClientError as err:
             raise BraApiError(f"Network error fetching bulletin: {err}") from err
         except ET.ParseError as err:
@@ -0,0 +1,159 @@
+"""Spatial index for mapping GPS coordinates to French departments."""
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+import math
+from typing import Any
+
+from ..const import DEPARTMENT_BOUNDARIES
+
+# Grid cell size in degrees (department bounds are given to 0.1°)
+GRID_CELL_SIZE = 0.1
+
+
+def _bounds(info: Mapping[str, Any]) -> tuple[float, float, float, float]:
+    """Return the (min_lat, max_lat, min_lon, max_lon) box of a department.
+
+    Args:
+        info: Department entry with a "polygon" ring or "bounds" box
+
+    Returns:
+        The bounding box of the ring, or the given box
+    """
+    polygon = info.get("polygon")
+    if not polygon:
+        return info["bounds"]
+    lats = [lat for lat, _ in polygon]
+    lons = [lon for _, lon in polygon]
+    return min(lats), max(lats), min(lons), max(lons)
+
+
+def _point_in_polygon(
+    lat: float, lon: float, polygon: Sequence[tuple[float, float]]
+) -> bool:
+    """Return True if a point lies inside a polygon ring (ray casting).
+
+    Args:
+        lat: Latitude
+        lon: Longitude
+        polygon: Ring of (lat, lon) vertices
+
+    Returns:
+        True if the point is inside the ring
+    """
+    inside = False
+    j = len(polygon) - 1
+    for i, (lat_i, lon_i) in enumerate(polygon):
+        lat_j, lon_j = polygon[j]
+        if (lat_i > lat) != (lat_j > lat) and lon < (lon_j - lon_i) * (
+            lat - lat_i
+        ) / (lat_j - lat_i) + lon_i:
+            inside = not inside
+        j = i
+    return inside
+
+
+class DepartmentIndex:
+    """Grid-bucket index over department geometries.
+
+    Every department is registered in the grid cells its bounding box touches,
+    so a lookup only tests the few departments sharing the point's cell.
+    Where an entry provides a ``polygon`` ring it is used for containment;
+    otherwise the bounding box is. A department whose outline contains the
+    point wins over bounding boxes. When no outline contains it, the point
+    falls back to the bounding boxes (outlines included), so a simplified
+    outline cannot drop a location near it; ties between overlapping boxes
+    are resolved in favour of the department the point lies deepest inside.
+    """
+
+    def __init__(
+        self,
+        departments: Mapping[str, Mapping[str, Any]],
+        cell_size: float = GRID_CELL_SIZE,
+    ) -> None:
+        """Build the index.
+
+        Args:
+            departments: Mapping of department code to {"name", "polygon"} or
+                {"name", "bounds"}
+            cell_size: Grid cell size in degrees
+        """
+        self._departments = departments
+        self._cell_size = cell_size
+        self._bounds = {code: _bounds(info) for code, info in departments.items()}
+        self._cells: dict[tuple[int, int], list[str]] = {}
+
+        for code, (min_lat, max_lat, min_lon, max_lon) in self._bounds.items():
+            min_row, min_col = self._cell(min_lat, min_lon)
+            max_row, max_col = self._cell(max_lat, max_lon)
+            for row in range(min_row, max_row + 1):
+                for col in range(min_col, max_col + 1):
+                    self._cells.setdefault((row, col), []).append(code)
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int]:
+        """Return the grid cell containing a point."""
+        # Round first so 45.7 / 0.1 does not land in cell 456
+        return (
+            math.floor(round(lat / self._cell_size, 9)),
+            math.floor(round(lon / self._cell_size, 9)),
+        )
+
+    def _rank(self, code: str, lat: float, lon: float) -> tuple[bool, float] | None:
+        """Return how well a department matches a point (lower is better).
+
+        Args:
+            code: Department code
+            lat: Latitude
+            lon: Longitude
+
+        Returns:
+            (not inside the department's outline, distance from the
+            bounding-box centre normalized to its half-size: 0 at the centre,
+            1 on the edge), or None if the point is outside the bounding box
+        """
+        min_lat, max_lat, min_lon, max_lon = self._bounds[code]
+        if not (min_lat <= lat <= max_lat and min_lon <= lon <= max_lon):
+            return None
+
+        polygon = self._departments[code].get("polygon")
+        half_lat = (max_lat - min_lat) / 2 or 1.0
+        half_lon = (max_lon - min_lon) / 2 or 1.0
+        return not (polygon and _point_in_polygon(lat, lon, polygon)), max(
+            abs(lat - (min_lat + half_lat)) / half_lat,
+            abs(lon - (min_lon + half_lon)) / half_lon,
+        )
+
+    def lookup(self, lat: float, lon: float) -> str | None:
+        """Return the department code containing a point.
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+
+        Returns:
+            Department code (e.g., "74") or None if no department matches
+        """
+        best_code = None
+        best_rank = (True, math.inf)
+        for code in self._cells.get(self._cell(lat, lon), ()):
+            rank = self._rank(code, lat, lon)
+            if rank is not None and rank < best_rank:
+                best_code, best_rank = code, rank
+        return best_code
+
+
+# Built once at import and shared by every client
+DEPARTMENT_INDEX = DepartmentIndex(DEPARTMENT_BOUNDARIES)
+
+
+def find_department(lat: float, lon: float) -> str | None:
+    """Get the French department code for GPS coordinates.
+
+    Args:
+        lat: Latitude
+        lon: Longitude
+
+    Returns:
+        Department code (e.g., "74" for Haute-Savoie) or None if not found
+    """
+    return DEPARTMENT_INDEX.lookup(lat, lon)
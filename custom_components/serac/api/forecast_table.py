@@ -0,0 +1,122 @@
+"""Columnar storage for forecast time steps."""
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any, overload
+
+
+class ForecastRow(Mapping[str, Any]):
+    """Read-only view of one time step of a ForecastTable.
+
+    Behaves like the per-step dictionaries the coordinator used to hold
+    (``row["datetime"]``, ``row.get("temperature")``) without copying values.
+    """
+
+    __slots__ = ("_columns", "_index")
+
+    def __init__(self, columns: Mapping[str, Sequence[Any]], index: int) -> None:
+        """Initialize the row view.
+
+        Args:
+            columns: Columns of the owning table
+            index: Position of the time step in every column
+        """
+        self._columns = columns
+        self._index = index
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value of a field for this time step."""
+        return self._columns[key][self._index]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over field names."""
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        """Return the number of fields."""
+        return len(self._columns)
+
+    def __repr__(self) -> str:
+        """Return the row as a dict representation."""
+        return repr(dict(self))
+
+
+class ForecastTable(Sequence[ForecastRow]):
+    """Forecast time steps stored column by column.
+
+    Each field is one sequence sliced straight from the Open-Meteo response
+    arrays, so a refresh allocates a handful of tuples instead of a dict per
+    time step. Tables built from the same response can share columns, e.g.
+    the hourly and 6-hour forecasts share their time index.
+    """
+
+    __slots__ = ("_columns", "_length")
+
+    def __init__(self, columns: Mapping[str, Sequence[Any]], length: int) -> None:
+        """Initialize the table.
+
+        Args:
+            columns: Field name to per-step values (each at least `length` long)
+            length: Number of time steps
+        """
+        self._columns = columns
+        self._length = length
+
+    @overload
+    def __getitem__(self, index: int) -> ForecastRow: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> ForecastTable: ...
+
+    def __getitem__(self, index: int | slice) -> ForecastRow | ForecastTable:
+        """Return a row view, or a new table for a slice."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            return ForecastTable(
+                {
+                    key: column[start:stop:step]
+                    for key, column in self._columns.items()
+                },
+                len(range(start, stop, step)),
+            )
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("forecast index out of range")
+        return ForecastRow(self._columns, index)
+
+    def __len__(self) -> int:
+        """Return the number of time steps."""
+        return self._length
+
+    def __repr__(self) -> str:
+        """Return a short description of the table."""
+        return f"<ForecastTable with {self._length} items>"
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if both tables hold the same values, column by column."""
+        if not isinstance(other, ForecastTable):
+            return NotImplemented
+        return (
+            self._length == other._length
+            and self._columns.keys() == other._columns.keys()
+            and all(self.column(key) == other.column(key) for key in self._columns)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def column(self, key: str) -> Sequence[Any]:
+        """Return all values of a field, one per time step.
+
+        Args:
+            key: Field name
+
+        Returns:
+            Sequence of values (not longer than the table)
+        """
+        return self._columns[key][: self._length]
+
+    def as_dicts(self) -> list[dict[str, Any]]:
+        """Materialise the table as a list of per-step dictionaries."""
+        return [dict(row) for row in self]
@@ -2,19 +2,115 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import logging
 from typing import Any
 
 import aiohttp
 
+from ..const import OPENMETEO_BATCH_SIZE, OPENMETEO_RUN_MODEL
+from .forecast_table import ForecastTable
+from .session import async_read_json, client_session
+
 _LOGGER = logging.getLogger(__name__)
 
+# Forecast requests currently in flight, shared by every client in the process.
+# Keyed on (endpoint, latitude, longitude, variable set).
+_INFLIGHT_REQUESTS: dict[tuple[Any, ...], asyncio.Task[Any]] = {}
+
+
+async def _async_coalesce(
+    key: tuple[Any, ...], factory: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Run factory once for all concurrent callers using the same key.
+
+    The first caller starts the request, later callers await the same task
+    and receive the same parsed result (which must be treated as read-only).
+
+    Args:
+        key: Request identity
+        factory: Coroutine function performing the request
+
+    Returns:
+        Result of the shared request
+    """
+    task = _INFLIGHT_REQUESTS.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        _INFLIGHT_REQUESTS[key] = task
+
+        def _release(finished: asyncio.Task[Any]) -> None:
+            if _INFLIGHT_REQUESTS.get(key) is finished:
+                del _INFLIGHT_REQUESTS[key]
+
+        task.add_done_callback(_release)
+    else:
+        _LOGGER.debug("Joining in-flight Open-Meteo request for %s", key[1:3])
+
+    # Shield so that one caller being cancelled does not cancel the others
+    return await asyncio.shield(task)
+
 
 class OpenMeteoApiError(Exception):
     """Exception raised for Open-Meteo API errors."""
 
 
+CURRENT_VARIABLES = (
+    "temperature_2m,relative_humidity_2m,pressure_msl,"
+    "wind_speed_10m,wind_direction_10m,wind_gusts_10m,cloud_cover,"
+    "is_day,precipitation,rain,showers,snowfall"
+)
+DAILY_VARIABLES = (
+    "temperature_2m_max,temperature_2m_min,precipitation_sum,"
+    "weather_code,wind_speed_10m_max,wind_gusts_10m_max,wind_direction_10m_dominant,"
+    "sunrise,sunset,sunshine_duration,daylight_duration,uv_index_max,"
+    "rain_sum,showers_sum,snowfall_sum,precipitation_hours"
+)
+HOURLY_VARIABLES = (
+    "temperature_2m,precipitation,weather_code,cloud_cover,"
+    "wind_speed_10m,wind_gusts_10m,wind_direction_10m"
+)
+HOURLY_6H_VARIABLES = (
+    "temperature_2m,wind_speed_10m,wind_gusts_10m,cloud_cover,"
+    "snowfall,rain,precipitation"
+)
+# Union of the hourly variables above, used by the combined forecast request,
+# plus the current variables missing from them: a response reused for hours
+# takes its current conditions from the hourly row of the current hour
+FORECAST_HOURLY_VARIABLES = (
+    "temperature_2m,precipitation,weather_code,cloud_cover,"
+    "wind_speed_10m,wind_gusts_10m,wind_direction_10m,snowfall,rain,"
+    "relative_humidity_2m,pressure_msl,is_day,showers"
+)
+# Query parameters of the combined forecast request (without coordinates)
+FORECAST_PARAMS: dict[str, Any] = {
+    "current": CURRENT_VARIABLES,
+    "hourly": FORECAST_HOURLY_VARIABLES,
+    "daily": DAILY_VARIABLES,
+    "timezone": "auto",
+    "forecast_days": 8,
+}
+
+
+# Metadata of a weather model (latest run, update interval), see
+# https://open-meteo.com/en/docs/model-updates
+MODEL_METADATA_URL = "https://api.open-meteo.com/data/{model}/static/meta.json"
+
+
+@dataclass(frozen=True)
+class ModelRun:
+    """Latest run of a weather model ingested by Open-Meteo."""
+
+    # Model initialisation time of the run (UTC)
+    initialisation: datetime
+    # When the run became available through the API (UTC)
+    available: datetime
+    # Expected time between two runs
+    update_interval: timedelta
+
+
 class OpenMeteoClient:
     """Client for Open-Meteo API (uses Météo-France models for France)."""
 
@@ -22,17 +118,110 @@ class OpenMeteoClient:
         self,
         latitude: float,
         longitude: float,
+        session: aiohttp.ClientSession | None = None,
     ) -> None:
         """Initialize the Open-Meteo client.
 
         Args:
             latitude: Location latitude
             longitude: Location longitude
+            session: Shared aiohttp session (a temporary one is used if omitted)
         """
         self._latitude = latitude
         self._longitude = longitude
+        self._session = session
         self._base_url = "https://api.open-meteo.com/v1/forecast"
 
+    async def _async_request(
+        self,
+        params: dict[str, Any],
+        parse: Callable[[dict[str, Any]], Any] | None = None,
+    ) -> Any:
+        """Send a request to the forecast endpoint and parse the JSON response.
+
+        Args:
+            params: Query parameters (latitude/longitude are added automatically)
+            parse: Parser of the decoded response (see async_read_json)
+
+        Returns:
+            Parsed response, or the decoded JSON if parse is None
+        """
+        async with client_session(self._session) as session:
+            async with session.get(
+                self._base_url,
+                params={
+                    "latitude": self._latitude,
+                    "longitude": self._longitude,
+                    **params,
+                },
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as response:
+                response.raise_for_status()
+                return await async_read_json(response, parse)
+
+    async def async_get_forecast(self) -> dict[str, Any]:
+        """Get current weather, daily, hourly and 6h forecasts in a single request.
+
+        Concurrent calls for the same coordinates share one HTTP request and
+        parsed result. Nearby locations are not merged: the response's
+        elevation, and the temperatures downscaled to it, are specific to the
+        exact point.
+
+        Returns:
+            Dictionary with "current", "daily_forecast", "hourly_forecast",
+            "hourly_6h" and "elevation" keys, in the same shapes as the
+            individual async_get_* methods, plus the decoded response under
+            "payload" so it can be saved and parsed again later
+        """
+        key = (
+            self._base_url,
+            self._latitude,
+            self._longitude,
+            CURRENT_VARIABLES,
+            FORECAST_HOURLY_VARIABLES,
+            DAILY_VARIABLES,
+        )
+        return await _async_coalesce(key, self._async_fetch_forecast)
+
+    async def _async_fetch_forecast(self) -> dict[str, Any]:
+        """Fetch and parse the combined forecast for this location.
+
+        Returns:
+            Parsed forecast dictionary (see async_get_forecast)
+        """
+        try:
+            return await self._async_request(
+                FORECAST_PARAMS,
+                lambda data: {**self.parse_forecast(data), "payload": data},
+            )
+
+        except aiohttp.ClientError as err:
+            _LOGGER.error("Network error getting forecast: %s", err, exc_info=True)
+            raise OpenMeteoApiError(f"Network error: {err}") from err
+        except Exception as err:
+            _LOGGER.error("Error getting forecast: %s (type: %s)", err, type(err).__name__, exc_info=True)
+            raise OpenMeteoApiError(f"Failed to get forecast: {err}") from err
+
+    @classmethod
+    def parse_forecast(cls, data: dict[str, Any]) -> dict[str, Any]:
+        """Slice a combined forecast response into the coordinator data shapes.
+
+        Args:
+            data: Decoded JSON response with current, hourly and daily blocks
+
+        Returns:
+            Dictionary with current weather, daily/hourly/6h forecast tables
+            and elevation
+        """
+        hourly_forecast, hourly_6h = cls._parse_hourly_tables(data)
+        return {
+            "current": cls._parse_current(data),
+            "daily_forecast": cls._parse_daily(data),
+            "hourly_forecast": hourly_forecast,
+            "hourly_6h": hourly_6h,
+            "elevation": data.get("elevation", 0),
+        }
+
     async def async_get_current_weather(self) -> dict[str, Any]:
         """Get current weather conditions.
 
@@ -40,41 +229,13 @@ class OpenMeteoClient:
             Dictionary with current weather data
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "latitude": self._latitude,
-                    "longitude": self._longitude,
-                    "current": "temperature_2m,relative_humidity_2m,pressure_msl,"
-                    "wind_speed_10m,wind_direction_10m,wind_gusts_10m,cloud_cover,"
-                    "is_day,precipitation,rain,showers,snowfall",
+            return await self._async_request(
+                {
+                    "current": CURRENT_VARIABLES,
                     "timezone": "auto",
-                }
-
-                async with session.get(
-                    self._base_url, params=params, timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-
-                    current = data.get("current", {})
-
-                    return {
-                        "condition": self._map_condition(current),
-                        "temperature": current.get("temperature_2m"),
-                        "humidity": current.get("relative_humidity_2m"),
-                        "pressure": current.get("pressure_msl"),
-                        "wind_speed": current.get("wind_speed_10m"),
-                        "wind_bearing": current.get("wind_direction_10m"),
-                        "wind_gust": current.get("wind_gusts_10m"),
-                        "cloud_coverage": current.get("cloud_cover"),
-                        "is_day": current.get("is_day", 1) == 1,
-                        "precipitation": current.get("precipitation"),
-                        "rain": current.get("rain"),
-                        "showers": current.get("showers"),
-                        "snowfall": current.get("snowfall"),
-                        "visibility": None,  # Not provided by Open-Meteo
-                        "timestamp": current.get("time"),
-                    }
+                },
+                self._parse_current,
+            )
 
         except aiohttp.ClientError as err:
             _LOGGER.error("Network error getting current weather: %s", err, exc_info=True)
@@ -83,73 +244,21 @@ class OpenMeteoClient:
             _LOGGER.error("Error getting current weather: %s (type: %s)", err, type(err).__name__, exc_info=True)
             raise OpenMeteoApiError(f"Failed to get current weather: {err}") from err
 
-    async def async_get_daily_forecast(self) -> list[dict[str, Any]]:
+    async def async_get_daily_forecast(self) -> ForecastTable:
         """Get daily forecast for 8 days (today + 7 next days).
 
         Returns:
-            List of daily forecast dictionaries
+            Table of daily forecasts
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "latitude": self._latitude,
-                    "longitude": self._longitude,
-                    "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum,"
-                    "weather_code,wind_speed_10m_max,wind_gusts_10m_max,wind_direction_10m_dominant,"
-                    "sunrise,sunset,sunshine_duration,daylight_duration,uv_index_max,"
-                    "rain_sum,showers_sum,snowfall_sum,precipitation_hours",
+            return await self._async_request(
+                {
+                    "daily": DAILY_VARIABLES,
                     "timezone": "auto",
                     "forecast_days": 8,
-                }
-
-                async with session.get(
-                    self._base_url, params=params, timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-
-                    daily = data.get("daily", {})
-                    daily_forecasts = []
-
-                    times = daily.get("time", [])
-                    for i in range(len(times)):
-                        dt = datetime.fromisoformat(times[i])
-
-                        # Parse sunrise/sunset
-                        sunrise_str = daily.get("sunrise", [None])[i]
-                        sunset_str = daily.get("sunset", [None])[i]
-                        sunrise = datetime.fromisoformat(sunrise_str) if sunrise_str else None
-                        sunset = datetime.fromisoformat(sunset_str) if sunset_str else None
-
-                        # Ensure timezone awareness for sunrise/sunset
-                        if sunrise and sunrise.tzinfo is None:
-                            sunrise = sunrise.replace(tzinfo=timezone.utc)
-                        if sunset and sunset.tzinfo is None:
-                            sunset = sunset.replace(tzinfo=timezone.utc)
-
-                        daily_forecasts.append({
-                            "datetime": dt.isoformat(),
-                            "temperature": daily["temperature_2m_max"][i],
-                            "templow": daily["temperature_2m_min"][i],
-                            "precipitation_sum": daily["precipitation_sum"][i],
-                            "precipitation": daily["precipitation_sum"][i],  # Keep for backward compatibility
-                            "precipitation_probability": None,  # Not in daily
-                            "condition": self._map_weather_code(daily.get("weather_code", [None])[i]),
-                            "wind_speed": daily.get("wind_speed_10m_max", [None])[i],
-                            "wind_gust_speed": daily.get("wind_gusts_10m_max", [None])[i],
-                            "wind_bearing": daily.get("wind_direction_10m_dominant", [None])[i],
-                            "sunrise": sunrise,
-                            "sunset": sunset,
-                            "sunshine_duration": daily.get("sunshine_duration", [None])[i],
-                            "daylight_duration": daily.get("daylight_duration", [None])[i],
-                            "uv_index": daily.get("uv_index_max", [None])[i],
-                            "rain_sum": daily.get("rain_sum", [None])[i],
-                            "showers_sum": daily.get("showers_sum", [None])[i],
-                            "snowfall_sum": daily.get("snowfall_sum", [None])[i],
-                            "precipitation_hours": daily.get("precipitation_hours", [None])[i],
-                        })
-
-                    return daily_forecasts
+                },
+                self._parse_daily,
+            )
 
         except aiohttp.ClientError as err:
             _LOGGER.error("Network error getting daily forecast: %s", err, exc_info=True)
@@ -158,68 +267,21 @@ class OpenMeteoClient:
             _LOGGER.error("Error getting daily forecast: %s", err, exc_info=True)
             raise OpenMeteoApiError(f"Failed to get daily forecast: {err}") from err
 
-    async def async_get_hourly_forecast(self) -> list[dict[str, Any]]:
+    async def async_get_hourly_forecast(self) -> ForecastTable:
         """Get hourly forecast for 48 hours (future hours only).
 
         Returns:
-            List of hourly forecast dictionaries
+            Table of hourly forecasts
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "latitude": self._latitude,
-                    "longitude": self._longitude,
-                    "hourly": "temperature_2m,precipitation,weather_code,cloud_cover,"
-                    "wind_speed_10m,wind_gusts_10m,wind_direction_10m",
+            return await self._async_request(
+                {
+                    "hourly": HOURLY_VARIABLES,
                     "timezone": "auto",
                     "forecast_days": 3,  # 72 hours to ensure we get 48+
-                }
-
-                async with session.get(
-                    self._base_url, params=params, timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-
-                    hourly = data.get("hourly", {})
-                    hourly_forecasts = []
-
-                    times = hourly.get("time", [])
-
-                    # Get current time for comparison
-                    # Parse first datetime to get timezone info
-                    if not times:
-                        return []
-
-                    first_dt = datetime.fromisoformat(times[0])
-                    # Use the same timezone as the forecast data
-                    if first_dt.tzinfo:
-                        now = datetime.now(tz=first_dt.tzinfo)
-                    else:
-                        now = datetime.now()
-
-                    for i in range(len(times)):
-                        dt = datetime.fromisoformat(times[i])
-
-                        # Only include future hours
-                        if dt > now:
-                            hourly_forecasts.append({
-                                "datetime": dt,  # Keep as datetime for processing
-                                "temperature": hourly["temperature_2m"][i],
-                                "precipitation": hourly["precipitation"][i],
-                                "precipitation_probability": None,  # Not in hourly
-                                "condition": self._map_weather_code(hourly.get("weather_code", [None])[i]),
-                                "wind_speed": hourly["wind_speed_10m"][i],
-                                "wind_gust_speed": hourly["wind_gusts_10m"][i],
-                                "wind_bearing": hourly["wind_direction_10m"][i],
-                                "cloud_coverage": hourly.get("cloud_cover", [None])[i],
-                            })
-
-                            # Stop after collecting 48 future hours
-                            if len(hourly_forecasts) >= 48:
-                                break
-
-                    return hourly_forecasts
+                },
+                self._parse_hourly,
+            )
 
         except aiohttp.ClientError as err:
             _LOGGER.error("Network error getting hourly forecast: %s", err, exc_info=True)
@@ -228,69 +290,21 @@ class OpenMeteoClient:
             _LOGGER.error("Error getting hourly forecast: %s", err, exc_info=True)
             raise OpenMeteoApiError(f"Failed to get hourly forecast: {err}") from err
 
-    async def async_get_hourly_6h(self) -> list[dict[str, Any]]:
+    async def async_get_hourly_6h(self) -> ForecastTable:
         """Get hourly forecast for next 6 hours.
 
         Returns:
-            List of hourly forecast dictionaries for next 6 hours
+            Table of hourly forecasts for next 6 hours
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "latitude": self._latitude,
-                    "longitude": self._longitude,
-                    "hourly": "temperature_2m,wind_speed_10m,wind_gusts_10m,cloud_cover,"
-                    "snowfall,rain,precipitation",
+            return await self._async_request(
+                {
+                    "hourly": HOURLY_6H_VARIABLES,
                     "timezone": "auto",
                     "forecast_days": 1,  # Only need today's data
-                }
-
-                async with session.get(
-                    self._base_url, params=params, timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-
-                    hourly = data.get("hourly", {})
-                    hourly_6h = []
-
-                    times = hourly.get("time", [])
-
-                    # Get current time for comparison
-                    if not times:
-                        return []
-
-                    first_dt = datetime.fromisoformat(times[0])
-                    # Use the same timezone as the forecast data
-                    if first_dt.tzinfo:
-                        now = datetime.now(tz=first_dt.tzinfo)
-                    else:
-                        now = datetime.now()
-
-                    hour_count = 0
-                    for i in range(len(times)):
-                        dt = datetime.fromisoformat(times[i])
-
-                        # Only include future hours
-                        if dt > now:
-                            hour_count += 1
-                            hourly_6h.append({
-                                "hour": hour_count,
-                                "datetime": dt,
-                                "temperature": hourly["temperature_2m"][i],
-                                "wind_speed": hourly["wind_speed_10m"][i],
-                                "wind_gust": hourly["wind_gusts_10m"][i],
-                                "cloud_cover": hourly.get("cloud_cover", [None])[i],
-                                "snowfall": hourly.get("snowfall", [None])[i],
-                                "rain": hourly.get("rain", [None])[i],
-                                "precipitation": hourly.get("precipitation", [None])[i],
-                            })
-
-                            # Stop after collecting 6 future hours
-                            if hour_count >= 6:
-                                break
-
-                    return hourly_6h
+                },
+                self._parse_hourly_6h,
+            )
 
         except aiohttp.ClientError as err:
             _LOGGER.error("Network error getting hourly 6h forecast: %s", err, exc_info=True)
@@ -306,25 +320,14 @@ class OpenMeteoClient:
             Dictionary with elevation data
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "latitude": self._latitude,
-                    "longitude": self._longitude,
-                    "timezone": "auto",
-                }
+            data = await self._async_request({"timezone": "auto"})
 
-                async with session.get(
-                    self._base_url, params=params, timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-
-                    # Get elevation from response
-                    elevation = data.get("elevation", 0)
+            # Get elevation from response
+            elevation = data.get("elevation", 0)
 
-                    return {
-                        "elevation": elevation,
-                    }
+            return {
+                "elevation": elevation,
+            }
 
         except aiohttp.ClientError as err:
             _LOGGER.error("Network error getting additional data: %s", err, exc_info=True)
@@ -333,6 +336,286 @@ class OpenMeteoClient:
             _LOGGER.error("Error getting additional data: %s", err, exc_info=True)
             raise OpenMeteoApiError(f"Failed to get additional data: {err}") from err
 
+    @staticmethod
+    def _current_block(data: dict[str, Any]) -> dict[str, Any]:
+        """Return the current conditions of a forecast response.
+
+        The "current" block is frozen when the response is fetched, while a
+        response may be parsed again for hours (batch reused until the next
+        model run, cache). From the next hour on, the hourly row of the
+        current hour is used instead.
+
+        Args:
+            data: Decoded JSON response
+
+        Returns:
+            Current variables, keyed like the "current" block
+        """
+        current = data.get("current", {})
+        hourly = data.get("hourly", {})
+        times = hourly.get("time", [])
+        if not times:
+            return current
+
+        # Hourly times are local to the location ("timezone": "auto")
+        if "utc_offset_seconds" in data:
+            now = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(
+                seconds=data["utc_offset_seconds"]
+            )
+        else:
+            now = datetime.now()
+        hour = now.replace(minute=0, second=0, microsecond=0).isoformat(timespec="minutes")
+        if current.get("time", "") >= hour:
+            return current
+        try:
+            index = times.index(hour)
+        except ValueError:
+            return current
+        return {
+            **current,
+            **{
+                key: values[index]
+                for key, values in hourly.items()
+                if key != "time" and index < len(values)
+            },
+            "time": hour,
+        }
+
+    @classmethod
+    def _parse_current(cls, data: dict[str, Any]) -> dict[str, Any]:
+        """Parse the current conditions of a forecast response.
+
+        Args:
+            data: Decoded JSON response
+
+        Returns:
+            Dictionary with current weather data
+        """
+        current = cls._current_block(data)
+
+        return {
+            "condition": cls._map_condition(current),
+            "temperature": current.get("temperature_2m"),
+            "humidity": current.get("relative_humidity_2m"),
+            "pressure": current.get("pressure_msl"),
+            "wind_speed": current.get("wind_speed_10m"),
+            "wind_bearing": current.get("wind_direction_10m"),
+            "wind_gust": current.get("wind_gusts_10m"),
+            "cloud_coverage": current.get("cloud_cover"),
+            "is_day": current.get("is_day", 1) == 1,
+            "precipitation": current.get("precipitation"),
+            "rain": current.get("rain"),
+            "showers": current.get("showers"),
+            "snowfall": current.get("snowfall"),
+            "visibility": None,  # Not provided by Open-Meteo
+            "timestamp": current.get("time"),
+        }
+
+    @staticmethod
+    def _column(
+        block: dict[str, Any], key: str, start: int, stop: int
+    ) -> tuple[Any, ...]:
+        """Slice one response array into a forecast column.
+
+        Args:
+            block: The "hourly" or "daily" block of a forecast response
+            key: Open-Meteo variable name
+            start: First index to keep
+            stop: Index after the last one to keep
+
+        Returns:
+            Tuple of values (None-filled if the variable is missing)
+        """
+        values = block.get(key)
+        if values is None:
+            return (None,) * (stop - start)
+        return tuple(values[start:stop])
+
+    @classmethod
+    def _parse_daily(cls, data: dict[str, Any]) -> ForecastTable:
+        """Parse the "daily" block of a forecast response.
+
+        Args:
+            data: Decoded JSON response
+
+        Returns:
+            Table of daily forecasts
+        """
+        daily = data.get("daily", {})
+        length = len(daily.get("time", []))
+
+        def column(key: str) -> tuple[Any, ...]:
+            return cls._column(daily, key, 0, length)
+
+        def parse_sun(values: tuple[Any, ...]) -> tuple[datetime | None, ...]:
+            # Ensure timezone awareness for sunrise/sunset
+            parsed = []
+            for value in values:
+                dt = datetime.fromisoformat(value) if value else None
+                if dt and dt.tzinfo is None:
+                    dt = dt.replace(tzinfo=timezone.utc)
+                parsed.append(dt)
+            return tuple(parsed)
+
+        precipitation_sum = column("precipitation_sum")
+
+        return ForecastTable(
+            {
+                "datetime": tuple(
+                    datetime.fromisoformat(day).isoformat()
+                    for day in column("time")
+                ),
+                "temperature": column("temperature_2m_max"),
+                "templow": column("temperature_2m_min"),
+                "precipitation_sum": precipitation_sum,
+                "precipitation": precipitation_sum,  # Keep for backward compatibility
+                "precipitation_probability": (None,) * length,  # Not in daily
+                "condition": tuple(
+                    cls._map_weather_code(code) for code in column("weather_code")
+                ),
+                "wind_speed": column("wind_speed_10m_max"),
+                "wind_gust_speed": column("wind_gusts_10m_max"),
+                "wind_bearing": column("wind_direction_10m_dominant"),
+                "sunrise": parse_sun(column("sunrise")),
+                "sunset": parse_sun(column("sunset")),
+                "sunshine_duration": column("sunshine_duration"),
+                "daylight_duration": column("daylight_duration"),
+                "uv_index": column("uv_index_max"),
+                "rain_sum": column("rain_sum"),
+                "showers_sum": column("showers_sum"),
+                "snowfall_sum": column("snowfall_sum"),
+                "precipitation_hours": column("precipitation_hours"),
+            },
+            length,
+        )
+
+    @staticmethod
+    def _future_hour_indices(hourly: dict[str, Any], limit: int) -> list[tuple[int, datetime]]:
+        """Return (index, datetime) pairs for the next `limit` future hours.
+
+        Args:
+            hourly: The "hourly" block of a forecast response
+            limit: Maximum number of future hours to return
+
+        Returns:
+            List of (index into the hourly arrays, parsed datetime) tuples
+        """
+        times = hourly.get("time", [])
+        if not times:
+            return []
+
+        # Get current time for comparison
+        # Parse first datetime to get timezone info
+        first_dt = datetime.fromisoformat(times[0])
+        # Use the same timezone as the forecast data
+        if first_dt.tzinfo:
+            now = datetime.now(tz=first_dt.tzinfo)
+        else:
+            now = datetime.now()
+
+        indices = []
+        for i in range(len(times)):
+            dt = datetime.fromisoformat(times[i])
+
+            # Only include future hours
+            if dt > now:
+                indices.append((i, dt))
+
+                # Stop after collecting enough future hours
+                if len(indices) >= limit:
+                    break
+
+        return indices
+
+    @classmethod
+    def _parse_hourly_tables(
+        cls, data: dict[str, Any]
+    ) -> tuple[ForecastTable, ForecastTable]:
+        """Parse the next 48 and next 6 future hours of a forecast response.
+
+        Both tables share the same columns (the 6-hour table only exposes the
+        first rows under its own field names).
+
+        Args:
+            data: Decoded JSON response
+
+        Returns:
+            Tuple of (48-hour table, 6-hour table)
+        """
+        hourly = data.get("hourly", {})
+        indices = cls._future_hour_indices(hourly, 48)
+        length = len(indices)
+        start = indices[0][0] if indices else 0
+        stop = start + length
+
+        def column(key: str) -> tuple[Any, ...]:
+            return cls._column(hourly, key, start, stop)
+
+        datetimes = tuple(dt for _, dt in indices)  # Keep as datetime for processing
+        temperature = column("temperature_2m")
+        precipitation = column("precipitation")
+        wind_speed = column("wind_speed_10m")
+        wind_gust = column("wind_gusts_10m")
+        cloud_cover = column("cloud_cover")
+
+        hourly_table = ForecastTable(
+            {
+                "datetime": datetimes,
+                "temperature": temperature,
+                "precipitation": precipitation,
+                "precipitation_probability": (None,) * length,  # Not in hourly
+                "condition": tuple(
+                    cls._map_weather_code(code) for code in column("weather_code")
+                ),
+                "wind_speed": wind_speed,
+                "wind_gust_speed": wind_gust,
+                "wind_bearing": column("wind_direction_10m"),
+                "cloud_coverage": cloud_cover,
+            },
+            length,
+        )
+
+        hourly_6h_table = ForecastTable(
+            {
+                "hour": range(1, 7),
+                "datetime": datetimes,
+                "temperature": temperature,
+                "wind_speed": wind_speed,
+                "wind_gust": wind_gust,
+                "cloud_cover": cloud_cover,
+                "snowfall": column("snowfall"),
+                "rain": column("rain"),
+                "precipitation": precipitation,
+            },
+            min(6, length),
+        )
+
+        return hourly_table, hourly_6h_table
+
+    @classmethod
+    def _parse_hourly(cls, data: dict[str, Any]) -> ForecastTable:
+        """Parse the next 48 future hours of a forecast response.
+
+        Args:
+            data: Decoded JSON response
+
+        Returns:
+            Table of hourly forecasts
+        """
+        return cls._parse_hourly_tables(data)[0]
+
+    @classmethod
+    def _parse_hourly_6h(cls, data: dict[str, Any]) -> ForecastTable:
+        """Parse the next 6 future hours of a forecast response.
+
+        Args:
+            data: Decoded JSON response
+
+        Returns:
+            Table of hourly forecasts for next 6 hours
+        """
+        return cls._parse_hourly_tables(data)[1]
+
     @staticmethod
     def _map_weather_code(code: int | None) -> str:
         """Map Open-Meteo weather code to Home Assistant condition.
@@ -386,3 +669,188 @@ class OpenMeteoClient:
             return "partlycloudy"
         else:
             return "cloudy"
+
+
+class OpenMeteoBatchClient:
+    """Client fetching the combined forecast of many locations at once.
+
+    Open-Meteo accepts comma-separated latitude/longitude lists and returns one
+    result per location, so every configured location is refreshed with a
+    handful of requests (chunked by OPENMETEO_BATCH_SIZE) instead of one each.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession | None = None,
+        batch_size: int = OPENMETEO_BATCH_SIZE,
+    ) -> None:
+        """Initialize the batch client.
+
+        Args:
+            session: Shared aiohttp session (a temporary one is used if omitted)
+            batch_size: Maximum number of locations per request
+        """
+        self._session = session
+        self._batch_size = batch_size
+        self._base_url = "https://api.open-meteo.com/v1/forecast"
+
+    async def _async_request(
+        self,
+        locations: Sequence[tuple[float, float]],
+        parse: Callable[[list[dict[str, Any]]], Any],
+    ) -> Any:
+        """Request the combined forecast for a chunk of locations.
+
+        Args:
+            locations: (latitude, longitude) pairs
+            parse: Parser of the decoded results, one per location in request
+                order (see async_read_json)
+
+        Returns:
+            Parsed results
+        """
+
+        def decode(data: Any) -> Any:
+            # A single location is returned as an object rather than a list
+            return parse(data if isinstance(data, list) else [data])
+
+        async with client_session(self._session) as session:
+            async with session.get(
+                self._base_url,
+                params={
+                    "latitude": ",".join(str(lat) for lat, _ in locations),
+                    "longitude": ",".join(str(lon) for _, lon in locations),
+                    **FORECAST_PARAMS,
+                },
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as response:
+                response.raise_for_status()
+                return await async_read_json(response, decode)
+
+    async def async_get_forecasts(
+        self, locations: Sequence[tuple[float, float]]
+    ) -> dict[tuple[float, float], dict[str, Any]]:
+        """Get the combined forecast response of every location.
+
+        Chunks are requested concurrently. A failed chunk only drops its own
+        locations from the result; an error is raised if every chunk fails.
+
+        Args:
+            locations: (latitude, longitude) pairs (duplicates are fetched once)
+
+        Returns:
+            Mapping of (latitude, longitude) to the decoded response, to be
+            parsed with OpenMeteoClient.parse_forecast when it is used (so
+            that the hourly forecast starts from the current hour)
+
+        Raises:
+            OpenMeteoApiError: If no chunk could be fetched
+        """
+        unique = list(dict.fromkeys(locations))
+        chunks = [
+            unique[i : i + self._batch_size]
+            for i in range(0, len(unique), self._batch_size)
+        ]
+
+        results = await asyncio.gather(
+            *(self._async_fetch_chunk(chunk) for chunk in chunks),
+            return_exceptions=True,
+        )
+
+        forecasts: dict[tuple[float, float], dict[str, Any]] = {}
+        errors = []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning(
+                    "Batch forecast request for %d locations failed: %s",
+                    len(chunk),
+                    result,
+                )
+                errors.append(result)
+            else:
+                forecasts.update(result)
+
+        if errors and not forecasts:
+            raise errors[0]
+
+        _LOGGER.debug(
+            "Fetched forecasts for %d/%d locations in %d request(s)",
+            len(forecasts),
+            len(unique),
+            len(chunks),
+        )
+        return forecasts
+
+    async def _async_fetch_chunk(
+        self, chunk: Sequence[tuple[float, float]]
+    ) -> dict[tuple[float, float], dict[str, Any]]:
+        """Fetch one chunk of locations.
+
+        Args:
+            chunk: (latitude, longitude) pairs
+
+        Returns:
+            Mapping of location to decoded response
+        """
+
+        def parse(
+            results: list[dict[str, Any]],
+        ) -> dict[tuple[float, float], dict[str, Any]]:
+            if len(results) != len(chunk):
+                raise OpenMeteoApiError(
+                    f"Expected {len(chunk)} results, got {len(results)}"
+                )
+            return dict(zip(chunk, results))
+
+        try:
+            return await self._async_request(chunk, parse)
+
+        except OpenMeteoApiError:
+            raise
+        except aiohttp.ClientError as err:
+            _LOGGER.error("Network error getting batch forecast: %s", err, exc_info=True)
+            raise OpenMeteoApiError(f"Network error: {err}") from err
+        except Exception as err:
+            _LOGGER.error(
+                "Error getting batch forecast: %s (type: %s)",
+                err,
+                type(err).__name__,
+                exc_info=True,
+            )
+            raise OpenMeteoApiError(f"Failed to get batch forecast: {err}") from err
+
+    async def async_get_model_run(self, model: str = OPENMETEO_RUN_MODEL) -> ModelRun:
+        """Get the latest run of a model available through the API.
+
+        Args:
+            model: Open-Meteo model name
+
+        Returns:
+            Latest model run
+
+        Raises:
+            OpenMeteoApiError: If the metadata cannot be fetched or read
+        """
+        try:
+            async with client_session(self._session) as session:
+                async with session.get(
+                    MODEL_METADATA_URL.format(model=model),
+                    timeout=aiohttp.ClientTimeout(total=10),
+                ) as response:
+                    response.raise_for_status()
+                    meta = await response.json()
+
+            return ModelRun(
+                initialisation=datetime.fromtimestamp(
+                    meta["last_run_initialisation_time"], tz=timezone.utc
+                ),
+                available=datetime.fromtimestamp(
+                    meta["last_run_availability_time"], tz=timezone.utc
+                ),
+                update_interval=timedelta(seconds=meta["update_interval_seconds"]),
+            )
+
+        except aiohttp.ClientError as err:
+            raise OpenMeteoApiError(f"Network error: {err}") from err
+        except (KeyError, TypeError, ValueError) as err:
+            raise OpenMeteoApiError(f"Invalid metadata for {model}: {err}") from err
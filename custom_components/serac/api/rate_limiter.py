@@ -0,0 +1,103 @@
+"""Rate limiting of the requests made with a Météo-France API key."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+
+from ..const import METEOFRANCE_RATE_BURST, METEOFRANCE_RATE_LIMIT
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Token bucket queueing the requests made with one API key.
+
+    Requests take a token each; when the bucket is empty they wait in line
+    until it refills. Priority requests (triggered by the user) are served
+    before background polls, which otherwise go first come, first served.
+    """
+
+    def __init__(
+        self,
+        rate: float = (METEOFRANCE_RATE_LIMIT - METEOFRANCE_RATE_BURST) / 60,
+        capacity: int = METEOFRANCE_RATE_BURST,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (largest burst)
+        """
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._queue: list[list[int]] = []
+        self._counter = itertools.count()
+        self._condition = asyncio.Condition()
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    async def acquire(self, priority: bool = False) -> None:
+        """Wait for a request slot.
+
+        Args:
+            priority: Serve this request before queued background requests
+        """
+        entry = [0 if priority else 1, next(self._counter)]
+        async with self._condition:
+            heapq.heappush(self._queue, entry)
+            try:
+                while True:
+                    self._refill()
+                    if self._queue[0] is not entry:
+                        # Woken up when the request ahead in line is served
+                        await self._condition.wait()
+                        continue
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self._rate
+                    _LOGGER.debug(
+                        "Rate limit reached, %d request(s) queued, next slot in %.1fs",
+                        len(self._queue),
+                        wait,
+                    )
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), wait)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+                self._condition.notify_all()
+
+
+_LIMITERS: dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(api_key: str) -> RateLimiter:
+    """Return the rate limiter of an API key, creating it if needed.
+
+    Limiters are shared by every client and config entry, since the portal
+    counts requests per key.
+
+    Args:
+        api_key: Météo-France API key
+
+    Returns:
+        The RateLimiter shared by all requests made with this key
+    """
+    limiter = _LIMITERS.get(api_key)
+    if limiter is None:
+        limiter = _LIMITERS[api_key] = RateLimiter()
+    return limiter
@@ -0,0 +1,129 @@
+"""Shared HTTP session handling for Serac API clients."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+import json
+import logging
+import time
+from typing import Any, TypeVar
+
+import aiohttp
+
+from ..const import PARSE_EXECUTOR_MIN_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+_PayloadT = TypeVar("_PayloadT")
+_ResultT = TypeVar("_ResultT")
+
+
+@asynccontextmanager
+async def client_session(
+    session: aiohttp.ClientSession | None,
+) -> AsyncIterator[aiohttp.ClientSession]:
+    """Yield the injected session, or a short-lived one if none was provided.
+
+    Inside Home Assistant the clients receive the shared pooled session from
+    async_get_clientsession, which keeps connections alive across calls. The
+    fallback keeps the clients usable from standalone scripts.
+
+    Args:
+        session: Injected aiohttp session, or None
+
+    Yields:
+        An open aiohttp session
+    """
+    if session is not None:
+        yield session
+        return
+
+    async with aiohttp.ClientSession() as owned_session:
+        yield owned_session
+
+
+def response_error(response: aiohttp.ClientResponse) -> aiohttp.ClientResponseError:
+    """Build the aiohttp error of an unsuccessful response.
+
+    Clients that read the error body before raising their own exception
+    chain it from this error, so callers can still see the status and
+    headers (e.g. Retry-After).
+
+    Args:
+        response: Unsuccessful response
+
+    Returns:
+        The error raise_for_status would have raised
+    """
+    return aiohttp.ClientResponseError(
+        response.request_info,
+        response.history,
+        status=response.status,
+        message=response.reason or "",
+        headers=response.headers,
+    )
+
+
+async def async_parse(
+    parse: Callable[[_PayloadT], _ResultT],
+    payload: _PayloadT,
+    size: int,
+    description: str,
+) -> _ResultT:
+    """Parse a response body, in the executor if it is large.
+
+    Bodies of PARSE_EXECUTOR_MIN_SIZE or more are parsed in the executor, so
+    the parser must not touch shared state. The parse time is logged.
+
+    Args:
+        parse: Function turning the body into the result
+        payload: Response body
+        size: Size of the body (bytes or characters)
+        description: What is parsed (for logging)
+
+    Returns:
+        The parse result
+    """
+    start = time.perf_counter()
+    if size < PARSE_EXECUTOR_MIN_SIZE:
+        result = parse(payload)
+        where = "inline"
+    else:
+        result = await asyncio.get_running_loop().run_in_executor(
+            None, parse, payload
+        )
+        where = "in executor"
+    _LOGGER.debug(
+        "Parsed %s (size %d) %s in %.1f ms",
+        description,
+        size,
+        where,
+        (time.perf_counter() - start) * 1000,
+    )
+    return result
+
+
+async def async_read_json(
+    response: aiohttp.ClientResponse,
+    parse: Callable[[Any], _ResultT] | None = None,
+) -> Any:
+    """Read and decode a JSON response, then optionally parse it.
+
+    Decoding and parsing run together, in the executor for large bodies (see
+    async_parse).
+
+    Args:
+        response: Successful response
+        parse: Function turning the decoded JSON into the result
+
+    Returns:
+        The parse result, or the decoded JSON if parse is None
+    """
+    body = await response.read()
+
+    def decode(body: bytes) -> Any:
+        data = json.loads(body)
+        return parse(data) if parse is not None else data
+
+    return await async_parse(decode, body, len(body), f"JSON from {response.url.path}")
@@ -1,15 +1,27 @@
 """Météo-France Vigilance API client for weather alerts."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from typing import Any
 
 import aiohttp
 
-from ..const import DEPARTMENT_BOUNDARIES, VIGILANCE_COLOR_CODES, VIGILANCE_PHENOMENA
+from ..const import (
+    DEPARTMENT_BOUNDARIES,
+    VIGILANCE_COLOR_CODES,
+    VIGILANCE_FEED_MAX_AGE,
+    VIGILANCE_PHENOMENA,
+)
+from .departments import find_department
+from .rate_limiter import get_rate_limiter
+from .session import async_read_json, client_session
 
 _LOGGER = logging.getLogger(__name__)
 
+VIGILANCE_BASE_URL = "https://public-api.meteofrance.fr/public/DPVigilance/v1"
+
 
 class VigilanceApiError(Exception):
     """Exception raised for Vigilance API errors."""
@@ -19,7 +31,11 @@ class VigilanceClient:
     """Client for Météo-France Vigilance API."""
 
     def __init__(
-        self, api_token: str, latitude: float, longitude: float
+        self,
+        api_token: str,
+        latitude: float,
+        longitude: float,
+        session: aiohttp.ClientSession | None = None,
     ) -> None:
         """Initialize the Vigilance client.
 
@@ -27,11 +43,12 @@ class VigilanceClient:
             api_token: Météo-France Vigilance API token
             latitude: Location latitude
             longitude: Location longitude
+            session: Shared aiohttp session (a temporary one is used if omitted)
         """
         self._api_token = api_token
         self._latitude = latitude
         self._longitude = longitude
-        self._base_url = "https://public-api.meteofrance.fr/public/DPVigilance/v1"
+        self._session = session
         self._department = self._get_department_code(latitude, longitude)
 
     def _get_department_code(self, lat: float, lon: float) -> str | None:
@@ -44,20 +61,16 @@ class VigilanceClient:
         Returns:
             Two-digit department code (e.g., "74" for Haute-Savoie) or None if not found
         """
-        # Check all department boundaries
-        for dept_code, dept_info in DEPARTMENT_BOUNDARIES.items():
-            bounds = dept_info["bounds"]
-            min_lat, max_lat, min_lon, max_lon = bounds
-
-            if min_lat <= lat <= max_lat and min_lon <= lon <= max_lon:
-                _LOGGER.debug(
-                    "Coordinates (%.4f, %.4f) matched department %s (%s)",
-                    lat,
-                    lon,
-                    dept_code,
-                    dept_info["name"],
-                )
-                return dept_code
+        dept_code = find_department(lat, lon)
+        if dept_code:
+            _LOGGER.debug(
+                "Coordinates (%.4f, %.4f) matched department %s (%s)",
+                lat,
+                lon,
+                dept_code,
+                DEPARTMENT_BOUNDARIES[dept_code]["name"],
+            )
+            return dept_code
 
         # No match found
         _LOGGER.warning(
@@ -96,65 +109,50 @@ class VigilanceClient:
             }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {"apikey": self._api_token}
-                url = f"{self._base_url}/cartevigilance/encours"
+            feed = get_vigilance_feed(self._api_token, self._session)
+            index, update_time = await feed.async_get_index()
 
-                _LOGGER.debug(
-                    "Fetching vigilance data for department %s from %s",
+            department_data = index.get(self._department)
+
+            if not department_data:
+                _LOGGER.warning(
+                    "No vigilance data found for department %s in API response",
                     self._department,
-                    url,
                 )
+                _LOGGER.debug(
+                    "Available domains: %s",
+                    list(index)[:10],  # Show first 10
+                )
+                return {
+                    "has_data": False,
+                    "department": self._department,
+                    "error": "no_data",
+                }
 
-                async with session.get(
-                    url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-
-                    _LOGGER.debug(
-                        "Vigilance API response received for department %s",
-                        self._department,
-                    )
-
-                    # Extract data for our department
-                    department_data = self._extract_department_data(data)
-
-                    if not department_data:
-                        _LOGGER.warning(
-                            "No vigilance data found for department %s in API response",
-                            self._department,
-                        )
-                        return {
-                            "has_data": False,
-                            "department": self._department,
-                            "error": "no_data",
-                        }
-
-                    result = {
-                        "has_data": True,
-                        "department": self._department,
-                        "department_name": DEPARTMENT_BOUNDARIES.get(
-                            self._department, {}
-                        ).get("name", "Unknown"),
-                        "overall_level": department_data.get("overall_level", 1),
-                        "overall_color": VIGILANCE_COLOR_CODES.get(
-                            department_data.get("overall_level", 1), "green"
-                        ),
-                        "phenomena": department_data.get("phenomena", {}),
-                        "update_time": data.get("update_time"),
-                    }
+            result = {
+                "has_data": True,
+                "department": self._department,
+                "department_name": DEPARTMENT_BOUNDARIES.get(
+                    self._department, {}
+                ).get("name", "Unknown"),
+                "overall_level": department_data.get("overall_level", 1),
+                "overall_color": VIGILANCE_COLOR_CODES.get(
+                    department_data.get("overall_level", 1), "green"
+                ),
+                "phenomena": dict(department_data.get("phenomena", {})),
+                "update_time": update_time,
+            }
 
-                    _LOGGER.info(
-                        "Vigilance data for %s (%s): level %d (%s), %d phenomena",
-                        self._department,
-                        result["department_name"],
-                        result["overall_level"],
-                        result["overall_color"],
-                        len(result["phenomena"]),
-                    )
+            _LOGGER.info(
+                "Vigilance data for %s (%s): level %d (%s), %d phenomena",
+                self._department,
+                result["department_name"],
+                result["overall_level"],
+                result["overall_color"],
+                len(result["phenomena"]),
+            )
 
-                    return result
+            return result
 
         except aiohttp.ClientResponseError as err:
             if err.status == 404:
@@ -197,90 +195,75 @@ class VigilanceClient:
             )
             raise VigilanceApiError(f"Failed to get vigilance: {err}") from err
 
-    def _extract_department_data(self, data: dict) -> dict | None:
-        """Extract vigilance data for specific department from API response.
-
-        Args:
-            data: Full API response from Vigilance API
 
-        Returns:
-            Department-specific vigilance data or None if not found
-        """
-        # Real API structure (based on actual response):
-        # {
-        #   "product": {
-        #     "periods": [
-        #       {
-        #         "echeance": "J",
-        #         "timelaps": {
-        #           "domain_ids": [
-        #             {
-        #               "domain_id": "74",
-        #               "max_color_id": 3,
-        #               "phenomenon_items": [
-        #                 {
-        #                   "phenomenon_id": "8",
-        #                   "phenomenon_max_color_id": 3,
-        #                   ...
-        #                 }
-        #               ]
-        #             }
-        #           ]
-        #         }
-        #       }
-        #     ]
-        #   }
-        # }
+def build_department_index(data: dict) -> dict[str, dict[str, Any]]:
+    """Index the current period of a national Vigilance map by department.
+
+    Args:
+        data: Full API response from Vigilance API
+
+    Returns:
+        Mapping of domain_id (department code) to
+        {"overall_level": int, "phenomena": {name: {"level", "color"}}}
+    """
+    # Real API structure (based on actual response):
+    # {
+    #   "product": {
+    #     "periods": [
+    #       {
+    #         "echeance": "J",
+    #         "timelaps": {
+    #           "domain_ids": [
+    #             {
+    #               "domain_id": "74",
+    #               "max_color_id": 3,
+    #               "phenomenon_items": [
+    #                 {
+    #                   "phenomenon_id": "8",
+    #                   "phenomenon_max_color_id": 3,
+    #                   ...
+    #                 }
+    #               ]
+    #             }
+    #           ]
+    #         }
+    #       }
+    #     ]
+    #   }
+    # }
+    index: dict[str, dict[str, Any]] = {}
+
+    product = data.get("product", {})
+    periods = product.get("periods", [])
+
+    if not periods:
+        _LOGGER.debug("No periods data in vigilance response")
+        return index
+
+    # Get current period (first one, usually "J" for today)
+    current_period = periods[0]
+    timelaps = current_period.get("timelaps", {})
+    domain_ids = timelaps.get("domain_ids", [])
+
+    if not domain_ids:
+        _LOGGER.debug("No domain_ids in current period")
+        return index
+
+    for domain in domain_ids:
+        domain_id = domain.get("domain_id")
+        if not domain_id:
+            continue
 
         try:
-            # Navigate to department data
-            product = data.get("product", {})
-            periods = product.get("periods", [])
-
-            if not periods:
-                _LOGGER.debug("No periods data in vigilance response")
-                return None
-
-            # Get current period (first one, usually "J" for today)
-            current_period = periods[0]
-            timelaps = current_period.get("timelaps", {})
-            domain_ids = timelaps.get("domain_ids", [])
-
-            if not domain_ids:
-                _LOGGER.debug("No domain_ids in current period")
-                return None
-
-            # Find our department in the domain_ids list
-            dept_data = None
-            for domain in domain_ids:
-                if domain.get("domain_id") == self._department:
-                    dept_data = domain
-                    break
-
-            if not dept_data:
-                _LOGGER.debug(
-                    "Department %s not found in domain_ids. Available domains: %s",
-                    self._department,
-                    [d.get("domain_id") for d in domain_ids[:10]],  # Show first 10
-                )
-                return None
-
-            # Extract overall level (max_color_id: 1=green, 2=yellow, 3=orange, 4=red)
-            overall_level = dept_data.get("max_color_id", 1)
-
             # Extract individual phenomena
             phenomena = {}
-            phenomenon_items = dept_data.get("phenomenon_items", [])
-
-            for phenom_item in phenomenon_items:
+            for phenom_item in domain.get("phenomenon_items", []):
                 # Get phenomenon ID as string, then convert to int
                 phenom_id_str = phenom_item.get("phenomenon_id")
                 if not phenom_id_str:
                     continue
 
-                phenom_id_int = int(phenom_id_str)
-                phenom_name = VIGILANCE_PHENOMENA.get(phenom_id_int)
-
+                phenom_name = VIGILANCE_PHENOMENA.get(int(phenom_id_str))
                 if phenom_name:
                     # Use phenomenon_max_color_id as the alert level
                     phenom_level = phenom_item.get("phenomenon_max_color_id", 1)
@@ -288,24 +271,147 @@ class VigilanceClient:
                         "level": phenom_level,
                         "color": VIGILANCE_COLOR_CODES.get(phenom_level, "green"),
                     }
-
-            _LOGGER.debug(
-                "Extracted vigilance for dept %s: level=%d, phenomena=%s",
-                self._department,
-                overall_level,
-                list(phenomena.keys()),
-            )
-
-            return {
-                "overall_level": overall_level,
-                "phenomena": phenomena,
-            }
-
         except (KeyError, ValueError, TypeError) as err:
             _LOGGER.error(
                 "Error parsing vigilance data for department %s: %s",
-                self._department,
+                domain_id,
                 err,
                 exc_info=True,
             )
-            return None
+            continue
+
+        # Overall level (max_color_id: 1=green, 2=yellow, 3=orange, 4=red)
+        index[domain_id] = {
+            "overall_level": domain.get("max_color_id", 1),
+            "phenomena": phenomena,
+        }
+
+    _LOGGER.debug("Indexed vigilance data for %d domains", len(index))
+    return index
+
+
+def _index_national_map(
+    data: dict[str, Any],
+) -> tuple[dict[str, dict[str, Any]], str | None]:
+    """Index a decoded national map (see async_read_json).
+
+    Args:
+        data: Decoded cartevigilance/encours response
+
+    Returns:
+        Tuple of (domain_id index, API update_time)
+    """
+    return build_department_index(data), data.get("update_time")
+
+
+class VigilanceFeed:
+    """National Vigilance map shared by every client using the same API token.
+
+    The ``cartevigilance/encours`` document covers all of France, so it is
+    downloaded once per ``VIGILANCE_FEED_MAX_AGE`` window and every config
+    entry reads its department from the pre-built index.
+    """
+
+    def __init__(
+        self,
+        api_token: str,
+        session: aiohttp.ClientSession | None = None,
+    ) -> None:
+        """Initialize the feed.
+
+        Args:
+            api_token: Météo-France Vigilance API token
+            session: Shared aiohttp session (a temporary one is used if omitted)
+        """
+        self._api_token = api_token
+        self._session = session
+        self._url = f"{VIGILANCE_BASE_URL}/cartevigilance/encours"
+        self._lock = asyncio.Lock()
+        self._index: dict[str, dict[str, Any]] | None = None
+        self._update_time: str | None = None
+        self._fetched_at = 0.0
+        self._priority = False
+
+    @property
+    def is_fresh(self) -> bool:
+        """Return True if the cached map is still within its sharing window."""
+        return (
+            self._index is not None
+            and time.monotonic() - self._fetched_at
+            < VIGILANCE_FEED_MAX_AGE.total_seconds()
+        )
+
+    def invalidate(self) -> None:
+        """Force the next request to download a new national map.
+
+        The download was asked for by the user, so it goes ahead of the
+        background requests queued for the same API key.
+        """
+        self._index = None
+        self._priority = True
+
+    async def async_get_index(self) -> tuple[dict[str, dict[str, Any]], str | None]:
+        """Return the department index and publication time of the national map.
+
+        Concurrent callers wait on the same download instead of starting their own.
+
+        Returns:
+            Tuple of (domain_id index, API update_time)
+
+        Raises:
+            aiohttp.ClientError: If the download fails (nothing is cached then)
+        """
+        async with self._lock:
+            if not self.is_fresh:
+                self._index, self._update_time = await self._async_download()
+                self._priority = False
+                self._fetched_at = time.monotonic()
+
+            return self._index, self._update_time
+
+    async def _async_download(
+        self,
+    ) -> tuple[dict[str, dict[str, Any]], str | None]:
+        """Download and index the national vigilance map.
+
+        Returns:
+            Tuple of (domain_id index, API update_time)
+        """
+        await get_rate_limiter(self._api_token).acquire(priority=self._priority)
+        async with client_session(self._session) as session:
+            _LOGGER.debug("Fetching national vigilance map from %s", self._url)
+
+            async with session.get(
+                self._url,
+                headers={"apikey": self._api_token},
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as response:
+                response.raise_for_status()
+                return await async_read_json(response, _index_national_map)
+
+
+_FEEDS: dict[str, VigilanceFeed] = {}
+
+
+def get_vigilance_feed(
+    api_token: str, session: aiohttp.ClientSession | None = None
+) -> VigilanceFeed:
+    """Return the shared Vigilance feed for an API token, creating it if needed.
+
+    Args:
+        api_token: Météo-France Vigilance API token
+        session: Shared aiohttp session used when the feed is created
+
+    Returns:
+        The VigilanceFeed shared by all clients using this token
+    """
+    feed = _FEEDS.get(api_token)
+    if feed is None:
+        feed = _FEEDS[api_token] = VigilanceFeed(api_token, session)
+    return feed
+
+
+def invalidate_vigilance_feeds() -> None:
+    """Drop every cached national map (used by the manual update service)."""
+    for feed in _FEEDS.values():
+        feed.invalidate()
@@ -19,13 +19,23 @@ from .const import (
     ATTRIBUTION,
     CONF_ENTITY_PREFIX,
     CONF_LOCATION_NAME,
+    CONF_SENSOR_GROUPS,
+    DEFAULT_SENSOR_GROUPS,
     DOMAIN,
     MANUFACTURER,
+    SENSOR_GROUP_VIGILANCE,
 )
-from .utils import sanitize_entity_id_part
+from .utils import async_remove_disabled_entities, sanitize_entity_id_part
 
 _LOGGER = logging.getLogger(__name__)
 
+# Vigilance binary sensors: any alert above green, orange or above, red
+VIGILANCE_BINARY_SENSOR_TYPES: tuple[str, ...] = (
+    "has_active_alert",
+    "has_orange_alert",
+    "has_red_alert",
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -38,6 +48,17 @@ async def async_setup_entry(
     latitude = entry.data[CONF_LATITUDE]
     longitude = entry.data[CONF_LONGITUDE]
 
+    if SENSOR_GROUP_VIGILANCE not in entry.data.get(CONF_SENSOR_GROUPS, DEFAULT_SENSOR_GROUPS):
+        async_remove_disabled_entities(
+            hass,
+            entry,
+            "binary_sensor",
+            {
+                f"serac_{latitude}_{longitude}_{sensor_type}"
+                for sensor_type in VIGILANCE_BINARY_SENSOR_TYPES
+            },
+        )
+
     entities = []
 
     # Add vigilance binary sensors if coordinator exists
@@ -79,7 +100,7 @@ async def async_setup_entry(
             "mdi:alert-octagon",
         ))
 
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 class VigilanceAlertBinarySensor(CoordinatorEntity, BinarySensorEntity):
@@ -216,6 +237,7 @@ class VigilanceAlertBinarySensor(CoordinatorEntity, BinarySensorEntity):
             attrs["active_alerts"] = active_alerts
             attrs["alert_count"] = len(active_alerts)
 
+        attrs.update(self.coordinator.stale_attributes)
         return attrs
 
     @property
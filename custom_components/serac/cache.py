@@ -0,0 +1,151 @@
+"""Persistent cache of API responses for the Serac integration."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import CACHE_MAX_AGE, CACHE_SAVE_DELAY, CACHE_VERSION, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _CacheStore(Store[dict[str, Any]]):
+    """Store that drops cached responses written by another cache version."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Discard the old cache (responses can simply be downloaded again)."""
+        _LOGGER.debug(
+            "Discarding response cache from version %d.%d",
+            old_major_version,
+            old_minor_version,
+        )
+        return {}
+
+
+class ResponseCache:
+    """On-disk cache of API responses shared by every config entry.
+
+    Entries are keyed by source and location/massif/department (see the
+    *_key helpers) and stored with the time they were fetched, so each
+    caller decides how old a response it accepts: coordinators use their
+    update interval on the first refresh after a restart or reload, while
+    fast start accepts any age. Entries older than CACHE_MAX_AGE are
+    dropped on load.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache.
+
+        Args:
+            hass: Home Assistant instance
+        """
+        self._store = _CacheStore(hass, CACHE_VERSION, f"{DOMAIN}.cache")
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        """Load the cache from disk (only the first call reads the file)."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            stored = await self._store.async_load() or {}
+            now = time.time()
+            self._entries = {
+                key: entry
+                for key, entry in stored.get("entries", {}).items()
+                if now - entry.get("fetched_at", 0) < CACHE_MAX_AGE.total_seconds()
+            }
+            self._loaded = True
+            _LOGGER.debug("Loaded %d cached API responses", len(self._entries))
+
+    def get(self, key: str, max_age: timedelta | None = None) -> Any | None:
+        """Return a cached response.
+
+        Args:
+            key: Cache key
+            max_age: Oldest acceptable response (None accepts any age)
+
+        Returns:
+            Cached data, or None if missing or too old
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if max_age is not None and time.time() - entry["fetched_at"] > max_age.total_seconds():
+            return None
+        return entry["data"]
+
+    def fetched_at(self, key: str) -> datetime | None:
+        """Return when a cached response was fetched.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Fetch time (UTC), or None if the response is not cached
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return dt_util.utc_from_timestamp(entry["fetched_at"])
+
+    @callback
+    def async_set(
+        self, key: str, data: Any, fetched_at: datetime | None = None
+    ) -> None:
+        """Cache a response (written to disk after CACHE_SAVE_DELAY).
+
+        Args:
+            key: Cache key
+            data: JSON-serializable response
+            fetched_at: When the response was fetched, if earlier than now
+                (e.g. a shared response reused since)
+        """
+        self._entries[key] = {
+            "fetched_at": fetched_at.timestamp() if fetched_at else time.time(),
+            "data": data,
+        }
+        self._store.async_delay_save(self._data_to_save, CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to write to disk."""
+        return {"entries": self._entries}
+
+
+def location_key(source: str, latitude: float, longitude: float) -> str:
+    """Return the cache key of a per-location response.
+
+    Args:
+        source: Response source (e.g. "openmeteo", "airquality")
+        latitude: Location latitude
+        longitude: Location longitude
+
+    Returns:
+        Cache key
+    """
+    return f"{source}:{latitude:.4f},{longitude:.4f}"
+
+
+def bra_key(massif_id: int) -> str:
+    """Return the cache key of a massif's BRA bulletin.
+
+    The entry holds the parsed bulletin and the validators it was downloaded
+    with: {"bulletin": ..., "validators": BraClient.validators}.
+    """
+    return f"bra:{massif_id}"
+
+
+def vigilance_key(department: str) -> str:
+    """Return the cache key of a department's Vigilance alerts."""
+    return f"vigilance:{department}"
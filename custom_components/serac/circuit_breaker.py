@@ -0,0 +1,126 @@
+"""Circuit breakers for the upstream APIs used by the Serac integration."""
+from __future__ import annotations
+
+import logging
+import time
+
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .const import CIRCUIT_BREAKER_COOLDOWN, CIRCUIT_BREAKER_THRESHOLD
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CircuitOpenError(UpdateFailed):
+    """Raised instead of calling an upstream API whose circuit is open."""
+
+
+class CircuitBreaker:
+    """Make calls to an upstream API fail fast while it is down.
+
+    The circuit opens after CIRCUIT_BREAKER_THRESHOLD consecutive failed
+    calls (each after its retries), or as soon as the upstream answers with a Retry-After header.
+    While it is open, before_call raises CircuitOpenError. Once the cool-down
+    is over a single call is let through as a probe (others keep failing
+    fast): its success closes the circuit, its failure reopens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        threshold: int = CIRCUIT_BREAKER_THRESHOLD,
+        cooldown: float = CIRCUIT_BREAKER_COOLDOWN.total_seconds(),
+    ) -> None:
+        """Initialize the circuit breaker.
+
+        Args:
+            name: Upstream API name (for logging)
+            threshold: Consecutive failed calls that open the circuit
+            cooldown: Seconds the circuit stays open
+        """
+        self.name = name
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._failures = 0
+        self._open_until: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while calls fail fast."""
+        return self._open_until is not None and self._open_until > time.monotonic()
+
+    def before_call(self) -> None:
+        """Check that the upstream may be called.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        if self._open_until is None:
+            return
+
+        now = time.monotonic()
+        if self._open_until > now:
+            raise CircuitOpenError(
+                f"{self.name} is unavailable, requests paused for "
+                f"{self._open_until - now:.0f}s"
+            )
+
+        # Cool-down over: this call is the probe. Keep failing other calls
+        # fast until it succeeds (if it never reports back, e.g. because it
+        # was cancelled, the next probe goes out after another cool-down).
+        _LOGGER.debug("Probing %s after cool-down", self.name)
+        self._open_until = now + self._cooldown
+
+    def reset(self) -> None:
+        """Close the circuit and forget past failures."""
+        self._failures = 0
+        self._open_until = None
+
+    def record_success(self) -> None:
+        """Close the circuit after a call reached the upstream."""
+        if self._open_until is not None:
+            _LOGGER.info("%s is available again", self.name)
+        self.reset()
+
+    def record_failure(self, retry_after: float | None = None) -> None:
+        """Count a failed call, opening the circuit if needed.
+
+        Args:
+            retry_after: Seconds the upstream asked us to wait (Retry-After)
+        """
+        self._failures += 1
+        duration = retry_after or 0.0
+        if self._failures >= self._threshold:
+            duration = max(duration, self._cooldown)
+        if duration <= 0:
+            return
+
+        if self._open_until is None:
+            _LOGGER.warning(
+                "%s unavailable after %d failed call(s), pausing requests for %.0fs",
+                self.name,
+                self._failures,
+                duration,
+            )
+        self._open_until = max(self._open_until or 0.0, time.monotonic() + duration)
+
+
+_BREAKERS: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(upstream: str) -> CircuitBreaker:
+    """Return the circuit breaker of an upstream API, creating it if needed.
+
+    Breakers are shared by every config entry, so one upstream outage is
+    detected once rather than by each location separately.
+
+    Args:
+        upstream: Upstream API name (one of the UPSTREAM_* constants)
+
+    Returns:
+        The upstream's circuit breaker
+    """
+    breaker = _BREAKERS.get(upstream)
+    if breaker is None:
+        breaker = _BREAKERS[upstream] = CircuitBreaker(upstream)
+    return breaker
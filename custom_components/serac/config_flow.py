@@ -10,18 +10,26 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 
 from .api.openmeteo_client import OpenMeteoClient, OpenMeteoApiError
 from .const import (
     CONF_BRA_TOKEN,
+    CONF_COMPACT_ATTRIBUTES,
     CONF_ENTITY_PREFIX,
+    CONF_FAST_START,
     CONF_LOCATION_NAME,
     CONF_MASSIF_IDS,
+    CONF_SENSOR_GROUPS,
     CONF_VIGILANCE_TOKEN,
+    DEFAULT_COMPACT_ATTRIBUTES,
+    DEFAULT_FAST_START,
+    DEFAULT_SENSOR_GROUPS,
     DOMAIN,
     MASSIF_IDS,
     MASSIFS,
+    SENSOR_GROUPS,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -140,7 +148,11 @@ class SeracConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     )
 
                     # Initialize Open-Meteo client (no authentication needed)
-                    client = OpenMeteoClient(latitude=latitude, longitude=longitude)
+                    client = OpenMeteoClient(
+                        latitude=latitude,
+                        longitude=longitude,
+                        session=async_get_clientsession(self.hass),
+                    )
                     _LOGGER.debug("OpenMeteoClient initialized successfully")
 
                     # Test coordinates by fetching current weather
@@ -313,20 +325,32 @@ class SeracOptionsFlow(config_entries.OptionsFlow):
                 # User cleared token or didn't provide one, remove it
                 new_data.pop(CONF_VIGILANCE_TOKEN, None)
 
-            # Update config entry
+            new_data[CONF_FAST_START] = user_input.get(CONF_FAST_START, DEFAULT_FAST_START)
+            new_data[CONF_COMPACT_ATTRIBUTES] = user_input.get(
+                CONF_COMPACT_ATTRIBUTES, DEFAULT_COMPACT_ATTRIBUTES
+            )
+            new_data[CONF_SENSOR_GROUPS] = user_input.get(
+                CONF_SENSOR_GROUPS, DEFAULT_SENSOR_GROUPS
+            )
+
+            # Update config entry (its update listener applies the changes)
             self.hass.config_entries.async_update_entry(
                 self.config_entry, data=new_data
             )
 
-            # Reload the integration to apply changes
-            await self.hass.config_entries.async_reload(self.config_entry.entry_id)
-
             return self.async_create_entry(title="", data={})
 
         # Get current values
         current_massifs = self.config_entry.data.get(CONF_MASSIF_IDS, [])
         current_bra_token = self.config_entry.data.get(CONF_BRA_TOKEN, "")
         current_vigilance_token = self.config_entry.data.get(CONF_VIGILANCE_TOKEN, "")
+        current_fast_start = self.config_entry.data.get(CONF_FAST_START, DEFAULT_FAST_START)
+        current_compact_attributes = self.config_entry.data.get(
+            CONF_COMPACT_ATTRIBUTES, DEFAULT_COMPACT_ATTRIBUTES
+        )
+        current_sensor_groups = self.config_entry.data.get(
+            CONF_SENSOR_GROUPS, DEFAULT_SENSOR_GROUPS
+        )
 
         # Create massif options for multi-select
         massif_options = {str(num_id): name for num_id, (name, _) in MASSIF_IDS.items()}
@@ -335,6 +359,9 @@ class SeracOptionsFlow(config_entries.OptionsFlow):
             vol.Optional(CONF_BRA_TOKEN, default=current_bra_token): str,
             vol.Optional(CONF_MASSIF_IDS, default=current_massifs): cv.multi_select(massif_options),
             vol.Optional(CONF_VIGILANCE_TOKEN, default=current_vigilance_token): str,
+            vol.Optional(CONF_FAST_START, default=current_fast_start): bool,
+            vol.Optional(CONF_COMPACT_ATTRIBUTES, default=current_compact_attributes): bool,
+            vol.Optional(CONF_SENSOR_GROUPS, default=current_sensor_groups): cv.multi_select(SENSOR_GROUPS),
         })
 
         return self.async_show_form(
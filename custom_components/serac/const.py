@@ -1,5 +1,5 @@
 """Constants for the Serac integration."""
-from datetime import timedelta
+from datetime import time, timedelta
 from typing import Final
 
 # Integration domain
@@ -17,17 +17,135 @@ CONF_ENTITY_PREFIX: Final = "entity_prefix"
 CONF_MASSIF_ID: Final = "massif_id"
 CONF_MASSIF_NAME: Final = "massif_name"
 CONF_MASSIF_IDS: Final = "massif_ids"
+CONF_FAST_START: Final = "fast_start"
+CONF_COMPACT_ATTRIBUTES: Final = "compact_attributes"
+CONF_SENSOR_GROUPS: Final = "sensor_groups"
+
+# Sensor groups that can be turned off in the options flow
+SENSOR_GROUP_CURRENT: Final = "current"
+SENSOR_GROUP_DAILY: Final = "daily"
+SENSOR_GROUP_AIR_QUALITY: Final = "air_quality"
+SENSOR_GROUP_AIR_QUALITY_DAILY: Final = "air_quality_daily"
+SENSOR_GROUP_AVALANCHE: Final = "avalanche"
+SENSOR_GROUP_VIGILANCE: Final = "vigilance"
+SENSOR_GROUPS: Final = {
+    SENSOR_GROUP_CURRENT: "Current weather",
+    SENSOR_GROUP_DAILY: "Daily forecast",
+    SENSOR_GROUP_AIR_QUALITY: "Current air quality",
+    SENSOR_GROUP_AIR_QUALITY_DAILY: "Daily air quality forecast",
+    SENSOR_GROUP_AVALANCHE: "Avalanche bulletins (BRA)",
+    SENSOR_GROUP_VIGILANCE: "Weather alerts (Vigilance)",
+}
+
+# Options that can change without reloading the entry: massif changes only
+# add or remove BRA coordinators, fast start only matters at the next startup
+INCREMENTAL_RELOAD_KEYS: Final = frozenset({CONF_MASSIF_IDS, CONF_FAST_START})
+
+# Dispatcher signal (formatted with the entry ID) carrying new BRA coordinators
+SIGNAL_BRA_COORDINATORS_ADDED: Final = f"{DOMAIN}_bra_coordinators_added_{{}}"
 
 # Update intervals
 AROME_UPDATE_INTERVAL: Final = timedelta(hours=1)
 BRA_UPDATE_INTERVAL: Final = timedelta(hours=6)
 VIGILANCE_UPDATE_INTERVAL: Final = timedelta(hours=6)
 
+# Stale-while-revalidate: when an update fails, coordinators keep serving
+# their last good data (entities stay available, flagged with a data_age
+# attribute) while it is younger than the source's stale tolerance. The update
+# is retried after STALE_RETRY_INTERVAL, doubling up to STALE_RETRY_MAX_INTERVAL.
+# AROME data is kept per section (forecast, air quality). Alerts can change
+# at any time, so Vigilance data is only served for VIGILANCE_STALE_MAX_AGE
+# past its scheduled refresh (VIGILANCE_UPDATE_INTERVAL after the fetch).
+STALE_RETRY_INTERVAL: Final = timedelta(minutes=5)
+STALE_RETRY_MAX_INTERVAL: Final = timedelta(hours=1)
+AROME_STALE_MAX_AGE: Final = timedelta(hours=3)
+BRA_STALE_MAX_AGE: Final = timedelta(hours=24)
+VIGILANCE_STALE_MAX_AGE: Final = timedelta(hours=1)
+
+# BRA publication schedule: bulletins are issued daily around 16:00 Paris time.
+# Polling is dense from shortly before until a few hours after that time and
+# otherwise sleeps until the next window (BRA_UPDATE_INTERVAL caps the wait
+# while today's bulletin is still missing).
+BRA_TIMEZONE: Final = "Europe/Paris"
+BRA_PUBLICATION_TIME: Final = time(16, 0)
+BRA_PUBLICATION_LEAD: Final = timedelta(minutes=15)
+BRA_PUBLICATION_WINDOW: Final = timedelta(hours=3)
+BRA_PUBLICATION_POLL_INTERVAL: Final = timedelta(minutes=15)
+
+# Months in which BRA bulletins are normally published (~December to May).
+# Outside of them coordinators start dormant and only probe once a day.
+BRA_SEASON_MONTHS: Final = frozenset({12, 1, 2, 3, 4, 5})
+
 # API Configuration
 API_TIMEOUT: Final = 30
 
+# Météo-France portal quota, shared by every BRA and Vigilance request made
+# with the same API key. Requests queue in a token bucket holding
+# METEOFRANCE_RATE_BURST tokens, refilled so that a full burst plus a minute
+# of refill stays within METEOFRANCE_RATE_LIMIT requests per minute.
+METEOFRANCE_RATE_LIMIT: Final = 50
+METEOFRANCE_RATE_BURST: Final = 10
+
+# Upstream APIs, each with a circuit breaker shared by every config entry
+UPSTREAM_OPENMETEO_FORECAST: Final = "Open-Meteo forecast"
+UPSTREAM_OPENMETEO_AIR_QUALITY: Final = "Open-Meteo air quality"
+UPSTREAM_BRA: Final = "Météo-France DPBRA"
+UPSTREAM_VIGILANCE: Final = "Météo-France DPVigilance"
+
+# Retries: delays are spread by ±RETRY_JITTER so that entries failing together
+# do not retry together. A Retry-After longer than RETRY_AFTER_MAX_WAIT fails
+# the call at once (the circuit stays open until then) instead of sleeping.
+RETRY_JITTER: Final = 0.5
+RETRY_AFTER_MAX_WAIT: Final = timedelta(seconds=30)
+
+# An upstream's circuit opens after this many consecutive failed calls (each
+# counted once, when its retries run out): calls then fail fast for the
+# cool-down, after which one probe call is let through to decide whether to
+# close it again
+CIRCUIT_BREAKER_THRESHOLD: Final = 5
+CIRCUIT_BREAKER_COOLDOWN: Final = timedelta(minutes=5)
+
+# Startup: BRA/Vigilance first refreshes run concurrently (bounded), and setup
+# stops waiting for them after the deadline (they finish in the background)
+STARTUP_REFRESH_CONCURRENCY: Final = 4
+STARTUP_REFRESH_TIMEOUT: Final = timedelta(seconds=20)
+
+# Maximum number of locations sent in one multi-location Open-Meteo request
+# (keeps the URL short; Open-Meteo still counts one API call per location)
+OPENMETEO_BATCH_SIZE: Final = 50
+
+# Response bodies of at least PARSE_EXECUTOR_MIN_SIZE bytes (characters for
+# XML) are decoded and parsed in the executor rather than on the event loop,
+# so that refreshing many entries at once does not stall it. Smaller ones are
+# parsed inline, where the executor hop would cost more than the parse.
+PARSE_EXECUTOR_MIN_SIZE: Final = 8 * 1024
+
+# How long a downloaded national Vigilance map is shared between config entries
+# (short enough that every 6-hourly refresh still sees a fresh publication)
+VIGILANCE_FEED_MAX_AGE: Final = timedelta(minutes=30)
+
+# Model whose runs drive the forecast refreshes: Open-Meteo's best match in
+# France starts with AROME HD. Forecasts are fetched OPENMETEO_RUN_DELAY after
+# a new run is expected, then every OPENMETEO_RUN_POLL_INTERVAL until it lands.
+OPENMETEO_RUN_MODEL: Final = "meteofrance_arome_france_hd"
+OPENMETEO_RUN_DELAY: Final = timedelta(minutes=10)
+OPENMETEO_RUN_POLL_INTERVAL: Final = timedelta(minutes=15)
+# Longest wait between two run checks, whatever the model's update interval
+OPENMETEO_RUN_MAX_WAIT: Final = timedelta(hours=3)
+
+# On-disk cache of API responses (see cache.py). Bump CACHE_VERSION when the
+# cached data format changes: older caches are then discarded.
+CACHE_VERSION: Final = 2
+CACHE_SAVE_DELAY: Final = 10  # seconds
+CACHE_MAX_AGE: Final = timedelta(days=3)
+
 # Default values
 DEFAULT_NAME: Final = "Serac"
+DEFAULT_FAST_START: Final = False
+DEFAULT_COMPACT_ATTRIBUTES: Final = False
+DEFAULT_SENSOR_GROUPS: Final = list(SENSOR_GROUPS)
+# Later forecast days are created disabled (users can enable them)
+DEFAULT_ENABLED_FORECAST_DAYS: Final = 2
 
 # Attribution
 ATTRIBUTION: Final = "Data from Open-Meteo (Météo-France AROME & ARPEGE models)"
@@ -246,26 +364,181 @@ VIGILANCE_PHENOMENA_NAMES: Final = {
     "fog": "Fog",
 }
 
-# French department boundaries for GPS to department code mapping
-# Format: dept_code -> (name, (min_lat, max_lat, min_lon, max_lon))
+# French department boundaries for GPS to department code mapping.
+# Mountain departments are simplified outlines ("polygon": ring of (lat, lon)
+# vertices, accurate to a few km; neighbours share the same border vertices).
+# Others only give a bounding box ("bounds": (min_lat, max_lat, min_lon,
+# max_lon)). Points in no outline fall back to the bounding boxes, outlines'
+# own boxes included. Outlines follow borders mid-lake and run out to sea.
 DEPARTMENT_BOUNDARIES: Final = {
     # Alps departments
-    "01": {"name": "Ain", "bounds": (45.5, 46.5, 4.7, 5.9)},
-    "04": {"name": "Alpes-de-Haute-Provence", "bounds": (43.7, 44.7, 5.5, 7.0)},
-    "05": {"name": "Hautes-Alpes", "bounds": (44.2, 45.2, 5.5, 7.2)},
-    "06": {"name": "Alpes-Maritimes", "bounds": (43.5, 44.4, 6.6, 7.7)},
-    "26": {"name": "Drôme", "bounds": (44.1, 45.2, 4.7, 5.8)},
-    "38": {"name": "Isère", "bounds": (44.7, 45.9, 5.0, 6.9)},
-    "73": {"name": "Savoie", "bounds": (45.0, 45.8, 5.6, 7.2)},
-    "74": {"name": "Haute-Savoie", "bounds": (45.7, 46.4, 5.8, 7.0)},
+    "01": {
+        "name": "Ain",
+        "polygon": (
+            (46.13, 5.96), (46.18, 5.97), (46.24, 6.05), (46.3, 6.13), (46.4, 6.12),
+            (46.41, 6.06), (46.35, 5.95), (46.27, 5.85), (46.3, 5.7), (46.27, 5.55),
+            (46.4, 5.4), (46.47, 5.3), (46.47, 5.1), (46.43, 4.95), (46.3, 4.85),
+            (46.15, 4.8), (45.95, 4.75), (45.85, 4.85), (45.82, 4.98), (45.78, 5.12),
+            (45.8, 5.22), (45.88, 5.35), (45.83, 5.4), (45.75, 5.47), (45.64, 5.57),
+            (45.61, 5.64), (45.72, 5.73), (45.76, 5.74), (45.81, 5.78), (45.87, 5.8),
+            (45.93, 5.83), (45.96, 5.835), (46.05, 5.83), (46.11, 5.87),
+        ),
+    },
+    "04": {
+        "name": "Alpes-de-Haute-Provence",
+        "polygon": (
+            (44.2, 5.76), (44.19, 5.88), (44.25, 5.93), (44.33, 5.98), (44.4, 6.08),
+            (44.44, 6.15), (44.46, 6.3), (44.48, 6.42), (44.5, 6.55), (44.54, 6.7),
+            (44.6, 6.95), (44.5, 6.88), (44.42, 6.9), (44.36, 6.93), (44.32, 6.81),
+            (44.25, 6.75), (44.15, 6.72), (44.1, 6.74), (44.02, 6.76), (43.95, 6.85),
+            (43.88, 6.8), (43.82, 6.66), (43.75, 6.45), (43.74, 6.3), (43.78, 6.1),
+            (43.72, 5.9), (43.72, 5.76), (43.82, 5.62), (43.93, 5.55), (44.05, 5.5),
+            (44.13, 5.52), (44.2, 5.68),
+        ),
+    },
+    "05": {
+        "name": "Hautes-Alpes",
+        "polygon": (
+            (45.09, 6.26), (45.08, 6.34), (45.06, 6.41), (45.08, 6.47), (45.11, 6.57),
+            (45.1, 6.62), (45.03, 6.68), (44.97, 6.7), (44.93, 6.74), (44.85, 6.88),
+            (44.8, 7.0), (44.72, 7.07), (44.66, 6.98), (44.6, 6.95), (44.54, 6.7),
+            (44.5, 6.55), (44.48, 6.42), (44.46, 6.3), (44.44, 6.15), (44.4, 6.08),
+            (44.33, 5.98), (44.25, 5.93), (44.19, 5.88), (44.2, 5.76), (44.28, 5.6),
+            (44.35, 5.45), (44.42, 5.42), (44.5, 5.5), (44.58, 5.6), (44.64, 5.66),
+            (44.66, 5.76), (44.72, 5.78), (44.76, 5.86), (44.8, 5.98), (44.85, 6.1),
+            (44.86, 6.23), (44.92, 6.36), (44.98, 6.25), (45.04, 6.21),
+        ),
+    },
+    "06": {
+        "name": "Alpes-Maritimes",
+        "polygon": (
+            (44.36, 6.93), (44.35, 6.98), (44.25, 7.05), (44.15, 7.22), (44.13, 7.4),
+            (44.15, 7.55), (44.13, 7.7), (43.98, 7.67), (43.9, 7.55), (43.785, 7.53),
+            (43.75, 7.56), (43.68, 7.42), (43.66, 7.3), (43.6, 7.22), (43.52, 7.16),
+            (43.5, 6.95), (43.49, 6.93), (43.58, 6.89), (43.65, 6.8), (43.74, 6.72),
+            (43.82, 6.66), (43.88, 6.8), (43.95, 6.85), (44.02, 6.76), (44.1, 6.74),
+            (44.15, 6.72), (44.25, 6.75), (44.32, 6.81),
+        ),
+    },
+    "26": {
+        "name": "Drôme",
+        "polygon": (
+            (45.29, 4.81), (45.1, 4.82), (44.93, 4.86), (44.75, 4.78), (44.56, 4.72),
+            (44.38, 4.66), (44.3, 4.66), (44.3, 5.0), (44.22, 5.15), (44.2, 5.35),
+            (44.13, 5.45), (44.13, 5.52), (44.2, 5.68), (44.2, 5.76), (44.28, 5.6),
+            (44.35, 5.45), (44.42, 5.42), (44.5, 5.5), (44.58, 5.6), (44.64, 5.66),
+            (44.66, 5.76), (44.72, 5.78), (44.72, 5.64), (44.8, 5.55), (44.9, 5.49),
+            (45.0, 5.45), (45.07, 5.38), (45.1, 5.25), (45.15, 5.12), (45.22, 4.97),
+        ),
+    },
+    "38": {
+        "name": "Isère",
+        "polygon": (
+            (45.09, 6.26), (45.04, 6.21), (44.98, 6.25), (44.92, 6.36), (44.86, 6.23),
+            (44.85, 6.1), (44.8, 5.98), (44.76, 5.86), (44.72, 5.78), (44.72, 5.64),
+            (44.8, 5.55), (44.9, 5.49), (45.0, 5.45), (45.07, 5.38), (45.1, 5.25),
+            (45.15, 5.12), (45.22, 4.97), (45.29, 4.81), (45.4, 4.76), (45.55, 4.85),
+            (45.62, 4.9), (45.7, 5.0), (45.78, 5.12), (45.8, 5.22), (45.88, 5.35),
+            (45.83, 5.4), (45.75, 5.47), (45.64, 5.57), (45.61, 5.64), (45.54, 5.67),
+            (45.45, 5.72), (45.41, 5.78), (45.4, 5.8), (45.43, 5.88), (45.46, 5.95),
+            (45.47, 6.02), (45.44, 6.07), (45.4, 6.14), (45.37, 6.13), (45.3, 6.1),
+            (45.22, 6.14), (45.15, 6.21),
+        ),
+    },
+    "73": {
+        "name": "Savoie",
+        "polygon": (
+            (45.93, 5.83), (45.87, 5.86), (45.82, 5.93), (45.8, 6.02), (45.76, 6.1),
+            (45.71, 6.2), (45.72, 6.3), (45.74, 6.36), (45.79, 6.41), (45.84, 6.5),
+            (45.82, 6.56), (45.79, 6.62), (45.73, 6.7), (45.77, 6.82), (45.68, 6.89),
+            (45.58, 7.0), (45.48, 7.06), (45.4, 7.17), (45.33, 7.1), (45.25, 7.05),
+            (45.2, 7.07), (45.15, 6.9), (45.13, 6.7), (45.11, 6.57), (45.08, 6.47),
+            (45.06, 6.41), (45.08, 6.34), (45.09, 6.26), (45.15, 6.21), (45.22, 6.14),
+            (45.3, 6.1), (45.37, 6.13), (45.4, 6.14), (45.44, 6.07), (45.47, 6.02),
+            (45.46, 5.95), (45.43, 5.88), (45.4, 5.8), (45.41, 5.78), (45.45, 5.72),
+            (45.54, 5.67), (45.61, 5.64), (45.72, 5.73), (45.76, 5.74), (45.81, 5.78),
+            (45.87, 5.8),
+        ),
+    },
+    "74": {
+        "name": "Haute-Savoie",
+        "polygon": (
+            (46.39, 6.8), (46.43, 6.72), (46.46, 6.59), (46.44, 6.46), (46.4, 6.35),
+            (46.34, 6.27), (46.3, 6.25), (46.25, 6.3), (46.19, 6.22), (46.165, 6.14),
+            (46.155, 6.07), (46.13, 5.96), (46.11, 5.87), (46.05, 5.83), (45.96, 5.835),
+            (45.93, 5.83), (45.87, 5.86), (45.82, 5.93), (45.8, 6.02), (45.76, 6.1),
+            (45.71, 6.2), (45.72, 6.3), (45.74, 6.36), (45.79, 6.41), (45.84, 6.5),
+            (45.82, 6.56), (45.79, 6.62), (45.73, 6.7), (45.77, 6.82), (45.83, 6.865),
+            (45.87, 6.98), (45.92, 7.04), (45.97, 7.02), (46.03, 6.95), (46.07, 6.87),
+            (46.12, 6.8), (46.17, 6.81), (46.24, 6.84), (46.28, 6.87), (46.33, 6.83),
+        ),
+    },
 
     # Pyrenees departments
-    "09": {"name": "Ariège", "bounds": (42.5, 43.3, 0.7, 2.2)},
-    "11": {"name": "Aude", "bounds": (42.6, 43.5, 1.7, 3.2)},
-    "31": {"name": "Haute-Garonne", "bounds": (42.7, 43.9, 0.4, 1.9)},
-    "64": {"name": "Pyrénées-Atlantiques", "bounds": (42.8, 43.6, -1.8, 0.0)},
-    "65": {"name": "Hautes-Pyrénées", "bounds": (42.7, 43.6, -0.5, 0.6)},
-    "66": {"name": "Pyrénées-Orientales", "bounds": (42.3, 43.0, 1.7, 3.2)},
+    "09": {
+        "name": "Ariège",
+        "polygon": (
+            (42.79, 0.92), (42.9, 0.95), (43.0, 0.98), (43.08, 1.02), (43.15, 1.1),
+            (43.2, 1.3), (43.28, 1.45), (43.3, 1.55), (43.27, 1.7), (43.18, 1.72),
+            (43.12, 1.85), (43.08, 1.95), (42.98, 1.95), (42.9, 1.92), (42.8, 1.92),
+            (42.72, 2.02), (42.66, 2.17), (42.65, 2.1), (42.62, 2.0), (42.58, 1.9),
+            (42.56, 1.74), (42.62, 1.72), (42.66, 1.55), (42.64, 1.42), (42.7, 1.3),
+            (42.77, 1.13),
+        ),
+    },
+    "11": {
+        "name": "Aude",
+        "polygon": (
+            (43.45, 2.05), (43.38, 1.9), (43.3, 1.78), (43.27, 1.7), (43.18, 1.72),
+            (43.12, 1.85), (43.08, 1.95), (42.98, 1.95), (42.9, 1.92), (42.8, 1.92),
+            (42.72, 2.02), (42.66, 2.17), (42.72, 2.18), (42.76, 2.25), (42.82, 2.35),
+            (42.83, 2.55), (42.85, 2.7), (42.86, 2.9), (42.83, 3.04), (42.83, 3.1),
+            (43.1, 3.16), (43.21, 3.27), (43.21, 3.24), (43.35, 2.9), (43.32, 2.7),
+            (43.4, 2.5), (43.42, 2.25),
+        ),
+    },
+    "31": {
+        "name": "Haute-Garonne",
+        "polygon": (
+            (43.25, 0.56), (43.45, 0.7), (43.62, 0.9), (43.78, 1.05), (43.92, 1.3),
+            (43.8, 1.6), (43.6, 1.8), (43.45, 2.05), (43.38, 1.9), (43.3, 1.78),
+            (43.27, 1.7), (43.3, 1.55), (43.28, 1.45), (43.2, 1.3), (43.15, 1.1),
+            (43.08, 1.02), (43.0, 0.98), (42.9, 0.95), (42.79, 0.92), (42.83, 0.82),
+            (42.86, 0.72), (42.78, 0.63), (42.7, 0.52), (42.8, 0.46), (42.9, 0.5),
+            (43.0, 0.55), (43.1, 0.53),
+        ),
+    },
+    "64": {
+        "name": "Pyrénées-Atlantiques",
+        "polygon": (
+            (43.4, -1.81), (43.5, -1.6), (43.54, -1.54), (43.53, -1.52), (43.52, -1.25),
+            (43.56, -1.0), (43.58, -0.75), (43.62, -0.45), (43.6, -0.25), (43.6, -0.1),
+            (43.45, -0.05), (43.3, -0.08), (43.18, -0.08), (43.08, -0.14), (43.0, -0.3),
+            (42.9, -0.28), (42.82, -0.31), (42.8, -0.42), (42.85, -0.55), (42.9, -0.75),
+            (42.97, -1.0), (43.05, -1.15), (43.1, -1.3), (43.06, -1.42), (43.28, -1.52),
+            (43.3, -1.62), (43.34, -1.74), (43.36, -1.79),
+        ),
+    },
+    "65": {
+        "name": "Hautes-Pyrénées",
+        "polygon": (
+            (43.6, -0.1), (43.58, 0.02), (43.45, 0.12), (43.35, 0.35), (43.25, 0.56),
+            (43.1, 0.53), (43.0, 0.55), (42.9, 0.5), (42.8, 0.46), (42.7, 0.52),
+            (42.72, 0.4), (42.7, 0.3), (42.67, 0.1), (42.69, -0.02), (42.76, -0.15),
+            (42.82, -0.31), (42.9, -0.28), (43.0, -0.3), (43.08, -0.14), (43.18, -0.08),
+            (43.3, -0.08), (43.45, -0.05),
+        ),
+    },
+    "66": {
+        "name": "Pyrénées-Orientales",
+        "polygon": (
+            (42.56, 1.74), (42.5, 1.72), (42.45, 1.85), (42.43, 1.95), (42.4, 2.05),
+            (42.45, 2.12), (42.37, 2.45), (42.43, 2.7), (42.46, 2.86), (42.43, 3.2),
+            (42.52, 3.16), (42.6, 3.1), (42.83, 3.1), (42.83, 3.04), (42.86, 2.9),
+            (42.85, 2.7), (42.83, 2.55), (42.82, 2.35), (42.76, 2.25), (42.72, 2.18),
+            (42.66, 2.17), (42.65, 2.1), (42.62, 2.0), (42.58, 1.9),
+        ),
+    },
 
     # Corsica
     "2A": {"name": "Corse-du-Sud", "bounds": (41.3, 42.4, 8.5, 9.4)},
@@ -1,27 +1,109 @@
 """Data update coordinators for Serac integration."""
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 import asyncio
-from datetime import timedelta
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
 import logging
+import random
 import time
 from typing import Any, Callable, TypeVar
 
 import aiohttp
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api.airquality_client import AirQualityApiError, AirQualityClient
 from .api.bra_client import BraApiError, BraClient
-from .api.openmeteo_client import OpenMeteoApiError, OpenMeteoClient
+from .api.openmeteo_client import (
+    ModelRun,
+    OpenMeteoApiError,
+    OpenMeteoBatchClient,
+    OpenMeteoClient,
+)
 from .api.vigilance_client import VigilanceApiError, VigilanceClient
-from .const import AROME_UPDATE_INTERVAL, BRA_UPDATE_INTERVAL, VIGILANCE_UPDATE_INTERVAL, DOMAIN
+from .cache import ResponseCache, bra_key, location_key, vigilance_key
+from .circuit_breaker import CircuitOpenError, get_circuit_breaker
+from .const import (
+    AROME_STALE_MAX_AGE,
+    AROME_UPDATE_INTERVAL,
+    BRA_PUBLICATION_LEAD,
+    BRA_PUBLICATION_POLL_INTERVAL,
+    BRA_PUBLICATION_TIME,
+    BRA_PUBLICATION_WINDOW,
+    BRA_SEASON_MONTHS,
+    BRA_STALE_MAX_AGE,
+    BRA_TIMEZONE,
+    BRA_UPDATE_INTERVAL,
+    DOMAIN,
+    OPENMETEO_RUN_DELAY,
+    OPENMETEO_RUN_MAX_WAIT,
+    OPENMETEO_RUN_POLL_INTERVAL,
+    RETRY_AFTER_MAX_WAIT,
+    RETRY_JITTER,
+    STALE_RETRY_INTERVAL,
+    STALE_RETRY_MAX_INTERVAL,
+    UPSTREAM_BRA,
+    UPSTREAM_OPENMETEO_AIR_QUALITY,
+    UPSTREAM_OPENMETEO_FORECAST,
+    UPSTREAM_VIGILANCE,
+    VIGILANCE_STALE_MAX_AGE,
+    VIGILANCE_UPDATE_INTERVAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Sections of the AROME data, fetched and kept separately
+SECTION_FORECAST = "forecast"
+SECTION_AIR_QUALITY = "air_quality"
+# Coordinator data keys filled from each section
+SECTION_DATA_KEYS: dict[str, frozenset[str]] = {
+    SECTION_FORECAST: frozenset(
+        {"current", "daily_forecast", "hourly_forecast", "hourly_6h", "elevation"}
+    ),
+    SECTION_AIR_QUALITY: frozenset({"air_quality"}),
+}
+
+
+def _error_chain(err: BaseException) -> Iterator[BaseException]:
+    """Yield an exception and the exceptions it was raised from."""
+    while err is not None:
+        yield err
+        err = err.__cause__
+
+
+def _retry_after(err: aiohttp.ClientResponseError | None) -> float | None:
+    """Return the delay requested by a 429/503 response's Retry-After header.
+
+    Args:
+        err: HTTP error, or None
+
+    Returns:
+        Delay in seconds, or None if the response did not ask for one
+    """
+    if err is None or err.status not in (429, 503) or not err.headers:
+        return None
+    value = err.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        return None
+    return max((retry_at - dt_util.utcnow()).total_seconds(), 0.0)
+
 
 async def async_retry_with_backoff(
     func: Callable[[], Any],
@@ -30,8 +112,17 @@ async def async_retry_with_backoff(
     backoff_factor: float = 2.0,
     retry_on: tuple[type[Exception], ...] = (aiohttp.ClientError, asyncio.TimeoutError),
     context: str = "API call",
+    upstream: str | None = None,
 ) -> T:
-    """Retry an async function with exponential backoff.
+    """Retry an async function with exponential backoff and jitter.
+
+    Errors are matched against retry_on directly or through the errors they
+    were raised from, since the API clients wrap aiohttp errors in their own
+    exceptions. HTTP 401, 403 and 404 responses are not retried. A 429 or 503
+    response's Retry-After header sets the next delay, or fails the call at
+    once if it is longer than RETRY_AFTER_MAX_WAIT. The upstream's circuit
+    breaker counts one failure per call once its retries are exhausted, and
+    retrying stops early if the circuit opens in the meantime.
 
     Args:
         func: Async function to retry
@@ -40,76 +131,303 @@ async def async_retry_with_backoff(
         backoff_factor: Factor to multiply delay by after each retry
         retry_on: Tuple of exception types to retry on
         context: Description of the operation for logging
+        upstream: Upstream API called (one of the UPSTREAM_* constants), whose
+            circuit breaker makes calls fail fast while it is down
 
     Returns:
         Result of the function call
 
     Raises:
+        CircuitOpenError: If the upstream's circuit is open
         Exception: The last exception if all retries fail
     """
+    breaker = get_circuit_breaker(upstream) if upstream else None
     delay = initial_delay
-    last_exception = None
 
     for attempt in range(max_retries + 1):
+        if breaker is not None:
+            breaker.before_call()
         try:
-            return await func()
-        except retry_on as err:
-            last_exception = err
+            result = await func()
+        except Exception as err:
+            chain = list(_error_chain(err))
+            if not any(isinstance(error, retry_on) for error in chain):
+                raise
 
-            if attempt < max_retries:
-                _LOGGER.warning(
-                    "%s failed (attempt %d/%d), retrying in %.1fs: %s",
-                    context,
-                    attempt + 1,
-                    max_retries + 1,
-                    delay,
-                    err,
-                )
-                await asyncio.sleep(delay)
-                delay *= backoff_factor
-            else:
+            http_error = next(
+                (error for error in chain if isinstance(error, aiohttp.ClientResponseError)),
+                None,
+            )
+            # Don't retry on auth errors (401, 403) or not found (404): the
+            # upstream itself is answering
+            if http_error is not None and http_error.status in (401, 403, 404):
+                if breaker is not None:
+                    breaker.record_success()
                 _LOGGER.error(
-                    "%s failed after %d attempts: %s",
+                    "%s failed with auth/not found error (status %d): %s",
                     context,
-                    max_retries + 1,
+                    http_error.status,
                     err,
                 )
-        except (
-            aiohttp.ClientResponseError,
-        ) as err:
-            # Don't retry on auth errors (401, 403) or not found (404)
-            if hasattr(err, "status") and err.status in (401, 403, 404):
-                _LOGGER.error("%s failed with auth/not found error (status %d): %s", context, err.status, err)
                 raise
-            # Retry on other HTTP errors (5xx, etc.)
-            last_exception = err
-            if attempt < max_retries:
-                _LOGGER.warning(
-                    "%s failed with HTTP error %d (attempt %d/%d), retrying in %.1fs: %s",
-                    context,
-                    err.status if hasattr(err, "status") else 0,
-                    attempt + 1,
-                    max_retries + 1,
-                    delay,
-                    err,
+
+            retry_after = _retry_after(http_error)
+            if (
+                attempt == max_retries
+                or (
+                    retry_after is not None
+                    and retry_after > RETRY_AFTER_MAX_WAIT.total_seconds()
                 )
-                await asyncio.sleep(delay)
-                delay *= backoff_factor
-            else:
+                # A failed probe, or the circuit opened by other calls
+                or (breaker is not None and breaker.is_open)
+            ):
+                # The breaker counts failed calls, not attempts
+                if breaker is not None:
+                    breaker.record_failure(retry_after)
                 _LOGGER.error(
-                    "%s failed after %d attempts with HTTP error: %s",
-                    context,
-                    max_retries + 1,
-                    err,
+                    "%s failed after %d attempts: %s", context, attempt + 1, err
                 )
+                raise
+
+            if breaker is not None and retry_after is not None:
+                # Hold the other calls back for as long as the upstream asked
+                breaker.record_failure(retry_after)
+
+            # Spread retries so that callers failing together do not retry
+            # together (never earlier than a requested Retry-After)
+            if retry_after is not None:
+                wait = retry_after * random.uniform(1, 1 + RETRY_JITTER)
+            else:
+                wait = delay * random.uniform(1 - RETRY_JITTER, 1 + RETRY_JITTER)
+            _LOGGER.warning(
+                "%s failed (attempt %d/%d), retrying in %.1fs: %s",
+                context,
+                attempt + 1,
+                max_retries + 1,
+                wait,
+                err,
+            )
+            await asyncio.sleep(wait)
+            delay *= backoff_factor
+        else:
+            if breaker is not None:
+                breaker.record_success()
+            return result
 
-    # If we get here, all retries failed
-    if last_exception:
-        raise last_exception
     raise UpdateFailed(f"{context} failed after {max_retries + 1} attempts")
 
 
-class AromeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+def bra_in_season(now: datetime) -> bool:
+    """Return True if BRA bulletins are normally published at this time of year.
+
+    Args:
+        now: Current time (timezone aware)
+
+    Returns:
+        True during the avalanche bulletin season
+    """
+    return now.astimezone(dt_util.get_time_zone(BRA_TIMEZONE)).month in BRA_SEASON_MONTHS
+
+
+def bra_refresh_interval(
+    now: datetime, bulletin: dict[str, Any] | None
+) -> timedelta:
+    """Return the delay until the next BRA refresh.
+
+    Bulletins are published once a day around BRA_PUBLICATION_TIME (Paris
+    time). Once today's bulletin is in, or when no bulletin is available at
+    all, the next refresh is the start of tomorrow's publication window.
+    Otherwise polling is dense inside the window and capped at
+    BRA_UPDATE_INTERVAL outside of it.
+
+    Args:
+        now: Current time (timezone aware)
+        bulletin: Last parsed bulletin, or None if the last update failed
+
+    Returns:
+        Delay until the next refresh
+    """
+    paris = dt_util.get_time_zone(BRA_TIMEZONE)
+    now = now.astimezone(paris)
+    window_start = (
+        datetime.combine(now.date(), BRA_PUBLICATION_TIME, tzinfo=paris)
+        - BRA_PUBLICATION_LEAD
+    )
+    window_end = window_start + BRA_PUBLICATION_WINDOW
+
+    published_today = False
+    if bulletin and bulletin.get("bulletin_date"):
+        try:
+            bulletin_date = datetime.fromisoformat(bulletin["bulletin_date"])
+        except ValueError:
+            pass
+        else:
+            if bulletin_date.tzinfo is None:
+                bulletin_date = bulletin_date.replace(tzinfo=paris)
+            published_today = bulletin_date.astimezone(paris).date() == now.date()
+
+    if published_today or now >= window_start:
+        next_window = window_start + timedelta(days=1)
+    else:
+        next_window = window_start
+    # Subtract in UTC so DST changes are accounted for
+    until_next_window = dt_util.as_utc(next_window) - dt_util.as_utc(now)
+
+    if published_today or (bulletin is not None and not bulletin.get("has_data")):
+        return until_next_window
+    if window_start <= now < window_end:
+        return BRA_PUBLICATION_POLL_INTERVAL
+    return min(until_next_window, BRA_UPDATE_INTERVAL)
+
+
+def model_run_refresh_interval(now: datetime, model_run: ModelRun) -> timedelta:
+    """Return how long to wait before checking for the next model run.
+
+    The next run is expected one update interval after the latest one became
+    available. The check is scheduled OPENMETEO_RUN_DELAY after that, then
+    repeated every OPENMETEO_RUN_POLL_INTERVAL while the run is late.
+
+    Args:
+        now: Current time (timezone-aware)
+        model_run: Latest model run
+
+    Returns:
+        Delay until the next check
+    """
+    expected = model_run.available + model_run.update_interval + OPENMETEO_RUN_DELAY
+    return min(max(expected - now, OPENMETEO_RUN_POLL_INTERVAL), OPENMETEO_RUN_MAX_WAIT)
+
+
+class StaleTolerantCoordinator(DataUpdateCoordinator[dict[str, Any]], ABC):
+    """Coordinator serving its last good data while updates fail.
+
+    When _async_fetch_data fails, the previous data is kept (and entities stay
+    available) as long as it is younger than stale_max_age. The update is then
+    retried after STALE_RETRY_INTERVAL, doubling up to STALE_RETRY_MAX_INTERVAL,
+    and data_age reports how old the served data is until a retry succeeds.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        *,
+        name: str,
+        update_interval: timedelta,
+        stale_max_age: timedelta,
+        always_update: bool = True,
+    ) -> None:
+        """Initialize the coordinator.
+
+        Args:
+            hass: Home Assistant instance
+            name: Coordinator name
+            update_interval: Normal interval between updates
+            stale_max_age: Oldest data served after a failed update
+            always_update: Notify listeners even if the data did not change
+        """
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=name,
+            update_interval=update_interval,
+            always_update=always_update,
+        )
+        self._normal_update_interval = update_interval
+        self.stale_max_age = stale_max_age
+        # When the served data was fetched, and whether an update failed since
+        self.data_fetched_at: datetime | None = None
+        self.stale = False
+        self._stale_retries = 0
+
+    @property
+    def data_age(self) -> timedelta | None:
+        """Return the age of the data while it is served stale (None otherwise)."""
+        if not self.stale or self.data_fetched_at is None:
+            return None
+        return dt_util.utcnow() - self.data_fetched_at
+
+    @property
+    def stale_attributes(self) -> dict[str, Any]:
+        """Return the entity attributes flagging stale data (data_age in minutes)."""
+        age = self.data_age
+        if age is None:
+            return {}
+        return {"data_age": int(age.total_seconds() // 60)}
+
+    @abstractmethod
+    async def _async_fetch_data(self) -> dict[str, Any]:
+        """Fetch new data.
+
+        Raises:
+            UpdateFailed: If the update fails
+        """
+
+    def _can_serve_stale(self) -> bool:
+        """Return True if the current data may still be served after a failure."""
+        return (
+            self.data is not None
+            and self.data_fetched_at is not None
+            and dt_util.utcnow() - self.data_fetched_at <= self.stale_max_age
+        )
+
+    def _data_fetched_at(self, data: dict[str, Any]) -> datetime:
+        """Return when freshly returned data was fetched (now by default)."""
+        return dt_util.utcnow()
+
+    def _partially_stale(self) -> bool:
+        """Return True if the fetched data still includes parts kept after a failure."""
+        return False
+
+    def _schedule_retry(self) -> None:
+        """Retry sooner than usual, backing off after each failed retry."""
+        self.update_interval = min(
+            STALE_RETRY_INTERVAL * 2**self._stale_retries, STALE_RETRY_MAX_INTERVAL
+        )
+        self._stale_retries += 1
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch new data, or keep serving the current data if it fails.
+
+        Returns:
+            New data, or the current data while it is within its stale tolerance
+
+        Raises:
+            UpdateFailed: If the update fails and there is no data to serve
+        """
+        if self.stale:
+            # Back to the normal schedule, unless this retry fails too
+            self.update_interval = self._normal_update_interval
+        try:
+            data = await self._async_fetch_data()
+        except UpdateFailed as err:
+            if not self._can_serve_stale():
+                self.stale = False
+                self._stale_retries = 0
+                raise
+            self.stale = True
+            self._schedule_retry()
+            _LOGGER.warning(
+                "Update of %s failed, serving data from %s and retrying in %s: %s",
+                self.name,
+                self.data_fetched_at.isoformat(),
+                self.update_interval,
+                err,
+            )
+            if not self.always_update:
+                # Unchanged data would not notify listeners: show data_age
+                self.async_update_listeners()
+            return self.data
+
+        self.data_fetched_at = self._data_fetched_at(data)
+        self.stale = self._partially_stale()
+        if self.stale:
+            self._schedule_retry()
+        else:
+            self._stale_retries = 0
+        return data
+
+
+class AromeCoordinator(StaleTolerantCoordinator):
     """Coordinator for weather data updates."""
 
     def __init__(
@@ -118,6 +436,8 @@ class AromeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         client: OpenMeteoClient,
         location_name: str,
         airquality_client: AirQualityClient | None = None,
+        batch: ForecastBatchCoordinator | None = None,
+        cache: ResponseCache | None = None,
     ) -> None:
         """Initialize the weather coordinator.
 
@@ -126,18 +446,291 @@ class AromeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             client: Open-Meteo API client
             location_name: Name of the location for logging
             airquality_client: Optional Air Quality API client
+            batch: Optional shared coordinator fetching all locations at once
+            cache: Optional on-disk cache of API responses
         """
         super().__init__(
             hass,
-            _LOGGER,
             name=f"{DOMAIN}_{location_name}_arome",
-            update_interval=AROME_UPDATE_INTERVAL,
+            # When batched, refreshes are driven by the batch coordinator and
+            # our own timer is only a fallback if it stops delivering
+            update_interval=(
+                AROME_UPDATE_INTERVAL * 2 if batch else AROME_UPDATE_INTERVAL
+            ),
+            stale_max_age=AROME_STALE_MAX_AGE,
         )
         self.client = client
         self.airquality_client = airquality_client
         self.location_name = location_name
+        self.batch = batch
+        self.cache = cache
+        # True while data comes from the cache rather than a live refresh
+        self.restored = False
+        # Data, status and stale sections listeners were last notified with
+        self._notified_data: dict[str, Any] | None = None
+        self._notified_success = True
+        self._notified_stale: set[str] = set()
+        # Last good value and fetch time of each section, and the sections
+        # whose last fetch failed (retried alone on a short timer)
+        self._sections: dict[str, tuple[dict[str, Any], datetime]] = {}
+        self._failed_sections: set[str] = set()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners whose data changed.
+
+        Entities register with a context naming the data keys they read
+        (e.g. frozenset({"current"})). After a successful refresh, a listener
+        with a context is only called if one of those keys changed; listeners
+        without a context, and all listeners when availability changes, are
+        always called, as are the listeners of sections served stale (so
+        that their data_age stays current).
+        """
+        previous, self._notified_data = self._notified_data, self.data
+        was_successful, self._notified_success = (
+            self._notified_success,
+            self.last_update_success,
+        )
+        was_stale, self._notified_stale = self._notified_stale, self._stale_sections()
+        if (
+            previous is None
+            or self.data is None
+            or not self.last_update_success
+            or not was_successful
+        ):
+            super().async_update_listeners()
+            return
+
+        changed = {
+            key
+            for key in previous.keys() | self.data.keys()
+            if previous.get(key) != self.data.get(key)
+        }
+        for section in was_stale | self._notified_stale:
+            changed |= SECTION_DATA_KEYS[section]
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or not changed.isdisjoint(context):
+                update_callback()
+
+    @property
+    def _forecast_key(self) -> str:
+        """Return the cache key of this location's forecast."""
+        return location_key("openmeteo", *self.location)
+
+    @property
+    def _air_quality_key(self) -> str:
+        """Return the cache key of this location's air quality."""
+        return location_key("airquality", *self.location)
+
+    def _cached(self, key: str) -> Any | None:
+        """Return a cached response usable instead of fetching.
+
+        Only the first refresh (or the one following a fast-start restore)
+        reads the cache, and only responses younger than the update interval:
+        later refreshes always fetch.
 
-    async def _async_update_data(self) -> dict[str, Any]:
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached response, or None
+        """
+        if self.cache is None or (self.data is not None and not self.restored):
+            return None
+        return self.cache.get(key, AROME_UPDATE_INTERVAL)
+
+    async def async_restore_from_cache(self) -> bool:
+        """Load the last cached forecast, whatever its age.
+
+        The cached Open-Meteo response is parsed again, so the hourly forecast
+        starts from the current hour rather than from when it was fetched.
+        Like any data, it is only kept after a failed refresh while it is
+        younger than AROME_STALE_MAX_AGE (counted from when it was fetched,
+        not restored).
+
+        Returns:
+            True if data was restored
+        """
+        if self.cache is None:
+            return False
+
+        payload = self.cache.get(self._forecast_key)
+        if not payload:
+            return False
+
+        try:
+            forecast = await self.hass.async_add_executor_job(
+                OpenMeteoClient.parse_forecast, payload
+            )
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.warning(
+                "Ignoring unreadable cached weather data for %s: %s",
+                self.location_name,
+                err,
+            )
+            return False
+
+        self._sections = {
+            SECTION_FORECAST: (
+                {**forecast, "payload": payload},
+                self.cache.fetched_at(self._forecast_key),
+            )
+        }
+        if air_quality := self.cache.get(self._air_quality_key):
+            self._sections[SECTION_AIR_QUALITY] = (
+                air_quality,
+                self.cache.fetched_at(self._air_quality_key),
+            )
+        self.data = self._combine(forecast, air_quality or {}, self._updated())
+        self.data_fetched_at = self._data_fetched_at(self.data)
+        self.restored = True
+        _LOGGER.info("Restored cached weather data for %s", self.location_name)
+        return True
+
+    @staticmethod
+    def _combine(
+        forecast: dict[str, Any],
+        air_quality: dict[str, Any],
+        updated: dict[str, datetime],
+    ) -> dict[str, Any]:
+        """Build the coordinator data from a parsed forecast and air quality.
+
+        Args:
+            forecast: Parsed forecast
+            air_quality: Air quality data (empty if unavailable)
+            updated: Fetch time of each section
+        """
+        return {
+            "current": forecast["current"],
+            "daily_forecast": forecast["daily_forecast"],
+            "hourly_forecast": forecast["hourly_forecast"],
+            "hourly_6h": forecast["hourly_6h"],
+            "elevation": forecast["elevation"],
+            "air_quality": air_quality,
+            "updated": updated,
+        }
+
+    def _updated(self) -> dict[str, datetime]:
+        """Return the fetch time of each section's current value."""
+        return {section: fetched_at for section, (_, fetched_at) in self._sections.items()}
+
+    def _sections_to_fetch(self) -> set[str]:
+        """Return the sections the next refresh should fetch.
+
+        Normally every section is fetched. While some sections are being
+        retried, the others are only fetched again once they are due.
+        """
+        sections = {SECTION_FORECAST}
+        if self.airquality_client:
+            sections.add(SECTION_AIR_QUALITY)
+        if not self._failed_sections:
+            return sections
+
+        due = dt_util.utcnow() - (AROME_UPDATE_INTERVAL - STALE_RETRY_INTERVAL)
+        return {
+            section
+            for section in sections
+            if section in self._failed_sections
+            or section not in self._sections
+            or self._sections[section][1] <= due
+            # New batch data costs nothing to take
+            or (
+                section == SECTION_FORECAST
+                and self.batch is not None
+                and self.batch.get_payload(self.location) is not None
+            )
+        }
+
+    def _last_good(self, section: str) -> dict[str, Any] | None:
+        """Return a section's last good value, unless it is too old to serve."""
+        if section not in self._sections:
+            return None
+        value, fetched_at = self._sections[section]
+        if dt_util.utcnow() - fetched_at > self.stale_max_age:
+            return None
+        return value
+
+    def _data_fetched_at(self, data: dict[str, Any]) -> datetime:
+        """Return when the forecast section of the data was fetched.
+
+        The forecast is what the data cannot be served without; the age of
+        the other sections is reported separately (see section_data_age).
+        """
+        return data["updated"][SECTION_FORECAST]
+
+    def _partially_stale(self) -> bool:
+        """Return True while a section failed and keeps its last good value."""
+        return bool(self._failed_sections)
+
+    def _stale_sections(self) -> set[str]:
+        """Return the sections whose last update failed.
+
+        These are the failed sections, or every section when the whole update
+        failed without reaching them.
+        """
+        if not self.stale:
+            return set()
+        return set(self._failed_sections or self._sections)
+
+    def section_data_age(self, section: str) -> timedelta | None:
+        """Return the age of a section's data while its updates fail (None otherwise).
+
+        A section too old to be served (see _last_good) still reports its age.
+
+        Args:
+            section: SECTION_FORECAST or SECTION_AIR_QUALITY
+        """
+        if section not in self._stale_sections() or section not in self._sections:
+            return None
+        return dt_util.utcnow() - self._sections[section][1]
+
+    @property
+    def data_age(self) -> timedelta | None:
+        """Return the age of the oldest stale section (None if none is stale)."""
+        return max(
+            (
+                age
+                for section in self._stale_sections()
+                if (age := self.section_data_age(section)) is not None
+            ),
+            default=None,
+        )
+
+    def stale_attributes_for(self, keys: frozenset[str] | None) -> dict[str, Any]:
+        """Return the stale attributes of an entity reading some data keys.
+
+        Only the sections an entity reads flag it: air quality failing does
+        not make the forecast entities stale.
+
+        Args:
+            keys: Data keys the entity reads (its listener context), or None
+                for all of them
+
+        Returns:
+            data_age (minutes) of the oldest stale section read, or {}
+        """
+        ages = [
+            age
+            for section in self._stale_sections()
+            if (keys is None or not keys.isdisjoint(SECTION_DATA_KEYS[section]))
+            and (age := self.section_data_age(section)) is not None
+        ]
+        if not ages:
+            return {}
+        return {"data_age": int(max(ages).total_seconds() // 60)}
+
+    @property
+    def location(self) -> tuple[float, float]:
+        """Return the (latitude, longitude) of this location."""
+        return (self.client._latitude, self.client._longitude)
+
+    @callback
+    def _handle_batch_update(self) -> None:
+        """Refresh from the batch coordinator's new data."""
+        if self.batch and self.batch.get_payload(self.location) is not None:
+            self.hass.async_create_task(self.async_request_refresh())
+
+    async def _async_fetch_data(self) -> dict[str, Any]:
         """Fetch data from Open-Meteo API.
 
         Returns:
@@ -155,91 +748,122 @@ class AromeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self.client._longitude,
             )
 
-            # Define wrapped API calls with retry logic
-            async def fetch_current():
-                return await async_retry_with_backoff(
-                    self.client.async_get_current_weather,
-                    context=f"Fetch current weather for {self.location_name}",
-                )
-
-            async def fetch_daily():
-                return await async_retry_with_backoff(
-                    self.client.async_get_daily_forecast,
-                    context=f"Fetch daily forecast for {self.location_name}",
-                )
-
-            async def fetch_hourly():
-                return await async_retry_with_backoff(
-                    self.client.async_get_hourly_forecast,
-                    context=f"Fetch hourly forecast for {self.location_name}",
-                )
-
-            async def fetch_hourly_6h():
-                return await async_retry_with_backoff(
-                    self.client.async_get_hourly_6h,
-                    context=f"Fetch 6h forecast for {self.location_name}",
-                )
-
-            async def fetch_additional():
-                return await async_retry_with_backoff(
-                    self.client.async_get_additional_data,
-                    context=f"Fetch additional data for {self.location_name}",
+            # Each section is stamped with when its source fetched it: the
+            # batch or a cached response may be older than this refresh
+            now = dt_util.utcnow()
+
+            # Current weather, daily, hourly and 6h forecasts all come from
+            # the same endpoint, so fetch them in a single request
+            async def fetch_forecast():
+                if self.batch and (payload := self.batch.get_payload(self.location)):
+                    # Parsed now rather than when the batch was fetched (which
+                    # is reused until the next model run): the hourly forecast
+                    # starts from the current hour, and current conditions
+                    # come from that hour's row (see _current_block)
+                    forecast = await self.hass.async_add_executor_job(
+                        OpenMeteoClient.parse_forecast, payload
+                    )
+                    return {**forecast, "payload": payload}, self.batch.data_fetched_at or now
+                if payload := self._cached(self._forecast_key):
+                    _LOGGER.debug("Using cached forecast for %s", self.location_name)
+                    forecast = await self.hass.async_add_executor_job(
+                        OpenMeteoClient.parse_forecast, payload
+                    )
+                    return forecast, self.cache.fetched_at(self._forecast_key) or now
+                forecast = await async_retry_with_backoff(
+                    self.client.async_get_forecast,
+                    context=f"Fetch forecast for {self.location_name}",
+                    upstream=UPSTREAM_OPENMETEO_FORECAST,
                 )
+                return forecast, now
 
-            # Fetch all data in parallel for better performance
-            tasks = [
-                fetch_current(),
-                fetch_daily(),
-                fetch_hourly(),
-                fetch_hourly_6h(),
-                fetch_additional(),
-            ]
+            sections = self._sections_to_fetch()
+            tasks = {}
+            if SECTION_FORECAST in sections:
+                tasks[SECTION_FORECAST] = fetch_forecast()
 
             # Add air quality task if client is available
-            if self.airquality_client:
+            if SECTION_AIR_QUALITY in sections:
 
                 async def fetch_air_quality():
-                    return await async_retry_with_backoff(
+                    if cached := self._cached(self._air_quality_key):
+                        return cached, self.cache.fetched_at(self._air_quality_key) or now
+                    air_quality = await async_retry_with_backoff(
                         self.airquality_client.async_get_air_quality,
                         context=f"Fetch air quality for {self.location_name}",
+                        upstream=UPSTREAM_OPENMETEO_AIR_QUALITY,
                     )
+                    if self.cache is not None:
+                        self.cache.async_set(self._air_quality_key, air_quality)
+                    return air_quality, now
+
+                tasks[SECTION_AIR_QUALITY] = fetch_air_quality()
 
-                tasks.append(fetch_air_quality())
+            # Execute API calls in parallel (with retry logic per task)
+            results = dict(
+                zip(tasks, await asyncio.gather(*tasks.values(), return_exceptions=True))
+            )
 
-            # Execute all API calls in parallel (with retry logic per task)
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # A failed section keeps its last good value and is retried alone
+            failed = {}
+            for section, result in results.items():
+                if isinstance(result, Exception):
+                    failed[section] = result
+                    continue
+                previous = self._sections.get(section)
+                self._sections[section] = result
+                # Only live responses carry their payload: cache it for
+                # restarts, once (a batch response is reused until the next run)
+                payload = result[0].get("payload")
+                if (
+                    section == SECTION_FORECAST
+                    and self.cache is not None
+                    and payload
+                    and (previous is None or previous[0].get("payload") is not payload)
+                ):
+                    # Stamped with the batch's fetch time, not now, so the
+                    # cached payload does not look fresher than it is
+                    self.cache.async_set(self._forecast_key, payload, result[1])
+            self._failed_sections = set(failed)
+
+            forecast = self._last_good(SECTION_FORECAST)
+            if forecast is None:
+                err = failed.get(SECTION_FORECAST)
+                raise UpdateFailed(f"Failed to get forecast: {err}") from err
+            if SECTION_FORECAST in failed:
+                _LOGGER.warning(
+                    "Error fetching forecast for %s, keeping the one from %s: %s",
+                    self.location_name,
+                    self._sections[SECTION_FORECAST][1].isoformat(),
+                    failed[SECTION_FORECAST],
+                )
+                # Parse the kept response again so the hourly forecast still
+                # starts from the current hour
+                if payload := forecast.get("payload"):
+                    forecast = await self.hass.async_add_executor_job(
+                        OpenMeteoClient.parse_forecast, payload
+                    )
 
-            # Unpack results
-            current_weather = results[0] if not isinstance(results[0], Exception) else {}
-            daily_forecast = results[1] if not isinstance(results[1], Exception) else []
-            hourly_forecast = results[2] if not isinstance(results[2], Exception) else []
-            hourly_6h = results[3] if not isinstance(results[3], Exception) else []
-            additional_data = results[4] if not isinstance(results[4], Exception) else {}
+            current_weather = forecast["current"]
+            daily_forecast = forecast["daily_forecast"]
+            hourly_forecast = forecast["hourly_forecast"]
+            hourly_6h = forecast["hourly_6h"]
+            elevation = forecast["elevation"]
 
             # Handle air quality data
-            air_quality_data = {}
-            if self.airquality_client and len(results) > 5:
-                if isinstance(results[5], Exception):
-                    _LOGGER.warning("Error fetching air quality data for %s: %s", self.location_name, results[5])
-                else:
-                    air_quality_data = results[5]
-                    _LOGGER.debug("Successfully fetched air quality data for %s", self.location_name)
-
-            # Check for critical errors
-            if isinstance(results[0], Exception):
-                raise UpdateFailed(f"Failed to get current weather: {results[0]}") from results[0]
-            if isinstance(results[1], Exception):
-                raise UpdateFailed(f"Failed to get daily forecast: {results[1]}") from results[1]
+            air_quality_data = self._last_good(SECTION_AIR_QUALITY) or {}
+            if SECTION_AIR_QUALITY in failed:
+                _LOGGER.warning(
+                    "Error fetching air quality data for %s%s: %s",
+                    self.location_name,
+                    ", keeping the last good values" if air_quality_data else "",
+                    failed[SECTION_AIR_QUALITY],
+                )
+            elif SECTION_AIR_QUALITY in results:
+                _LOGGER.debug("Successfully fetched air quality data for %s", self.location_name)
 
             # Combine all data
-            data = {
-                "current": current_weather,
-                "daily_forecast": daily_forecast,
-                "hourly_forecast": hourly_forecast,
-                "hourly_6h": hourly_6h,
-                "elevation": additional_data.get("elevation", 0),
-                "air_quality": air_quality_data,
-            }
+            data = self._combine(forecast, air_quality_data, self._updated())
 
             elapsed_time = time.monotonic() - start_time
             _LOGGER.info(
@@ -253,11 +877,12 @@ class AromeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.debug(
                 "Weather data details for %s: elevation=%dm, 6h forecasts=%d, current_temp=%.1f°C",
                 self.location_name,
-                additional_data.get("elevation", 0),
+                elevation or 0,
                 len(hourly_6h),
                 current_weather.get("temperature", 0),
             )
 
+            self.restored = False
             return data
 
         except OpenMeteoApiError as err:
@@ -283,7 +908,156 @@ class AromeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
 
-class BraCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+class ForecastBatchCoordinator(
+    DataUpdateCoordinator[dict[tuple[float, float], dict[str, Any]]]
+):
+    """Coordinator refreshing the forecast of every Serac location at once.
+
+    Each config entry's AromeCoordinator registers its location here; on every
+    refresh the forecasts of all locations are fetched with one multi-location
+    request per chunk and fanned out to the registered coordinators, which only
+    fetch their own forecast when their location is missing from the batch.
+
+    Refreshes follow the model runs published by Open-Meteo: each refresh
+    first reads the latest run from the model metadata, skips the forecast
+    request while that run was already fetched, and schedules the next check
+    for when the following run should be available.
+    """
+
+    def __init__(self, hass: HomeAssistant, client: OpenMeteoBatchClient) -> None:
+        """Initialize the batch coordinator.
+
+        Args:
+            hass: Home Assistant instance
+            client: Open-Meteo batch API client
+        """
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_forecast_batch",
+            update_interval=AROME_UPDATE_INTERVAL,
+            # Runs that were already fetched return the same data: don't
+            # wake the locations up for them
+            always_update=False,
+        )
+        self.client = client
+        self._members: set[AromeCoordinator] = set()
+        # When the data was last fetched or confirmed to be the latest run
+        self._fetched_at: float | None = None
+        # When the data was actually fetched (the section time of its forecasts)
+        self.data_fetched_at: datetime | None = None
+        # Model run of the current data (None if the metadata was unavailable)
+        self.model_run: ModelRun | None = None
+
+    @callback
+    def async_register(self, coordinator: AromeCoordinator) -> CALLBACK_TYPE:
+        """Include a location in the batch and notify its coordinator on updates.
+
+        Args:
+            coordinator: Coordinator of the location
+
+        Returns:
+            Callback removing the location from the batch
+        """
+        self._members.add(coordinator)
+        remove_listener = self.async_add_listener(coordinator._handle_batch_update)
+
+        @callback
+        def _unregister() -> None:
+            self._members.discard(coordinator)
+            remove_listener()
+
+        return _unregister
+
+    def get_payload(self, location: tuple[float, float]) -> dict[str, Any] | None:
+        """Return the batched forecast response of a location if it is still current.
+
+        Args:
+            location: (latitude, longitude)
+
+        Returns:
+            Decoded Open-Meteo response (see OpenMeteoClient.parse_forecast),
+            or None if the location was not in the last successful batch or
+            that batch was not confirmed current by the last scheduled check
+        """
+        max_age = (self.update_interval or AROME_UPDATE_INTERVAL) + OPENMETEO_RUN_POLL_INTERVAL
+        if (
+            not self.data
+            or self._fetched_at is None
+            or time.monotonic() - self._fetched_at > max_age.total_seconds()
+        ):
+            return None
+        return self.data.get(location)
+
+    async def _async_update_data(self) -> dict[tuple[float, float], dict[str, Any]]:
+        """Fetch the forecasts of all registered locations.
+
+        Returns:
+            Mapping of (latitude, longitude) to decoded forecast response
+
+        Raises:
+            UpdateFailed: If update fails
+        """
+        locations = [member.location for member in self._members]
+        if not locations:
+            return {}
+
+        model_run = await self._async_get_model_run()
+        if (
+            model_run is not None
+            and model_run == self.model_run
+            and self.data
+            and all(location in self.data for location in locations)
+        ):
+            _LOGGER.debug(
+                "Model run %s already fetched, next check in %s",
+                model_run.initialisation.isoformat(),
+                self.update_interval,
+            )
+            self._fetched_at = time.monotonic()
+            return self.data
+
+        start_time = time.monotonic()
+        try:
+            forecasts = await async_retry_with_backoff(
+                lambda: self.client.async_get_forecasts(locations),
+                context=f"Fetch batch forecast for {len(locations)} locations",
+                upstream=UPSTREAM_OPENMETEO_FORECAST,
+            )
+        except OpenMeteoApiError as err:
+            raise UpdateFailed(f"Error fetching batch forecast: {err}") from err
+
+        self._fetched_at = time.monotonic()
+        self.data_fetched_at = dt_util.utcnow()
+        self.model_run = model_run
+        _LOGGER.info(
+            "Batch forecast update completed in %.2fs: %d/%d locations, model run %s",
+            self._fetched_at - start_time,
+            len(forecasts),
+            len(locations),
+            model_run.initialisation.isoformat() if model_run else "unknown",
+        )
+        return forecasts
+
+    async def _async_get_model_run(self) -> ModelRun | None:
+        """Read the latest model run and schedule the next refresh after it.
+
+        Returns:
+            Latest model run, or None if the metadata is unavailable (the
+            forecast is then fetched every AROME_UPDATE_INTERVAL)
+        """
+        try:
+            model_run = await self.client.async_get_model_run()
+        except OpenMeteoApiError as err:
+            _LOGGER.debug("Model run metadata unavailable: %s", err)
+            self.update_interval = AROME_UPDATE_INTERVAL
+            return None
+
+        self.update_interval = model_run_refresh_interval(dt_util.utcnow(), model_run)
+        return model_run
+
+
+class BraCoordinator(StaleTolerantCoordinator):
     """Coordinator for BRA avalanche bulletin updates."""
 
     def __init__(
@@ -293,6 +1067,7 @@ class BraCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         location_name: str,
         massif_id: int,
         massif_name: str,
+        cache: ResponseCache | None = None,
     ) -> None:
         """Initialize the BRA coordinator.
 
@@ -302,19 +1077,76 @@ class BraCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             location_name: Name of the location for logging
             massif_id: Numeric ID of the massif
             massif_name: Name of the massif
+            cache: Optional on-disk cache of API responses
         """
         super().__init__(
             hass,
-            _LOGGER,
             name=f"{DOMAIN}_{location_name}_bra",
             update_interval=BRA_UPDATE_INTERVAL,
+            stale_max_age=BRA_STALE_MAX_AGE,
+            # Bulletins change once a day: don't rewrite sensor states otherwise
+            always_update=False,
         )
         self.client = client
         self.location_name = location_name
         self.massif_id = massif_id
         self.massif_name = massif_name
+        self.cache = cache
+        # True while the API returns no bulletin (out of season)
+        self.dormant = False
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    @callback
+    def async_start_dormant(self) -> None:
+        """Start without fetching, holding an empty bulletin.
+
+        Used out of season instead of the first refresh: the API is first
+        probed at the next publication window, then once a day until
+        bulletins are published again.
+        """
+        self.dormant = True
+        self.data = {"has_data": False}
+        self._schedule_next_update(self.data)
+
+    def _schedule_next_update(self, bulletin: dict[str, Any] | None) -> None:
+        """Align the next refresh with the BRA publication schedule.
+
+        Args:
+            bulletin: Bulletin just fetched, or None if the update failed
+        """
+        self.update_interval = bra_refresh_interval(dt_util.now(), bulletin)
+        _LOGGER.debug(
+            "Next BRA refresh for %s in %s",
+            self.massif_name,
+            self.update_interval,
+        )
+
+    def _cached_bulletin(self) -> dict[str, Any] | None:
+        """Return the cached bulletin if no refresh was due since it was fetched.
+
+        Only used for the first refresh, e.g. after a restart or an options
+        change reloaded the entry. The client is seeded with the cached
+        bulletin and its validators, so the next download is conditional. The
+        bulletin itself is current as long as the refresh scheduled when it
+        was fetched (see bra_refresh_interval) has not come yet.
+
+        Returns:
+            Cached bulletin, or None
+        """
+        if self.cache is None or self.data is not None:
+            return None
+        key = bra_key(self.massif_id)
+        entry = self.cache.get(key)
+        fetched_at = self.cache.fetched_at(key)
+        if entry is None or fetched_at is None:
+            return None
+        bulletin = entry["bulletin"]
+        self.client.restore(bulletin, entry["validators"])
+        if fetched_at + bra_refresh_interval(fetched_at, bulletin) <= dt_util.utcnow():
+            return None
+        _LOGGER.debug("Using cached BRA bulletin for %s", self.massif_name)
+        return bulletin
+
+    async def _async_fetch_data(self) -> dict[str, Any]:
         """Fetch data from BRA API.
 
         Returns:
@@ -333,24 +1165,39 @@ class BraCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self.massif_id,
             )
 
-            # Fetch bulletin data with retry logic
-            bulletin_data = await async_retry_with_backoff(
-                self.client.async_get_bulletin,
-                context=f"Fetch BRA bulletin for {self.massif_name} (massif {self.massif_id})",
-            )
+            bulletin_data = self._cached_bulletin()
+            if bulletin_data is None:
+                # Fetch bulletin data with retry logic
+                bulletin_data = await async_retry_with_backoff(
+                    self.client.async_get_bulletin,
+                    context=f"Fetch BRA bulletin for {self.massif_name} (massif {self.massif_id})",
+                    upstream=UPSTREAM_BRA,
+                )
+                if self.cache is not None:
+                    self.cache.async_set(
+                        bra_key(self.massif_id),
+                        {"bulletin": bulletin_data, "validators": self.client.validators},
+                    )
 
             elapsed_time = time.monotonic() - start_time
 
             if not bulletin_data.get("has_data"):
-                _LOGGER.warning(
-                    "No BRA bulletin available for %s (massif %s, ID: %d) after %.2fs - likely out of season (bulletins published ~Dec-May)",
-                    self.massif_name,
-                    self.massif_name,
-                    self.massif_id,
-                    elapsed_time,
-                )
+                if not self.dormant:
+                    _LOGGER.warning(
+                        "No BRA bulletin available for %s (massif %s, ID: %d) after %.2fs - likely out of season (bulletins published ~Dec-May), probing once a day",
+                        self.massif_name,
+                        self.massif_name,
+                        self.massif_id,
+                        elapsed_time,
+                    )
+                self.dormant = True
+                self._schedule_next_update(bulletin_data)
                 return {"has_data": False}
 
+            if self.dormant:
+                _LOGGER.info("BRA bulletins available again for %s", self.massif_name)
+                self.dormant = False
+            self._schedule_next_update(bulletin_data)
             _LOGGER.info(
                 "BRA update completed for %s in %.2fs: risk_today=%s, risk_tomorrow=%s, bulletin_date=%s",
                 self.massif_name,
@@ -369,7 +1216,8 @@ class BraCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
             return bulletin_data
 
-        except BraApiError as err:
+        except (BraApiError, CircuitOpenError) as err:
+            self._schedule_next_update(None)
             elapsed_time = time.monotonic() - start_time
             _LOGGER.error(
                 "Failed to fetch BRA bulletin for %s (massif ID: %d) after %.2fs: %s",
@@ -380,6 +1228,7 @@ class BraCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             raise UpdateFailed(f"Error fetching BRA data: {err}") from err
         except Exception as err:
+            self._schedule_next_update(None)
             elapsed_time = time.monotonic() - start_time
             _LOGGER.error(
                 "Unexpected error fetching BRA data for %s (massif ID: %d) after %.2fs: %s (type: %s)",
@@ -392,7 +1241,7 @@ class BraCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
 
-class VigilanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+class VigilanceCoordinator(StaleTolerantCoordinator):
     """Coordinator for Météo-France Vigilance weather alerts."""
 
     def __init__(
@@ -400,6 +1249,7 @@ class VigilanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         hass: HomeAssistant,
         client: VigilanceClient,
         location_name: str,
+        cache: ResponseCache | None = None,
     ) -> None:
         """Initialize the Vigilance coordinator.
 
@@ -407,17 +1257,21 @@ class VigilanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             hass: Home Assistant instance
             client: Vigilance API client
             location_name: Name of the location for logging
+            cache: Optional on-disk cache of API responses
         """
         super().__init__(
             hass,
-            _LOGGER,
             name=f"{DOMAIN}_{location_name}_vigilance",
             update_interval=VIGILANCE_UPDATE_INTERVAL,
+            # The data is already VIGILANCE_UPDATE_INTERVAL old when the
+            # scheduled refresh fails
+            stale_max_age=VIGILANCE_UPDATE_INTERVAL + VIGILANCE_STALE_MAX_AGE,
         )
         self.client = client
         self.location_name = location_name
+        self.cache = cache
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_fetch_data(self) -> dict[str, Any]:
         """Fetch data from Vigilance API.
 
         Returns:
@@ -436,11 +1290,23 @@ class VigilanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self.client._department,
             )
 
-            # Fetch vigilance data with retry logic
-            vigilance_data = await async_retry_with_backoff(
-                self.client.async_get_current_vigilance,
-                context=f"Fetch vigilance alerts for {self.location_name}",
-            )
+            # Alerts are per department: a location's first refresh can reuse
+            # the response cached for its department
+            department = self.client._department
+            vigilance_data = None
+            if self.cache is not None and department and self.data is None:
+                vigilance_data = self.cache.get(
+                    vigilance_key(department), VIGILANCE_UPDATE_INTERVAL
+                )
+            if vigilance_data is None:
+                # Fetch vigilance data with retry logic
+                vigilance_data = await async_retry_with_backoff(
+                    self.client.async_get_current_vigilance,
+                    context=f"Fetch vigilance alerts for {self.location_name}",
+                    upstream=UPSTREAM_VIGILANCE,
+                )
+                if self.cache is not None and department:
+                    self.cache.async_set(vigilance_key(department), vigilance_data)
 
             elapsed_time = time.monotonic() - start_time
 
@@ -483,7 +1349,7 @@ class VigilanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
             return vigilance_data
 
-        except VigilanceApiError as err:
+        except (VigilanceApiError, CircuitOpenError) as err:
             elapsed_time = time.monotonic() - start_time
             _LOGGER.error(
                 "Failed to fetch vigilance data for %s (dept %s) after %.2fs: %s",
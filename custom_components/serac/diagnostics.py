@@ -7,6 +7,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 
+from .api.forecast_table import ForecastTable
 from .const import CONF_BRA_TOKEN, DOMAIN
 
 
@@ -84,6 +85,8 @@ async def async_get_config_entry_diagnostics(
                     data_structure[key] = f"<dict with {len(value)} keys>"
                 elif isinstance(value, list):
                     data_structure[key] = f"<list with {len(value)} items>"
+                elif isinstance(value, ForecastTable):
+                    data_structure[key] = repr(value)
                 else:
                     data_structure[key] = type(value).__name__
             diagnostics_data["coordinators"]["arome"]["data_structure"] = data_structure
@@ -1,7 +1,8 @@
 """Sensor platform for Serac integration."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass
 from datetime import datetime
 import logging
@@ -24,8 +25,9 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -36,8 +38,16 @@ from .const import (
     CONF_ENTITY_PREFIX,
     CONF_LOCATION_NAME,
     CONF_MASSIF_NAME,
+    CONF_SENSOR_GROUPS,
+    DEFAULT_ENABLED_FORECAST_DAYS,
+    DEFAULT_SENSOR_GROUPS,
     DOMAIN,
     MANUFACTURER,
+    SENSOR_GROUP_AIR_QUALITY,
+    SENSOR_GROUP_AIR_QUALITY_DAILY,
+    SENSOR_GROUP_CURRENT,
+    SENSOR_GROUP_DAILY,
+    SENSOR_GROUP_VIGILANCE,
     SENSOR_TYPE_AVALANCHE_ACCIDENTAL,
     SENSOR_TYPE_AVALANCHE_BULLETIN_DATE,
     SENSOR_TYPE_AVALANCHE_NATURAL,
@@ -64,9 +74,15 @@ from .const import (
     SENSOR_TYPE_RAIN_CURRENT,
     SENSOR_TYPE_SHOWERS_CURRENT,
     SENSOR_TYPE_SNOWFALL_CURRENT,
+    SIGNAL_BRA_COORDINATORS_ADDED,
+    VIGILANCE_PHENOMENA,
 )
 from .coordinator import AromeCoordinator, BraCoordinator
-from .utils import sanitize_entity_id_part
+from .utils import (
+    async_remove_disabled_entities,
+    compile_value_path,
+    sanitize_entity_id_part,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -98,6 +114,98 @@ class SeracSensorDescription(SensorEntityDescription):
 
     value_fn: Callable[[dict[str, Any]], StateType] = None
     extra_attributes_fn: Callable[[dict[str, Any]], dict[str, Any]] | None = None
+    # Coordinator data key value_fn reads: the sensor is only updated when it
+    # changes (None updates on every refresh)
+    data_key: str | None = None
+    # Declarative alternative to value_fn: keys/indexes leading to the value,
+    # e.g. ("daily_forecast", 2, "uv_index"), and a conversion of found values
+    value_path: tuple[str | int, ...] | None = None
+    value_transform: Callable[[Any], StateType] | None = None
+
+    def __post_init__(self) -> None:
+        """Compile value_path into value_fn and derive data_key from it."""
+        if self.value_path is None:
+            return
+        getter = compile_value_path(self.value_path)
+        transform = self.value_transform
+        if transform is None:
+            value_fn = getter
+        else:
+
+            def value_fn(data: dict[str, Any]) -> StateType:
+                value = getter(data)
+                return None if value is None else transform(value)
+
+        object.__setattr__(self, "value_fn", value_fn)
+        if self.data_key is None:
+            object.__setattr__(self, "data_key", self.value_path[0])
+
+
+def _seconds_to_hours(seconds: float) -> float:
+    """Convert a duration in seconds to hours."""
+    return seconds / 3600
+
+
+class SensorValues:
+    """Values of many AROME sensors, extracted together per coordinator update.
+
+    Path-based descriptions are grouped by the path of their parent (e.g. all
+    fields of ("daily_forecast", 2)), so each forecast row is looked up once
+    and only the last key is read per sensor. Values are computed on first
+    access after the coordinator data changed.
+    """
+
+    def __init__(self, descriptions: Iterable[SeracSensorDescription]) -> None:
+        """Prepare the extraction.
+
+        Args:
+            descriptions: Descriptions of the sensors sharing a coordinator
+        """
+        groups: dict[tuple[str | int, ...], list[SeracSensorDescription]] = {}
+        self._others: list[SeracSensorDescription] = []
+        for description in descriptions:
+            if description.value_path:
+                groups.setdefault(description.value_path[:-1], []).append(description)
+            else:
+                self._others.append(description)
+        self._groups = [
+            (compile_value_path(parent), group) for parent, group in groups.items()
+        ]
+        self._data: dict[str, Any] | None = None
+        self._values: dict[str, StateType] = {}
+
+    def get(self, data: dict[str, Any], key: str) -> StateType:
+        """Return the value of a sensor.
+
+        Args:
+            data: Coordinator data
+            key: Sensor description key
+
+        Returns:
+            Sensor value
+        """
+        if data is not self._data:
+            self._values = self._extract(data)
+            self._data = data
+        return self._values.get(key)
+
+    def _extract(self, data: dict[str, Any]) -> dict[str, StateType]:
+        """Extract every sensor value from the coordinator data."""
+        values: dict[str, StateType] = {}
+        for get_parent, group in self._groups:
+            parent = get_parent(data)
+            for description in group:
+                value = (
+                    parent.get(description.value_path[-1])
+                    if isinstance(parent, Mapping)
+                    else None
+                )
+                if value is not None and description.value_transform is not None:
+                    value = description.value_transform(value)
+                values[description.key] = value
+        for description in self._others:
+            values[description.key] = description.value_fn(data)
+        return values
 
 
 # Static sensors (not dependent on weather updates)
@@ -108,7 +216,7 @@ STATIC_SENSORS: tuple[SeracSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfLength.METERS,
         device_class=SensorDeviceClass.DISTANCE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("elevation"),
+        value_path=("elevation",),
     ),
 )
 
@@ -120,7 +228,7 @@ CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("current", {}).get("temperature"),
+        value_path=("current", "temperature"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_HUMIDITY,
@@ -128,13 +236,14 @@ CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("current", {}).get("humidity"),
+        value_path=("current", "humidity"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_IS_DAY,
         name="Is Day",
         device_class=SensorDeviceClass.ENUM,
         icon="mdi:weather-sunny",
+        data_key="current",
         value_fn=lambda data: "day" if data.get("current", {}).get("is_day") else "night",
     ),
     SeracSensorDescription(
@@ -144,7 +253,7 @@ CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         device_class=SensorDeviceClass.WIND_SPEED,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:weather-windy",
-        value_fn=lambda data: data.get("current", {}).get("wind_speed"),
+        value_path=("current", "wind_speed"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_WIND_DIRECTION_CURRENT,
@@ -152,7 +261,7 @@ CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         native_unit_of_measurement="°",
         icon="mdi:compass",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("current", {}).get("wind_bearing"),
+        value_path=("current", "wind_bearing"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_WIND_GUST_CURRENT,
@@ -161,7 +270,7 @@ CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         device_class=SensorDeviceClass.WIND_SPEED,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:weather-windy-variant",
-        value_fn=lambda data: data.get("current", {}).get("wind_gust"),
+        value_path=("current", "wind_gust"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_PRECIPITATION_CURRENT,
@@ -170,7 +279,7 @@ CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         device_class=SensorDeviceClass.PRECIPITATION,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:weather-pouring",
-        value_fn=lambda data: data.get("current", {}).get("precipitation"),
+        value_path=("current", "precipitation"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_RAIN_CURRENT,
@@ -179,7 +288,7 @@ CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         device_class=SensorDeviceClass.PRECIPITATION,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:weather-rainy",
-        value_fn=lambda data: data.get("current", {}).get("rain"),
+        value_path=("current", "rain"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_SHOWERS_CURRENT,
@@ -188,7 +297,7 @@ CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         device_class=SensorDeviceClass.PRECIPITATION,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:weather-partly-rainy",
-        value_fn=lambda data: data.get("current", {}).get("showers"),
+        value_path=("current", "showers"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_SNOWFALL_CURRENT,
@@ -197,7 +306,7 @@ CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         device_class=SensorDeviceClass.PRECIPITATION,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:weather-snowy",
-        value_fn=lambda data: data.get("current", {}).get("snowfall"),
+        value_path=("current", "snowfall"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_CLOUD_COVERAGE,
@@ -205,7 +314,7 @@ CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:cloud-percent",
-        value_fn=lambda data: data.get("current", {}).get("cloud_coverage"),
+        value_path=("current", "cloud_coverage"),
     ),
 )
 
@@ -217,7 +326,7 @@ AIR_QUALITY_CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         native_unit_of_measurement="EAQI",
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:air-filter",
-        value_fn=lambda data: data.get("air_quality", {}).get("current", {}).get("european_aqi"),
+        value_path=("air_quality", "current", "european_aqi"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_PM2_5,
@@ -225,7 +334,7 @@ AIR_QUALITY_CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         native_unit_of_measurement="µg/m³",
         device_class=SensorDeviceClass.PM25,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("air_quality", {}).get("current", {}).get("pm2_5"),
+        value_path=("air_quality", "current", "pm2_5"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_PM10,
@@ -233,7 +342,7 @@ AIR_QUALITY_CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         native_unit_of_measurement="µg/m³",
         device_class=SensorDeviceClass.PM10,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("air_quality", {}).get("current", {}).get("pm10"),
+        value_path=("air_quality", "current", "pm10"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_NITROGEN_DIOXIDE,
@@ -242,7 +351,7 @@ AIR_QUALITY_CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         device_class=SensorDeviceClass.NITROGEN_DIOXIDE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:molecule",
-        value_fn=lambda data: data.get("air_quality", {}).get("current", {}).get("nitrogen_dioxide"),
+        value_path=("air_quality", "current", "nitrogen_dioxide"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_OZONE,
@@ -251,7 +360,7 @@ AIR_QUALITY_CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         device_class=SensorDeviceClass.OZONE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:molecule",
-        value_fn=lambda data: data.get("air_quality", {}).get("current", {}).get("ozone"),
+        value_path=("air_quality", "current", "ozone"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_SULPHUR_DIOXIDE,
@@ -260,13 +369,16 @@ AIR_QUALITY_CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         device_class=SensorDeviceClass.SULPHUR_DIOXIDE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:molecule",
-        value_fn=lambda data: data.get("air_quality", {}).get("current", {}).get("sulphur_dioxide"),
+        value_path=("air_quality", "current", "sulphur_dioxide"),
     ),
 )
 
 
 def _create_daily_aqi_sensors() -> tuple[SeracSensorDescription, ...]:
-    """Create daily air quality sensors for days 0-4 (5 days)."""
+    """Create daily air quality sensors for days 0-4 (5 days).
+
+    Only the first DEFAULT_ENABLED_FORECAST_DAYS days are enabled by default.
+    """
     sensors = []
     day_names = ["Today", "Tomorrow", "Day 2", "Day 3", "Day 4"]
 
@@ -280,7 +392,8 @@ def _create_daily_aqi_sensors() -> tuple[SeracSensorDescription, ...]:
             native_unit_of_measurement="EAQI",
             state_class=SensorStateClass.MEASUREMENT,
             icon="mdi:air-filter",
-            value_fn=lambda data, idx=day_idx: data.get("air_quality", {}).get("daily_forecast", [])[idx].get("aqi_max") if len(data.get("air_quality", {}).get("daily_forecast", [])) > idx else None,
+            value_path=("air_quality", "daily_forecast", day_idx, "aqi_max"),
+            entity_registry_enabled_default=day_idx < DEFAULT_ENABLED_FORECAST_DAYS,
         ))
 
         # PM2.5 Max
@@ -290,7 +403,8 @@ def _create_daily_aqi_sensors() -> tuple[SeracSensorDescription, ...]:
             native_unit_of_measurement="µg/m³",
             device_class=SensorDeviceClass.PM25,
             state_class=SensorStateClass.MEASUREMENT,
-            value_fn=lambda data, idx=day_idx: data.get("air_quality", {}).get("daily_forecast", [])[idx].get("pm25_max") if len(data.get("air_quality", {}).get("daily_forecast", [])) > idx else None,
+            value_path=("air_quality", "daily_forecast", day_idx, "pm25_max"),
+            entity_registry_enabled_default=day_idx < DEFAULT_ENABLED_FORECAST_DAYS,
         ))
 
         # PM10 Max
@@ -300,7 +414,8 @@ def _create_daily_aqi_sensors() -> tuple[SeracSensorDescription, ...]:
             native_unit_of_measurement="µg/m³",
             device_class=SensorDeviceClass.PM10,
             state_class=SensorStateClass.MEASUREMENT,
-            value_fn=lambda data, idx=day_idx: data.get("air_quality", {}).get("daily_forecast", [])[idx].get("pm10_max") if len(data.get("air_quality", {}).get("daily_forecast", [])) > idx else None,
+            value_path=("air_quality", "daily_forecast", day_idx, "pm10_max"),
+            entity_registry_enabled_default=day_idx < DEFAULT_ENABLED_FORECAST_DAYS,
         ))
 
     return tuple(sensors)
@@ -310,7 +425,10 @@ DAILY_AQI_SENSORS = _create_daily_aqi_sensors()
 
 
 def _create_daily_sensors() -> tuple[SeracSensorDescription, ...]:
-    """Create daily sensors for days 0, 1, 2."""
+    """Create daily sensors for days 0, 1, 2.
+
+    Only the first DEFAULT_ENABLED_FORECAST_DAYS days are enabled by default.
+    """
     sensors = []
     day_names = ["Today", "Tomorrow", "Day 2"]
 
@@ -325,7 +443,8 @@ def _create_daily_sensors() -> tuple[SeracSensorDescription, ...]:
             device_class=SensorDeviceClass.WIND_SPEED,
             state_class=SensorStateClass.MEASUREMENT,
             icon="mdi:weather-windy",
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("wind_speed") if len(data.get("daily_forecast", [])) > idx else None,
+            value_path=("daily_forecast", day_idx, "wind_speed"),
+            entity_registry_enabled_default=day_idx < DEFAULT_ENABLED_FORECAST_DAYS,
         ))
 
         # Wind Gust Max
@@ -336,7 +455,8 @@ def _create_daily_sensors() -> tuple[SeracSensorDescription, ...]:
             device_class=SensorDeviceClass.WIND_SPEED,
             state_class=SensorStateClass.MEASUREMENT,
             icon="mdi:weather-windy-variant",
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("wind_gust_speed") if len(data.get("daily_forecast", [])) > idx else None,
+            value_path=("daily_forecast", day_idx, "wind_gust_speed"),
+            entity_registry_enabled_default=day_idx < DEFAULT_ENABLED_FORECAST_DAYS,
         ))
 
         # Wind Direction
@@ -346,7 +466,8 @@ def _create_daily_sensors() -> tuple[SeracSensorDescription, ...]:
             native_unit_of_measurement="°",
             icon="mdi:compass",
             state_class=SensorStateClass.MEASUREMENT,
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("wind_bearing") if len(data.get("daily_forecast", [])) > idx else None,
+            value_path=("daily_forecast", day_idx, "wind_bearing"),
+            entity_registry_enabled_default=day_idx < DEFAULT_ENABLED_FORECAST_DAYS,
         ))
 
         # Sunrise
@@ -355,7 +476,8 @@ def _create_daily_sensors() -> tuple[SeracSensorDescription, ...]:
             name=f"Sunrise {day_name}",
             device_class=SensorDeviceClass.TIMESTAMP,
             icon="mdi:weather-sunset-up",
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("sunrise") if len(data.get("daily_forecast", [])) > idx else None,
+            value_path=("daily_forecast", day_idx, "sunrise"),
+            entity_registry_enabled_default=day_idx < DEFAULT_ENABLED_FORECAST_DAYS,
         ))
 
         # Sunset
@@ -364,7 +486,8 @@ def _create_daily_sensors() -> tuple[SeracSensorDescription, ...]:
             name=f"Sunset {day_name}",
             device_class=SensorDeviceClass.TIMESTAMP,
             icon="mdi:weather-sunset-down",
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("sunset") if len(data.get("daily_forecast", [])) > idx else None,
+            value_path=("daily_forecast", day_idx, "sunset"),
+            entity_registry_enabled_default=day_idx < DEFAULT_ENABLED_FORECAST_DAYS,
         ))
 
         # Sunshine Duration
@@ -375,7 +498,9 @@ def _create_daily_sensors() -> tuple[SeracSensorDescription, ...]:
             device_class=SensorDeviceClass.DURATION,
             state_class=SensorStateClass.MEASUREMENT,
             icon="mdi:weather-sunny",
-            value_fn=lambda data, idx=day_idx: (data.get("daily_forecast", [])[idx].get("sunshine_duration") / 3600) if len(data.get("daily_forecast", [])) > idx and data.get("daily_forecast", [])[idx].get("sunshine_duration") is not None else None,
+            value_path=("daily_forecast", day_idx, "sunshine_duration"),
+            entity_registry_enabled_default=day_idx < DEFAULT_ENABLED_FORECAST_DAYS,
+            value_transform=_seconds_to_hours,
         ))
 
         # Daylight Duration
@@ -386,7 +511,9 @@ def _create_daily_sensors() -> tuple[SeracSensorDescription, ...]:
             device_class=SensorDeviceClass.DURATION,
             state_class=SensorStateClass.MEASUREMENT,
             icon="mdi:weather-sunset",
-            value_fn=lambda data, idx=day_idx: (data.get("daily_forecast", [])[idx].get("daylight_duration") / 3600) if len(data.get("daily_forecast", [])) > idx and data.get("daily_forecast", [])[idx].get("daylight_duration") is not None else None,
+            value_path=("daily_forecast", day_idx, "daylight_duration"),
+            entity_registry_enabled_default=day_idx < DEFAULT_ENABLED_FORECAST_DAYS,
+            value_transform=_seconds_to_hours,
         ))
 
         # UV Index
@@ -395,7 +522,8 @@ def _create_daily_sensors() -> tuple[SeracSensorDescription, ...]:
             name=f"UV Index {day_name}",
             state_class=SensorStateClass.MEASUREMENT,
             icon="mdi:weather-sunny-alert",
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("uv_index") if len(data.get("daily_forecast", [])) > idx else None,
+            value_path=("daily_forecast", day_idx, "uv_index"),
+            entity_registry_enabled_default=day_idx < DEFAULT_ENABLED_FORECAST_DAYS,
         ))
 
         # Rain Sum
@@ -406,7 +534,8 @@ def _create_daily_sensors() -> tuple[SeracSensorDescription, ...]:
             device_class=SensorDeviceClass.PRECIPITATION,
             state_class=SensorStateClass.TOTAL,
             icon="mdi:weather-rainy",
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("rain_sum") if len(data.get("daily_forecast", [])) > idx else None,
+            value_path=("daily_forecast", day_idx, "rain_sum"),
+            entity_registry_enabled_default=day_idx < DEFAULT_ENABLED_FORECAST_DAYS,
         ))
 
         # Showers Sum
@@ -417,7 +546,8 @@ def _create_daily_sensors() -> tuple[SeracSensorDescription, ...]:
             device_class=SensorDeviceClass.PRECIPITATION,
             state_class=SensorStateClass.TOTAL,
             icon="mdi:weather-partly-rainy",
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("showers_sum") if len(data.get("daily_forecast", [])) > idx else None,
+            value_path=("daily_forecast", day_idx, "showers_sum"),
+            entity_registry_enabled_default=day_idx < DEFAULT_ENABLED_FORECAST_DAYS,
         ))
 
         # Snowfall Sum
@@ -428,7 +558,8 @@ def _create_daily_sensors() -> tuple[SeracSensorDescription, ...]:
             device_class=SensorDeviceClass.PRECIPITATION,
             state_class=SensorStateClass.TOTAL,
             icon="mdi:weather-snowy",
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("snowfall_sum") if len(data.get("daily_forecast", [])) > idx else None,
+            value_path=("daily_forecast", day_idx, "snowfall_sum"),
+            entity_registry_enabled_default=day_idx < DEFAULT_ENABLED_FORECAST_DAYS,
         ))
 
         # Precipitation Sum
@@ -439,7 +570,8 @@ def _create_daily_sensors() -> tuple[SeracSensorDescription, ...]:
             device_class=SensorDeviceClass.PRECIPITATION,
             state_class=SensorStateClass.TOTAL,
             icon="mdi:weather-pouring",
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("precipitation_sum") if len(data.get("daily_forecast", [])) > idx else None,
+            value_path=("daily_forecast", day_idx, "precipitation_sum"),
+            entity_registry_enabled_default=day_idx < DEFAULT_ENABLED_FORECAST_DAYS,
         ))
 
         # Precipitation Hours
@@ -450,7 +582,8 @@ def _create_daily_sensors() -> tuple[SeracSensorDescription, ...]:
             device_class=SensorDeviceClass.DURATION,
             state_class=SensorStateClass.MEASUREMENT,
             icon="mdi:clock-outline",
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("precipitation_hours") if len(data.get("daily_forecast", [])) > idx else None,
+            value_path=("daily_forecast", day_idx, "precipitation_hours"),
+            entity_registry_enabled_default=day_idx < DEFAULT_ENABLED_FORECAST_DAYS,
         ))
 
     return tuple(sensors)
@@ -531,6 +664,24 @@ BRA_SENSORS: tuple[SeracSensorDescription, ...] = (
 )
 
 
+# AROME sensor descriptions by the option group that creates them
+AROME_SENSOR_GROUPS: dict[str, tuple[SeracSensorDescription, ...]] = {
+    SENSOR_GROUP_CURRENT: CURRENT_SENSORS,
+    SENSOR_GROUP_DAILY: DAILY_SENSORS,
+    SENSOR_GROUP_AIR_QUALITY: AIR_QUALITY_CURRENT_SENSORS,
+    SENSOR_GROUP_AIR_QUALITY_DAILY: DAILY_AQI_SENSORS,
+}
+
+# Vigilance sensors: overall level and color, summary (formatted text of
+# active alerts), then one sensor per phenomenon
+VIGILANCE_SENSOR_TYPES: tuple[str, ...] = (
+    "level",
+    "color",
+    "summary",
+    *(f"phenom_{phenomenon_name}" for phenomenon_name in VIGILANCE_PHENOMENA.values()),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -543,75 +694,106 @@ async def async_setup_entry(
     latitude = entry.data[CONF_LATITUDE]
     longitude = entry.data[CONF_LONGITUDE]
 
-    # Create all sensors
-    entities = []
+    # AROME sensors: static (elevation) plus the enabled groups among current
+    # weather, daily, current and daily air quality. Their values are
+    # extracted together on each update.
+    sensor_groups = entry.data.get(CONF_SENSOR_GROUPS, DEFAULT_SENSOR_GROUPS)
+    arome_descriptions = (
+        *STATIC_SENSORS,
+        *(
+            description
+            for group, descriptions in AROME_SENSOR_GROUPS.items()
+            if group in sensor_groups
+            for description in descriptions
+        ),
+    )
+    disabled_unique_ids = {
+        f"serac_{latitude}_{longitude}_{description.key}"
+        for group, descriptions in AROME_SENSOR_GROUPS.items()
+        if group not in sensor_groups
+        for description in descriptions
+    }
+    if SENSOR_GROUP_VIGILANCE not in sensor_groups:
+        disabled_unique_ids.update(
+            f"serac_{latitude}_{longitude}_vigilance_{sensor_type}"
+            for sensor_type in VIGILANCE_SENSOR_TYPES
+        )
+    async_remove_disabled_entities(hass, entry, "sensor", disabled_unique_ids)
+    values = SensorValues(arome_descriptions)
+    entities: list[SensorEntity] = [
+        SeracSensor(
+            coordinator, description, location_name, entity_prefix, latitude, longitude, values
+        )
+        for description in arome_descriptions
+    ]
 
-    # Add static sensors (elevation)
-    for description in STATIC_SENSORS:
-        entities.append(SeracSensor(
-            coordinator, description, location_name, entity_prefix, latitude, longitude
-        ))
+    # Add BRA (avalanche) sensors for each massif
+    def bra_sensors(bra_coordinators: dict[int, BraCoordinator]) -> list[BraSensor]:
+        return [
+            BraSensor(
+                bra_coordinator, description, location_name, entity_prefix, latitude, longitude, massif_id, bra_coordinator.massif_name
+            )
+            for massif_id, bra_coordinator in bra_coordinators.items()
+            for description in BRA_SENSORS
+        ]
+
+    entities.extend(bra_sensors(hass.data[DOMAIN][entry.entry_id].get("bra_coordinators", {})))
+
+    # Massifs added from the options flow without reloading the entry
+    @callback
+    def add_bra_sensors(bra_coordinators: dict[int, BraCoordinator]) -> None:
+        async_add_entities(bra_sensors(bra_coordinators))
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_BRA_COORDINATORS_ADDED.format(entry.entry_id), add_bra_sensors
+        )
+    )
 
-    # Add current weather sensors
-    for description in CURRENT_SENSORS:
-        entities.append(SeracSensor(
-            coordinator, description, location_name, entity_prefix, latitude, longitude
-        ))
+    # Add Vigilance (weather alert) sensors if coordinator exists
+    vigilance_coordinator = hass.data[DOMAIN][entry.entry_id].get("vigilance_coordinator")
+    if vigilance_coordinator:
+        entities.extend(
+            VigilanceSensor(
+                vigilance_coordinator, location_name, entity_prefix, latitude, longitude, sensor_type
+            )
+            for sensor_type in VIGILANCE_SENSOR_TYPES
+        )
 
-    # Add daily sensors
-    for description in DAILY_SENSORS:
-        entities.append(SeracSensor(
-            coordinator, description, location_name, entity_prefix, latitude, longitude
-        ))
+    async_add_entities(entities)
 
-    # Add current air quality sensors
-    for description in AIR_QUALITY_CURRENT_SENSORS:
-        entities.append(SeracSensor(
-            coordinator, description, location_name, entity_prefix, latitude, longitude
-        ))
 
-    # Add daily air quality sensors
-    for description in DAILY_AQI_SENSORS:
-        entities.append(SeracSensor(
-            coordinator, description, location_name, entity_prefix, latitude, longitude
-        ))
+class _CachedValueMixin(ABC):
+    """Compute a coordinator sensor's value once per coordinator update.
 
-    # Add BRA (avalanche) sensors for each massif
-    bra_coordinators = hass.data[DOMAIN][entry.entry_id].get("bra_coordinators", {})
-    for massif_id, bra_coordinator in bra_coordinators.items():
-        massif_name = bra_coordinator.massif_name
-        for description in BRA_SENSORS:
-            entities.append(BraSensor(
-                bra_coordinator, description, location_name, entity_prefix, latitude, longitude, massif_id, massif_name
-            ))
+    native_value is read several times per state write (availability checks
+    it too), so the value computed by _compute_native_value is kept until the
+    coordinator delivers new data.
+    """
 
-    # Add Vigilance (weather alert) sensors if coordinator exists
-    vigilance_coordinator = hass.data[DOMAIN][entry.entry_id].get("vigilance_coordinator")
-    if vigilance_coordinator:
-        # Add overall level and color sensors
-        entities.append(VigilanceSensor(
-            vigilance_coordinator, location_name, entity_prefix, latitude, longitude, "level"
-        ))
-        entities.append(VigilanceSensor(
-            vigilance_coordinator, location_name, entity_prefix, latitude, longitude, "color"
-        ))
+    _value: StateType = None
+    _value_valid = False
 
-        # Add summary sensor (formatted text of active alerts)
-        entities.append(VigilanceSensor(
-            vigilance_coordinator, location_name, entity_prefix, latitude, longitude, "summary"
-        ))
+    @abstractmethod
+    def _compute_native_value(self) -> StateType:
+        """Compute the state of the sensor from the coordinator data."""
 
-        # Add individual phenomenon sensors
-        from .const import VIGILANCE_PHENOMENA
-        for phenomenon_name in VIGILANCE_PHENOMENA.values():
-            entities.append(VigilanceSensor(
-                vigilance_coordinator, location_name, entity_prefix, latitude, longitude, f"phenom_{phenomenon_name}"
-            ))
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        if not self._value_valid:
+            self._value = self._compute_native_value()
+            self._value_valid = True
+        return self._value
 
-    async_add_entities(entities, True)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop the cached value before writing the new state."""
+        self._value_valid = False
+        super()._handle_coordinator_update()
 
 
-class SeracSensor(CoordinatorEntity[AromeCoordinator], SensorEntity):
+class SeracSensor(_CachedValueMixin, CoordinatorEntity[AromeCoordinator], SensorEntity):
     """Sensor entity for Serac integration."""
 
     entity_description: SeracSensorDescription
@@ -626,6 +808,7 @@ class SeracSensor(CoordinatorEntity[AromeCoordinator], SensorEntity):
         entity_prefix: str,
         latitude: float,
         longitude: float,
+        values: SensorValues | None = None,
     ) -> None:
         """Initialize the sensor.
 
@@ -636,9 +819,14 @@ class SeracSensor(CoordinatorEntity[AromeCoordinator], SensorEntity):
             entity_prefix: Prefix for entity ID
             latitude: Location latitude
             longitude: Location longitude
+            values: Shared extraction of the coordinator's sensor values
         """
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=frozenset({description.data_key}) if description.data_key else None,
+        )
         self.entity_description = description
+        self._values = values
         self._location_name = location_name
         self._entity_prefix = entity_prefix
         self._latitude = latitude
@@ -665,12 +853,14 @@ class SeracSensor(CoordinatorEntity[AromeCoordinator], SensorEntity):
             entry_type=DeviceEntryType.SERVICE,
         )
 
-    @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
+    def _compute_native_value(self) -> StateType:
+        """Compute the state of the sensor from the coordinator data."""
         if not self.coordinator.data:
             return None
 
+        if self._values is not None:
+            return self._values.get(self.coordinator.data, self.entity_description.key)
+
         value = self.entity_description.value_fn(self.coordinator.data)
 
         # Handle datetime objects
@@ -679,6 +869,11 @@ class SeracSensor(CoordinatorEntity[AromeCoordinator], SensorEntity):
 
         return value
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra state attributes (data_age while its section is stale)."""
+        return self.coordinator.stale_attributes_for(self.coordinator_context)
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
@@ -686,7 +881,7 @@ class SeracSensor(CoordinatorEntity[AromeCoordinator], SensorEntity):
         return self.coordinator.last_update_success and self.native_value is not None
 
 
-class BraSensor(CoordinatorEntity[BraCoordinator], SensorEntity):
+class BraSensor(_CachedValueMixin, CoordinatorEntity[BraCoordinator], SensorEntity):
     """Sensor entity for BRA avalanche bulletins."""
 
     entity_description: SeracSensorDescription
@@ -748,13 +943,12 @@ class BraSensor(CoordinatorEntity[BraCoordinator], SensorEntity):
         if hasattr(self.entity_description, "extra_attributes_fn") and self.entity_description.extra_attributes_fn is not None:
             attrs = self.entity_description.extra_attributes_fn(self.coordinator.data)
             if attrs:
-                return attrs
+                return {**attrs, **self.coordinator.stale_attributes}
 
-        return {}
+        return self.coordinator.stale_attributes
 
-    @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
+    def _compute_native_value(self) -> StateType:
+        """Compute the state of the sensor from the coordinator data."""
         if not self.coordinator.data:
             return None
 
@@ -784,7 +978,7 @@ class BraSensor(CoordinatorEntity[BraCoordinator], SensorEntity):
         return True
 
 
-class VigilanceSensor(CoordinatorEntity, SensorEntity):
+class VigilanceSensor(_CachedValueMixin, CoordinatorEntity, SensorEntity):
     """Sensor entity for Météo-France Vigilance weather alerts."""
 
     _attr_has_entity_name = False
@@ -916,11 +1110,11 @@ class VigilanceSensor(CoordinatorEntity, SensorEntity):
                 attrs["alert_count"] = 0
                 attrs["highest_level"] = 1
 
+        attrs.update(self.coordinator.stale_attributes)
         return attrs
 
-    @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
+    def _compute_native_value(self) -> StateType:
+        """Compute the state of the sensor from the coordinator data."""
         if not self.coordinator.data or not self.coordinator.data.get("has_data"):
             return None
 
@@ -1,7 +1,19 @@
 """Utility functions for Serac integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+import operator
 import re
+from typing import Any
 import unicodedata
 
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+_LOGGER = logging.getLogger(__name__)
+
 
 def sanitize_entity_id_part(text: str) -> str:
     """Sanitize text for use in entity IDs.
@@ -29,3 +41,49 @@ def sanitize_entity_id_part(text: str) -> str:
     text = text.strip('_')
 
     return text
+
+
+def compile_value_path(path: tuple[str | int, ...]) -> Callable[[Any], Any]:
+    """Compile a path of keys and indexes into a getter.
+
+    ``compile_value_path(("daily_forecast", 2, "uv_index"))`` returns a function
+    reading ``data["daily_forecast"][2]["uv_index"]``, or None as soon as a step
+    is missing (unknown key, index out of range or None on the way).
+
+    Args:
+        path: Keys (for mappings) and indexes (for sequences) to follow
+
+    Returns:
+        Getter taking the root data
+    """
+    getters = tuple(operator.itemgetter(step) for step in path)
+
+    def get(data: Any) -> Any:
+        value = data
+        try:
+            for getter in getters:
+                value = getter(value)
+        except (KeyError, IndexError, TypeError):
+            return None
+        return value
+
+    return get
+
+
+@callback
+def async_remove_disabled_entities(
+    hass: HomeAssistant, entry: ConfigEntry, domain: str, unique_ids: set[str]
+) -> None:
+    """Remove the registry entries of entities whose group was turned off.
+
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry
+        domain: Platform of the entities (sensor, binary_sensor)
+        unique_ids: Unique IDs of the entities that are no longer created
+    """
+    entity_registry = er.async_get(hass)
+    for entity_entry in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
+        if entity_entry.domain == domain and entity_entry.unique_id in unique_ids:
+            _LOGGER.debug("Removing entity of disabled group: %s", entity_entry.entity_id)
+            entity_registry.async_remove(entity_entry.entity_id)
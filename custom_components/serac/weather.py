@@ -28,19 +28,22 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfLength,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceResponse, SupportsResponse
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     ATTRIBUTION,
+    CONF_COMPACT_ATTRIBUTES,
     CONF_ENTITY_PREFIX,
     CONF_LOCATION_NAME,
+    DEFAULT_COMPACT_ATTRIBUTES,
     DOMAIN,
     MANUFACTURER,
 )
-from .coordinator import AromeCoordinator
+from .coordinator import SECTION_AIR_QUALITY, SECTION_FORECAST, AromeCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -57,9 +60,30 @@ async def async_setup_entry(
     latitude = entry.data[CONF_LATITUDE]
     longitude = entry.data[CONF_LONGITUDE]
 
+    compact_attributes = entry.data.get(
+        CONF_COMPACT_ATTRIBUTES, DEFAULT_COMPACT_ATTRIBUTES
+    )
+
     async_add_entities(
-        [SeracWeather(coordinator, location_name, entity_prefix, latitude, longitude)],
-        True,
+        [
+            SeracWeather(
+                coordinator,
+                location_name,
+                entity_prefix,
+                latitude,
+                longitude,
+                compact_attributes,
+            )
+        ]
+    )
+
+    # Detailed forecast on demand, for compact attributes
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        "get_forecast_details",
+        {},
+        "async_get_forecast_details",
+        supports_response=SupportsResponse.ONLY,
     )
 
 
@@ -71,6 +95,11 @@ class SeracWeather(CoordinatorEntity[AromeCoordinator], WeatherEntity):
     _attr_native_pressure_unit = UnitOfPressure.HPA
     _attr_native_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_native_wind_speed_unit = UnitOfSpeed.KILOMETERS_PER_HOUR
+    # Section fetch times change with every new response: not worth a new
+    # attributes row in the recorder each time
+    _unrecorded_attributes = frozenset(
+        {f"{SECTION_FORECAST}_updated", f"{SECTION_AIR_QUALITY}_updated"}
+    )
     _attr_supported_features = (
         WeatherEntityFeature.FORECAST_DAILY | WeatherEntityFeature.FORECAST_HOURLY
     )
@@ -82,6 +111,7 @@ class SeracWeather(CoordinatorEntity[AromeCoordinator], WeatherEntity):
         entity_prefix: str,
         latitude: float,
         longitude: float,
+        compact_attributes: bool = DEFAULT_COMPACT_ATTRIBUTES,
     ) -> None:
         """Initialize the weather entity.
 
@@ -91,8 +121,30 @@ class SeracWeather(CoordinatorEntity[AromeCoordinator], WeatherEntity):
             entity_prefix: Prefix for entity ID
             latitude: Location latitude
             longitude: Location longitude
+            compact_attributes: Leave forecasts out of the state attributes
         """
-        super().__init__(coordinator)
+        # Full attributes read every data key; compact ones skip the 6h table
+        super().__init__(
+            coordinator,
+            context=(
+                frozenset(
+                    {
+                        "current",
+                        "daily_forecast",
+                        "hourly_forecast",
+                        "elevation",
+                        "air_quality",
+                        "updated",
+                    }
+                )
+                if compact_attributes
+                else None
+            ),
+        )
+        self._compact_attributes = compact_attributes
+        # Attributes built from _attributes_data (see extra_state_attributes)
+        self._attributes_data: dict[str, Any] | None = None
+        self._attributes: dict[str, Any] = {}
         self._location_name = location_name
         self._entity_prefix = entity_prefix
         self._latitude = latitude
@@ -192,12 +244,42 @@ class SeracWeather(CoordinatorEntity[AromeCoordinator], WeatherEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
+        """Return additional state attributes.
+
+        Built once per coordinator update. With compact attributes, only the
+        current conditions are included: forecasts are available from the
+        weather.get_forecasts and serac.get_forecast_details services. While
+        a section it reads is stale, data_age (minutes) is added.
+        """
+        data = self.coordinator.data
+        if not data:
+            return {}
+
+        if data is not self._attributes_data:
+            self._attributes_data = data
+            self._attributes = self._current_attributes(data)
+            if not self._compact_attributes:
+                self._attributes.update(self._forecast_attributes(data))
+        stale = self.coordinator.stale_attributes_for(self.coordinator_context)
+        return {**self._attributes, **stale} if stale else self._attributes
+
+    async def async_get_forecast_details(self) -> ServiceResponse:
+        """Return the detailed forecast attributes (serac.get_forecast_details)."""
         if not self.coordinator.data:
             return {}
+        return self._forecast_attributes(self.coordinator.data)
+
+    def _current_attributes(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Return the location, current weather and air quality attributes.
 
+        Args:
+            data: Coordinator data
+
+        Returns:
+            Attribute dictionary
+        """
         # Base attributes
-        elevation = self.coordinator.data.get("elevation")
+        elevation = data.get("elevation")
         attrs = {
             "elevation": f"{elevation}m" if elevation is not None else None,
             "latitude": self._latitude,
@@ -206,7 +288,7 @@ class SeracWeather(CoordinatorEntity[AromeCoordinator], WeatherEntity):
         }
 
         # Add current weather data
-        current = self.coordinator.data.get("current", {})
+        current = data.get("current", {})
         if current:
             temp = current.get("temperature")
             attrs["current_temperature"] = f"{temp}°C" if temp is not None else None
@@ -240,8 +322,47 @@ class SeracWeather(CoordinatorEntity[AromeCoordinator], WeatherEntity):
             cloud = current.get("cloud_coverage")
             attrs["current_cloud_coverage"] = f"{cloud}%" if cloud is not None else None
 
+        # Add current air quality data
+        air_quality = data.get("air_quality", {})
+        current_aqi = air_quality.get("current", {})
+        if current_aqi:
+            aqi = current_aqi.get("european_aqi")
+            attrs["current_european_aqi"] = f"{aqi} EAQI" if aqi is not None else None
+
+            pm25 = current_aqi.get("pm2_5")
+            attrs["current_pm2_5"] = f"{pm25}µg/m³" if pm25 is not None else None
+
+            pm10 = current_aqi.get("pm10")
+            attrs["current_pm10"] = f"{pm10}µg/m³" if pm10 is not None else None
+
+            no2 = current_aqi.get("nitrogen_dioxide")
+            attrs["current_nitrogen_dioxide"] = f"{no2}µg/m³" if no2 is not None else None
+
+            o3 = current_aqi.get("ozone")
+            attrs["current_ozone"] = f"{o3}µg/m³" if o3 is not None else None
+
+            so2 = current_aqi.get("sulphur_dioxide")
+            attrs["current_sulphur_dioxide"] = f"{so2}µg/m³" if so2 is not None else None
+
+        # When each section was fetched (a failed section keeps older values)
+        for section, fetched_at in data.get("updated", {}).items():
+            attrs[f"{section}_updated"] = fetched_at.isoformat()
+
+        return attrs
+
+    def _forecast_attributes(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Return the daily, 6-hour and air quality forecast attributes.
+
+        Args:
+            data: Coordinator data
+
+        Returns:
+            Attribute dictionary
+        """
+        attrs: dict[str, Any] = {}
+
         # Add daily data for days 0, 1, 2
-        daily_forecast = self.coordinator.data.get("daily_forecast", [])
+        daily_forecast = data.get("daily_forecast", [])
         day_names = ["today", "tomorrow", "day_2"]
 
         for day_idx in range(min(3, len(daily_forecast))):
@@ -291,7 +412,7 @@ class SeracWeather(CoordinatorEntity[AromeCoordinator], WeatherEntity):
             attrs[f"{day_name}_precipitation_hours"] = f"{precip_hours}h" if precip_hours is not None else None
 
         # Add hourly forecast for next 6 hours
-        hourly_6h = self.coordinator.data.get("hourly_6h", [])
+        hourly_6h = data.get("hourly_6h", [])
         for i, hour_data in enumerate(hourly_6h, start=1):
             prefix = f"hour_{i}"
             attrs[f"{prefix}_datetime"] = hour_data.get("datetime").isoformat() if hour_data.get("datetime") else None
@@ -365,29 +486,8 @@ class SeracWeather(CoordinatorEntity[AromeCoordinator], WeatherEntity):
             precip_hours = day_data.get("precipitation_hours")
             attrs[f"{prefix}_precipitation_hours"] = f"{precip_hours}h" if precip_hours is not None else None
 
-        # Add current air quality data
-        air_quality = self.coordinator.data.get("air_quality", {})
-        current_aqi = air_quality.get("current", {})
-        if current_aqi:
-            aqi = current_aqi.get("european_aqi")
-            attrs["current_european_aqi"] = f"{aqi} EAQI" if aqi is not None else None
-
-            pm25 = current_aqi.get("pm2_5")
-            attrs["current_pm2_5"] = f"{pm25}µg/m³" if pm25 is not None else None
-
-            pm10 = current_aqi.get("pm10")
-            attrs["current_pm10"] = f"{pm10}µg/m³" if pm10 is not None else None
-
-            no2 = current_aqi.get("nitrogen_dioxide")
-            attrs["current_nitrogen_dioxide"] = f"{no2}µg/m³" if no2 is not None else None
-
-            o3 = current_aqi.get("ozone")
-            attrs["current_ozone"] = f"{o3}µg/m³" if o3 is not None else None
-
-            so2 = current_aqi.get("sulphur_dioxide")
-            attrs["current_sulphur_dioxide"] = f"{so2}µg/m³" if so2 is not None else None
-
         # Add daily air quality forecast (next 5 days)
+        air_quality = data.get("air_quality", {})
         daily_aqi = air_quality.get("daily_forecast", [])
         aqi_day_names = ["today", "tomorrow", "day_2", "day_3", "day_4"]
 
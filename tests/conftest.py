@@ -3,15 +3,37 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from custom_components.serac.api.rate_limiter import _LIMITERS
+from custom_components.serac.circuit_breaker import _BREAKERS
+
 
 @pytest.fixture
 def mock_hass():
     """Mock Home Assistant instance."""
     hass = MagicMock()
     hass.data = {}
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
     return hass
 
 
+@pytest.fixture(autouse=True)
+def mock_clientsession():
+    """Avoid creating a real aiohttp session from the mocked hass."""
+    with patch(
+        "custom_components.serac.config_flow.async_get_clientsession",
+        return_value=MagicMock(),
+    ) as mock_get_session:
+        yield mock_get_session
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_state():
+    """Start every test with closed circuits and empty rate limiters."""
+    yield
+    _BREAKERS.clear()
+    _LIMITERS.clear()
+
+
 @pytest.fixture
 def mock_config_entry():
     """Mock config entry."""
@@ -71,6 +93,14 @@ def mock_openmeteo_client():
         "elevation": 1035,
     })
 
+    client.async_get_forecast = AsyncMock(return_value={
+        "current": client.async_get_current_weather.return_value,
+        "daily_forecast": client.async_get_daily_forecast.return_value,
+        "hourly_forecast": client.async_get_hourly_forecast.return_value,
+        "hourly_6h": client.async_get_hourly_6h.return_value,
+        "elevation": 1035,
+    })
+
     return client
 
 
@@ -0,0 +1,111 @@
+"""Tests for the BRA API client."""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.serac.api.bra_client import BraClient
+
+BULLETIN_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<BULLETINS_NEIGE_AVALANCHE MASSIF="MONT-BLANC" DATEBULLETIN="2026-01-15T16:00:00">
+  <CARTOUCHERISQUE>
+    <RISQUE RISQUE1="3" RISQUE2="2" ALTITUDE="2200" RISQUEMAXI="3" RISQUEMAXIJ2="2" COMMENTAIRE=""/>
+    <RESUME>Stable</RESUME>
+  </CARTOUCHERISQUE>
+</BULLETINS_NEIGE_AVALANCHE>
+"""
+
+
+class _FakeResponse:
+    """Minimal aiohttp response used as an async context manager."""
+
+    def __init__(self, status, text="", headers=None):
+        self.status = status
+        self._text = text
+        self.headers = headers or {}
+
+    async def text(self):
+        return self._text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+def _session(*responses):
+    """Build a session whose get() returns the given responses in order."""
+    session = MagicMock()
+    session.get = MagicMock(side_effect=list(responses))
+    return session
+
+
+class TestConditionalRequests:
+    """Test ETag/Last-Modified handling."""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_reuses_bulletin(self):
+        """Test a 304 response returns the previously parsed bulletin."""
+        session = _session(
+            _FakeResponse(200, BULLETIN_XML, {"ETag": '"abc"', "Last-Modified": "Thu, 15 Jan 2026 16:00:00 GMT"}),
+            _FakeResponse(304),
+        )
+        client = BraClient("key", 3, session=session)
+
+        first = await client.async_get_bulletin()
+        second = await client.async_get_bulletin()
+
+        assert first["risk_max"] == 3
+        assert second is first
+        headers = session.get.call_args_list[1].kwargs["headers"]
+        assert headers["If-None-Match"] == '"abc"'
+        assert headers["If-Modified-Since"] == "Thu, 15 Jan 2026 16:00:00 GMT"
+        assert "If-None-Match" not in session.get.call_args_list[0].kwargs["headers"]
+
+    @pytest.mark.asyncio
+    async def test_restored_validators_are_sent(self):
+        """Test a client seeded from the cache sends a conditional request."""
+        session = _session(_FakeResponse(200, BULLETIN_XML, {"ETag": '"abc"'}))
+        client = BraClient("key", 3, session=session)
+        bulletin = await client.async_get_bulletin()
+        validators = client.validators
+        assert validators["etag"] == '"abc"'
+
+        # After a restart, a new client is seeded from the cache
+        session = _session(_FakeResponse(304))
+        client = BraClient("key", 3, session=session)
+        client.restore(bulletin, validators)
+
+        assert await client.async_get_bulletin() is bulletin
+        assert session.get.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+        assert client.validators == validators
+
+    @pytest.mark.asyncio
+    async def test_unchanged_body_is_not_parsed(self):
+        """Test an identical body without validators skips XML parsing."""
+        session = _session(
+            _FakeResponse(200, BULLETIN_XML),
+            _FakeResponse(200, BULLETIN_XML),
+        )
+        client = BraClient("key", 3, session=session)
+
+        first = await client.async_get_bulletin()
+        with patch.object(BraClient, "_parse_bulletin_xml") as mock_parse:
+            second = await client.async_get_bulletin()
+
+        mock_parse.assert_not_called()
+        assert second is first
+
+    @pytest.mark.asyncio
+    async def test_changed_body_is_parsed(self):
+        """Test a new bulletin replaces the cached one."""
+        session = _session(
+            _FakeResponse(200, BULLETIN_XML),
+            _FakeResponse(200, BULLETIN_XML.replace('RISQUEMAXI="3"', 'RISQUEMAXI="4"')),
+        )
+        client = BraClient("key", 3, session=session)
+
+        await client.async_get_bulletin()
+        second = await client.async_get_bulletin()
+
+        assert second["risk_max"] == 4
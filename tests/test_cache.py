@@ -0,0 +1,97 @@
+"""Tests for the Serac response cache."""
+from datetime import timedelta
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.serac.cache import (
+    ResponseCache,
+    _CacheStore,
+    bra_key,
+    location_key,
+    vigilance_key,
+)
+from homeassistant.util import dt as dt_util
+
+
+def _cache(entries=None):
+    """Return a loaded-on-demand cache whose store holds the given entries."""
+    cache = ResponseCache(MagicMock())
+    cache._store = MagicMock()
+    cache._store.async_load = AsyncMock(
+        return_value={"entries": entries} if entries is not None else None
+    )
+    return cache
+
+
+class TestResponseCache:
+    """Test ResponseCache."""
+
+    @pytest.mark.asyncio
+    async def test_load_drops_expired_entries(self):
+        """Test entries older than the maximum age are not loaded."""
+        now = time.time()
+        cache = _cache(
+            {
+                "recent": {"fetched_at": now - 60, "data": 1},
+                "ancient": {"fetched_at": now - 7 * 86400, "data": 2},
+            }
+        )
+
+        await cache.async_load()
+        await cache.async_load()
+
+        assert cache.get("recent") == 1
+        assert cache.get("ancient") is None
+        cache._store.async_load.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_load_empty_store(self):
+        """Test a missing cache file loads as empty."""
+        cache = _cache()
+        await cache.async_load()
+        assert cache.get("anything") is None
+
+    @pytest.mark.asyncio
+    async def test_get_respects_max_age(self):
+        """Test callers can require a recent response."""
+        cache = _cache({"key": {"fetched_at": time.time() - 3600, "data": "x"}})
+        await cache.async_load()
+
+        assert cache.get("key", timedelta(hours=2)) == "x"
+        assert cache.get("key", timedelta(minutes=30)) is None
+        assert cache.get("key") == "x"
+        assert cache.fetched_at("key") is not None
+        assert cache.fetched_at("missing") is None
+
+    def test_set_schedules_save(self):
+        """Test new responses are written to disk with a delay."""
+        cache = _cache()
+        cache.async_set("key", {"a": 1})
+
+        assert cache.get("key", timedelta(seconds=5)) == {"a": 1}
+        cache._store.async_delay_save.assert_called_once()
+        saved = cache._store.async_delay_save.call_args.args[0]()
+        assert saved["entries"]["key"]["data"] == {"a": 1}
+
+    def test_set_with_fetch_time(self):
+        """Test a response fetched earlier keeps its own fetch time."""
+        cache = _cache()
+        fetched_at = dt_util.utcnow() - timedelta(hours=2)
+        cache.async_set("key", {"a": 1}, fetched_at)
+
+        assert cache.fetched_at("key") == fetched_at
+        assert cache.get("key", timedelta(hours=1)) is None
+
+    @pytest.mark.asyncio
+    async def test_other_version_is_discarded(self):
+        """Test a cache written by another version is dropped."""
+        store = _CacheStore(MagicMock(), 1, "serac.cache")
+        assert await store._async_migrate_func(0, 1, {"entries": {"k": {}}}) == {}
+
+    def test_keys(self):
+        """Test cache keys identify the source and the location."""
+        assert location_key("openmeteo", 45.92371, 6.8694) == "openmeteo:45.9237,6.8694"
+        assert bra_key(3) == "bra:3"
+        assert vigilance_key("74") == "vigilance:74"
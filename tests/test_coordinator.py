@@ -1,16 +1,76 @@
 """Tests for Serac coordinators."""
 import asyncio
-from unittest.mock import AsyncMock, patch
+from datetime import datetime, timedelta
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
 import pytest
+from yarl import URL
 
+from custom_components.serac.api.bra_client import BraApiError
+from custom_components.serac.api.openmeteo_client import (
+    ModelRun,
+    OpenMeteoApiError,
+    OpenMeteoClient,
+)
+from custom_components.serac.api.vigilance_client import VigilanceApiError
+from custom_components.serac.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    get_circuit_breaker,
+)
+from custom_components.serac.const import (
+    AROME_STALE_MAX_AGE,
+    AROME_UPDATE_INTERVAL,
+    BRA_STALE_MAX_AGE,
+    CIRCUIT_BREAKER_THRESHOLD,
+    STALE_RETRY_INTERVAL,
+    VIGILANCE_STALE_MAX_AGE,
+    VIGILANCE_UPDATE_INTERVAL,
+)
 from custom_components.serac.coordinator import (
     AromeCoordinator,
     BraCoordinator,
+    ForecastBatchCoordinator,
+    VigilanceCoordinator,
     async_retry_with_backoff,
+    bra_in_season,
+    bra_refresh_interval,
+    model_run_refresh_interval,
 )
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .test_cache import _cache
+from .test_openmeteo_client import _forecast_response
+
+PARIS = dt_util.get_time_zone("Europe/Paris")
+
+
+def _model_run(available: datetime, update_interval: timedelta = timedelta(hours=1)) -> ModelRun:
+    """Build a model run that became available at the given time."""
+    return ModelRun(
+        initialisation=available - timedelta(hours=2),
+        available=available,
+        update_interval=update_interval,
+    )
+
+
+def _http_error(status: int, headers: dict | None = None) -> aiohttp.ClientResponseError:
+    """Build the error raise_for_status raises for a response status."""
+    request_info = aiohttp.RequestInfo(
+        URL("https://api.example.com"), "GET", CIMultiDictProxy(CIMultiDict())
+    )
+    return aiohttp.ClientResponseError(
+        request_info, (), status=status, headers=CIMultiDict(headers or {})
+    )
+
+
+async def _call_without_retry(func, **kwargs):
+    """Await the wrapped call directly, bypassing retry delays."""
+    return await func()
 
 
 class TestRetryLogic:
@@ -49,9 +109,7 @@ class TestRetryLogic:
     @pytest.mark.asyncio
     async def test_no_retry_on_auth_error(self):
         """Test no retry on 401 auth error."""
-        error = aiohttp.ClientResponseError(
-            request_info=None, history=None, status=401
-        )
+        error = _http_error(401)
         mock_func = AsyncMock(side_effect=error)
         with pytest.raises(aiohttp.ClientResponseError):
             await async_retry_with_backoff(
@@ -62,9 +120,19 @@ class TestRetryLogic:
     @pytest.mark.asyncio
     async def test_retry_on_server_error(self):
         """Test retry on 503 server error."""
-        error = aiohttp.ClientResponseError(
-            request_info=None, history=None, status=503
+        error = _http_error(503)
+        mock_func = AsyncMock(side_effect=[error, "success"])
+        result = await async_retry_with_backoff(
+            mock_func, max_retries=2, initial_delay=0.01, context="Test call"
         )
+        assert result == "success"
+        assert mock_func.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_wrapped_client_error(self):
+        """Test API errors raised from aiohttp errors are retried."""
+        error = OpenMeteoApiError("Network error")
+        error.__cause__ = aiohttp.ClientError("Connection reset")
         mock_func = AsyncMock(side_effect=[error, "success"])
         result = await async_retry_with_backoff(
             mock_func, max_retries=2, initial_delay=0.01, context="Test call"
@@ -72,6 +140,111 @@ class TestRetryLogic:
         assert result == "success"
         assert mock_func.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_no_retry_on_wrapped_not_found(self):
+        """Test API errors raised from a 404 response are not retried."""
+        error = BraApiError("Failed to get bulletin: 404")
+        error.__cause__ = _http_error(404)
+        mock_func = AsyncMock(side_effect=error)
+        with pytest.raises(BraApiError):
+            await async_retry_with_backoff(
+                mock_func, max_retries=2, initial_delay=0.01, context="Test call"
+            )
+        assert mock_func.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_after_is_honoured(self):
+        """Test a short Retry-After sets the delay, a long one fails at once."""
+        mock_func = AsyncMock(side_effect=[_http_error(429, {"Retry-After": "2"}), "success"])
+        with patch(
+            "custom_components.serac.coordinator.asyncio.sleep", new=AsyncMock()
+        ) as sleep:
+            assert await async_retry_with_backoff(mock_func, context="Test call") == "success"
+        assert 2 <= sleep.call_args.args[0] <= 3
+
+        mock_func = AsyncMock(side_effect=_http_error(503, {"Retry-After": "3600"}))
+        with pytest.raises(aiohttp.ClientResponseError):
+            await async_retry_with_backoff(mock_func, context="Test call")
+        assert mock_func.call_count == 1
+
+
+class TestCircuitBreaker:
+    """Test the circuit breakers shared by every config entry."""
+
+    @pytest.mark.asyncio
+    async def test_opens_after_repeated_failures(self):
+        """Test an upstream failing repeatedly is no longer called."""
+        failing = AsyncMock(side_effect=aiohttp.ClientError("Connection refused"))
+        for _ in range(CIRCUIT_BREAKER_THRESHOLD):
+            with pytest.raises(aiohttp.ClientError):
+                await async_retry_with_backoff(
+                    failing, max_retries=1, initial_delay=0, context="Test call", upstream="test"
+                )
+        assert failing.call_count == 2 * CIRCUIT_BREAKER_THRESHOLD
+
+        other = AsyncMock(return_value="success")
+        with pytest.raises(CircuitOpenError):
+            await async_retry_with_backoff(other, context="Other call", upstream="test")
+        other.assert_not_called()
+        assert get_circuit_breaker("test").is_open
+
+    @pytest.mark.asyncio
+    async def test_counts_failed_calls_not_attempts(self):
+        """Test a call failing every retry counts as a single failure."""
+        failing = AsyncMock(side_effect=aiohttp.ClientError("Connection refused"))
+        for _ in range(CIRCUIT_BREAKER_THRESHOLD - 1):
+            with pytest.raises(aiohttp.ClientError):
+                await async_retry_with_backoff(
+                    failing, max_retries=3, initial_delay=0, context="Test call", upstream="test"
+                )
+        assert failing.call_count == 4 * (CIRCUIT_BREAKER_THRESHOLD - 1)
+        assert not get_circuit_breaker("test").is_open
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_is_not_retried(self):
+        """Test a probe call failing reopens the circuit without retrying."""
+        breaker = get_circuit_breaker("test")
+        breaker._open_until = time.monotonic() - 1
+        failing = AsyncMock(side_effect=aiohttp.ClientError("Connection refused"))
+        with pytest.raises(aiohttp.ClientError):
+            await async_retry_with_backoff(
+                failing, max_retries=3, initial_delay=0, context="Test call", upstream="test"
+            )
+        assert failing.call_count == 1
+        assert breaker.is_open
+
+    @pytest.mark.asyncio
+    async def test_probe_after_cooldown(self):
+        """Test one probe call goes out after the cool-down and closes the circuit."""
+        breaker = CircuitBreaker("test", threshold=1, cooldown=60)
+        breaker.record_failure()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        with patch(
+            "custom_components.serac.circuit_breaker.time.monotonic",
+            return_value=time.monotonic() + 61,
+        ):
+            breaker.before_call()
+            # Other calls keep failing fast while the probe is in flight
+            with pytest.raises(CircuitOpenError):
+                breaker.before_call()
+            breaker.record_success()
+            breaker.before_call()
+
+        assert not breaker.is_open
+
+    def test_retry_after_opens_circuit(self):
+        """Test a Retry-After response opens the circuit for that long."""
+        breaker = CircuitBreaker("test", threshold=5, cooldown=60)
+        breaker.record_failure(retry_after=120)
+        assert breaker.is_open
+        with patch(
+            "custom_components.serac.circuit_breaker.time.monotonic",
+            return_value=time.monotonic() + 90,
+        ):
+            assert breaker.is_open
+
 
 class TestAromeCoordinator:
     """Test AromeCoordinator."""
@@ -91,7 +264,7 @@ class TestAromeCoordinator:
         # Mock retry function to bypass delays
         with patch(
             "custom_components.serac.coordinator.async_retry_with_backoff",
-            side_effect=lambda func, **kwargs: func(),
+            new=_call_without_retry,
         ):
             data = await coordinator._async_update_data()
 
@@ -102,9 +275,16 @@ class TestAromeCoordinator:
         assert "elevation" in data
         assert "air_quality" in data
 
-        # Verify API calls were made
-        mock_openmeteo_client.async_get_current_weather.assert_called_once()
-        mock_openmeteo_client.async_get_daily_forecast.assert_called_once()
+        assert "hourly_6h" in data
+        assert data["elevation"] == 1035
+
+        # Verify a single combined forecast request was made
+        mock_openmeteo_client.async_get_forecast.assert_called_once()
+        mock_openmeteo_client.async_get_current_weather.assert_not_called()
+        mock_openmeteo_client.async_get_daily_forecast.assert_not_called()
+        mock_openmeteo_client.async_get_hourly_forecast.assert_not_called()
+        mock_openmeteo_client.async_get_hourly_6h.assert_not_called()
+        mock_openmeteo_client.async_get_additional_data.assert_not_called()
         mock_airquality_client.async_get_air_quality.assert_called_once()
 
     @pytest.mark.asyncio
@@ -119,7 +299,7 @@ class TestAromeCoordinator:
 
         with patch(
             "custom_components.serac.coordinator.async_retry_with_backoff",
-            side_effect=lambda func, **kwargs: func(),
+            new=_call_without_retry,
         ):
             data = await coordinator._async_update_data()
 
@@ -137,7 +317,7 @@ class TestAromeCoordinator:
 
         # Simulate API error
         error = aiohttp.ClientError("Network error")
-        mock_openmeteo_client.async_get_current_weather = AsyncMock(side_effect=error)
+        mock_openmeteo_client.async_get_forecast = AsyncMock(side_effect=error)
 
         with pytest.raises(UpdateFailed):
             with patch(
@@ -147,6 +327,417 @@ class TestAromeCoordinator:
                 await coordinator._async_update_data()
 
 
+class TestAromeSections:
+    """Test keeping the last good value of a failed section."""
+
+    @pytest.mark.asyncio
+    async def test_air_quality_failure_keeps_last_good(
+        self, mock_hass, mock_openmeteo_client, mock_airquality_client
+    ):
+        """Test a failed air quality fetch keeps its values and is retried alone."""
+        coordinator = AromeCoordinator(
+            hass=mock_hass,
+            client=mock_openmeteo_client,
+            location_name="Test Location",
+            airquality_client=mock_airquality_client,
+        )
+
+        with patch(
+            "custom_components.serac.coordinator.async_retry_with_backoff",
+            new=_call_without_retry,
+        ):
+            coordinator.data = await coordinator._async_update_data()
+            fetched_at = coordinator.data["updated"]["air_quality"]
+
+            mock_airquality_client.async_get_air_quality.side_effect = aiohttp.ClientError("down")
+            coordinator.data = await coordinator._async_update_data()
+            assert coordinator.data["air_quality"] == {"european_aqi": 25, "pm2_5": 8.5, "pm10": 12.0}
+            assert coordinator.data["updated"]["air_quality"] == fetched_at
+            assert coordinator.update_interval == STALE_RETRY_INTERVAL
+
+            # The retry only fetches the failed section
+            mock_airquality_client.async_get_air_quality.side_effect = None
+            coordinator.data = await coordinator._async_update_data()
+
+        assert mock_openmeteo_client.async_get_forecast.call_count == 2
+        assert mock_airquality_client.async_get_air_quality.call_count == 3
+        assert coordinator.data["updated"]["air_quality"] > fetched_at
+        assert coordinator.update_interval == AROME_UPDATE_INTERVAL
+
+    @pytest.mark.asyncio
+    async def test_air_quality_failure_only_flags_its_entities(
+        self, mock_hass, mock_openmeteo_client, mock_airquality_client
+    ):
+        """Test a failing section only reports data_age to the entities reading it."""
+        coordinator = AromeCoordinator(
+            hass=mock_hass,
+            client=mock_openmeteo_client,
+            location_name="Test Location",
+            airquality_client=mock_airquality_client,
+        )
+
+        with patch(
+            "custom_components.serac.coordinator.async_retry_with_backoff",
+            new=_call_without_retry,
+        ):
+            coordinator.data = await coordinator._async_update_data()
+            aq_fetched_at = coordinator.data["updated"]["air_quality"]
+            coordinator._sections["air_quality"] = (
+                coordinator._sections["air_quality"][0],
+                aq_fetched_at - AROME_STALE_MAX_AGE,
+            )
+
+            # Too old to be served, but its age is still reported
+            mock_airquality_client.async_get_air_quality.side_effect = aiohttp.ClientError("down")
+            coordinator.data = await coordinator._async_update_data()
+
+        assert coordinator.data["air_quality"] == {}
+        assert coordinator.stale_attributes_for(frozenset({"current"})) == {}
+        assert coordinator.section_data_age("forecast") is None
+        assert coordinator.stale_attributes_for(frozenset({"air_quality"})) == {
+            "data_age": AROME_STALE_MAX_AGE.total_seconds() // 60
+        }
+        assert coordinator.stale_attributes_for(None) == {
+            "data_age": AROME_STALE_MAX_AGE.total_seconds() // 60
+        }
+
+    @pytest.mark.asyncio
+    async def test_forecast_failure_keeps_last_good(self, mock_hass, mock_openmeteo_client):
+        """Test a failed forecast is served from the last good response for a while."""
+        mock_openmeteo_client.async_get_forecast.return_value = {
+            **OpenMeteoClient.parse_forecast(_forecast_response()),
+            "payload": _forecast_response(),
+        }
+        coordinator = AromeCoordinator(
+            hass=mock_hass,
+            client=mock_openmeteo_client,
+            location_name="Test Location",
+        )
+
+        with patch(
+            "custom_components.serac.coordinator.async_retry_with_backoff",
+            new=_call_without_retry,
+        ):
+            coordinator.data = await coordinator._async_update_data()
+
+            mock_openmeteo_client.async_get_forecast.side_effect = OpenMeteoApiError("down")
+            data = await coordinator._async_update_data()
+            assert data["elevation"] == 1035.0
+            assert data["updated"] == coordinator.data["updated"]
+
+            with patch(
+                "custom_components.serac.coordinator.dt_util.utcnow",
+                return_value=dt_util.utcnow() + AROME_STALE_MAX_AGE + timedelta(minutes=1),
+            ), pytest.raises(UpdateFailed):
+                await coordinator._async_update_data()
+
+
+class TestAromeCache:
+    """Test caching and restoring weather responses."""
+
+    @pytest.mark.asyncio
+    async def test_successful_update_caches_responses(
+        self, mock_hass, mock_openmeteo_client, mock_airquality_client
+    ):
+        """Test live responses are written to the cache."""
+        forecast = dict(mock_openmeteo_client.async_get_forecast.return_value)
+        mock_openmeteo_client.async_get_forecast.return_value = {**forecast, "payload": _forecast_response()}
+        cache = _cache()
+        coordinator = AromeCoordinator(
+            hass=mock_hass,
+            client=mock_openmeteo_client,
+            location_name="Test Location",
+            airquality_client=mock_airquality_client,
+            cache=cache,
+        )
+
+        with patch(
+            "custom_components.serac.coordinator.async_retry_with_backoff",
+            new=_call_without_retry,
+        ):
+            coordinator.data = await coordinator._async_update_data()
+
+        assert cache.get(coordinator._forecast_key) == _forecast_response()
+        assert cache.get(coordinator._air_quality_key) == coordinator.data["air_quality"]
+        assert "payload" not in coordinator.data
+
+    @pytest.mark.asyncio
+    async def test_first_refresh_uses_fresh_cache(
+        self, mock_hass, mock_openmeteo_client, mock_airquality_client
+    ):
+        """Test a reload is served from the cache without network calls."""
+        cache = _cache()
+        coordinator = AromeCoordinator(
+            hass=mock_hass,
+            client=mock_openmeteo_client,
+            location_name="Test Location",
+            airquality_client=mock_airquality_client,
+            cache=cache,
+        )
+        cache.async_set(coordinator._forecast_key, _forecast_response())
+        cache.async_set(coordinator._air_quality_key, {"european_aqi": 30})
+        cache._entries[coordinator._forecast_key]["fetched_at"] -= 600
+
+        with patch(
+            "custom_components.serac.coordinator.async_retry_with_backoff",
+            new=_call_without_retry,
+        ):
+            coordinator.data = await coordinator._async_update_data()
+            assert coordinator.data["elevation"] == 1035.0
+            assert coordinator.data["air_quality"] == {"european_aqi": 30}
+            # Sections keep the time the cached responses were fetched
+            assert coordinator.data["updated"] == {
+                "forecast": cache.fetched_at(coordinator._forecast_key),
+                "air_quality": cache.fetched_at(coordinator._air_quality_key),
+            }
+            mock_openmeteo_client.async_get_forecast.assert_not_called()
+            mock_airquality_client.async_get_air_quality.assert_not_called()
+
+            # Later refreshes always fetch
+            await coordinator._async_update_data()
+            mock_openmeteo_client.async_get_forecast.assert_called_once()
+            mock_airquality_client.async_get_air_quality.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_restore_and_keep_on_failure(self, mock_hass, mock_openmeteo_client):
+        """Test restored data is kept after a failed refresh while recent enough."""
+        cache = _cache(
+            {
+                "openmeteo:45.9237,6.8694": {
+                    # Too old for a normal refresh, still fine to serve stale
+                    "fetched_at": time.time() - 7200,
+                    "data": _forecast_response(),
+                }
+            }
+        )
+        await cache.async_load()
+        coordinator = AromeCoordinator(
+            hass=mock_hass,
+            client=mock_openmeteo_client,
+            location_name="Test Location",
+            cache=cache,
+        )
+
+        assert await coordinator.async_restore_from_cache() is True
+        assert coordinator.data["elevation"] == 1035.0
+        assert len(coordinator.data["hourly_forecast"]) == 48
+
+        mock_openmeteo_client.async_get_forecast = AsyncMock(
+            side_effect=OpenMeteoApiError("down")
+        )
+        with patch(
+            "custom_components.serac.coordinator.async_retry_with_backoff",
+            new=_call_without_retry,
+        ):
+            data = await coordinator._async_update_data()
+
+        assert data["elevation"] == 1035.0
+        assert coordinator.stale is True
+        assert 119 <= coordinator.data_age.total_seconds() // 60 <= 120
+
+    @pytest.mark.asyncio
+    async def test_old_restored_data_not_kept(self, mock_hass, mock_openmeteo_client):
+        """Test restored data older than the stale limit is dropped on failure."""
+        cache = _cache(
+            {
+                "openmeteo:45.9237,6.8694": {
+                    # Fine for fast start, too old to serve after a failure
+                    "fetched_at": time.time() - 86400,
+                    "data": _forecast_response(),
+                }
+            }
+        )
+        await cache.async_load()
+        coordinator = AromeCoordinator(
+            hass=mock_hass,
+            client=mock_openmeteo_client,
+            location_name="Test Location",
+            cache=cache,
+        )
+
+        assert await coordinator.async_restore_from_cache() is True
+
+        mock_openmeteo_client.async_get_forecast = AsyncMock(
+            side_effect=OpenMeteoApiError("down")
+        )
+        with patch(
+            "custom_components.serac.coordinator.async_retry_with_backoff",
+            new=_call_without_retry,
+        ), pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
+    @pytest.mark.asyncio
+    async def test_restore_without_cached_forecast(self, mock_hass, mock_openmeteo_client):
+        """Test nothing is restored when the cache is empty."""
+        coordinator = AromeCoordinator(
+            hass=mock_hass,
+            client=mock_openmeteo_client,
+            location_name="Test Location",
+            cache=_cache(),
+        )
+
+        assert await coordinator.async_restore_from_cache() is False
+        assert coordinator.data is None
+
+
+class TestForecastBatchCoordinator:
+    """Test ForecastBatchCoordinator."""
+
+    @pytest.mark.asyncio
+    async def test_batch_fans_out_to_locations(self, mock_hass, mock_openmeteo_client):
+        """Test registered locations use the batched forecast."""
+        batch_client = MagicMock()
+        batch_client.async_get_forecasts = AsyncMock(
+            return_value={(45.9237, 6.8694): _forecast_response()}
+        )
+        batch_client.async_get_model_run = AsyncMock(
+            side_effect=OpenMeteoApiError("down")
+        )
+        batch = ForecastBatchCoordinator(mock_hass, batch_client)
+        coordinator = AromeCoordinator(
+            hass=mock_hass,
+            client=mock_openmeteo_client,
+            location_name="Test Location",
+            batch=batch,
+        )
+        batch._members.add(coordinator)
+
+        with patch(
+            "custom_components.serac.coordinator.async_retry_with_backoff",
+            new=_call_without_retry,
+        ):
+            batch.data = await batch._async_update_data()
+            with patch.object(
+                OpenMeteoClient, "parse_forecast", wraps=OpenMeteoClient.parse_forecast
+            ) as parse_forecast:
+                data = await coordinator._async_update_data()
+                again = await coordinator._async_update_data()
+
+        batch_client.async_get_forecasts.assert_called_once_with([(45.9237, 6.8694)])
+        mock_openmeteo_client.async_get_forecast.assert_not_called()
+        assert data["elevation"] == 1035
+        # The batched response is parsed again on every refresh, so the
+        # hourly forecast keeps starting from the current hour
+        assert parse_forecast.call_count == 2
+        # Both refreshes report when the batch was fetched, not when they ran
+        assert data["updated"] == {"forecast": batch.data_fetched_at}
+        assert again["updated"] == data["updated"]
+
+    @pytest.mark.asyncio
+    async def test_batch_payload_cached_with_its_fetch_time(
+        self, mock_hass, mock_openmeteo_client
+    ):
+        """Test a reused batch response is cached as old as it is."""
+        batch_client = MagicMock()
+        batch_client.async_get_forecasts = AsyncMock(
+            return_value={(45.9237, 6.8694): _forecast_response()}
+        )
+        batch_client.async_get_model_run = AsyncMock(
+            side_effect=OpenMeteoApiError("down")
+        )
+        batch = ForecastBatchCoordinator(mock_hass, batch_client)
+        cache = _cache()
+        coordinator = AromeCoordinator(
+            hass=mock_hass,
+            client=mock_openmeteo_client,
+            location_name="Test Location",
+            batch=batch,
+            cache=cache,
+        )
+        batch._members.add(coordinator)
+
+        with patch(
+            "custom_components.serac.coordinator.async_retry_with_backoff",
+            new=_call_without_retry,
+        ):
+            batch.data = await batch._async_update_data()
+            batch.data_fetched_at -= timedelta(hours=2)
+            await coordinator._async_update_data()
+
+        assert cache.fetched_at("openmeteo:45.9237,6.8694") == batch.data_fetched_at
+        assert cache.get("openmeteo:45.9237,6.8694", AROME_UPDATE_INTERVAL) is None
+
+    @pytest.mark.asyncio
+    async def test_missing_location_falls_back(self, mock_hass, mock_openmeteo_client):
+        """Test a location absent from the batch fetches its own forecast."""
+        batch = ForecastBatchCoordinator(mock_hass, MagicMock())
+        coordinator = AromeCoordinator(
+            hass=mock_hass,
+            client=mock_openmeteo_client,
+            location_name="Test Location",
+            batch=batch,
+        )
+
+        with patch(
+            "custom_components.serac.coordinator.async_retry_with_backoff",
+            new=_call_without_retry,
+        ):
+            await coordinator._async_update_data()
+
+        mock_openmeteo_client.async_get_forecast.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_same_model_run_is_not_fetched_again(
+        self, mock_hass, mock_openmeteo_client
+    ):
+        """Test the forecast is only fetched when a new model run is available."""
+        payload = _forecast_response()
+        batch_client = MagicMock()
+        batch_client.async_get_forecasts = AsyncMock(
+            return_value={(45.9237, 6.8694): payload}
+        )
+        run = _model_run(dt_util.utcnow() - timedelta(minutes=30))
+        batch_client.async_get_model_run = AsyncMock(return_value=run)
+        batch = ForecastBatchCoordinator(mock_hass, batch_client)
+        batch._members.add(
+            AromeCoordinator(
+                hass=mock_hass,
+                client=mock_openmeteo_client,
+                location_name="Test Location",
+                batch=batch,
+            )
+        )
+
+        with patch(
+            "custom_components.serac.coordinator.async_retry_with_backoff",
+            new=_call_without_retry,
+        ):
+            batch.data = await batch._async_update_data()
+            assert timedelta(minutes=39) < batch.update_interval <= timedelta(minutes=40)
+
+            # Same run: the previous data is returned without a request
+            assert await batch._async_update_data() is batch.data
+            batch_client.async_get_forecasts.assert_called_once()
+            assert batch.get_payload((45.9237, 6.8694)) is payload
+
+            # New run: fetched again
+            batch_client.async_get_model_run.return_value = _model_run(dt_util.utcnow())
+            await batch._async_update_data()
+            assert batch_client.async_get_forecasts.call_count == 2
+
+
+class TestModelRunRefreshInterval:
+    """Test scheduling of forecast refreshes around model runs."""
+
+    def test_waits_for_next_run(self):
+        """Test the next check is shortly after the next run is expected."""
+        now = datetime(2026, 2, 12, 10, 0, tzinfo=dt_util.UTC)
+        run = _model_run(now - timedelta(minutes=20))
+        assert model_run_refresh_interval(now, run) == timedelta(minutes=50)
+
+    def test_polls_when_run_is_late(self):
+        """Test a late run is polled for."""
+        now = datetime(2026, 2, 12, 10, 0, tzinfo=dt_util.UTC)
+        run = _model_run(now - timedelta(hours=2))
+        assert model_run_refresh_interval(now, run) == timedelta(minutes=15)
+
+    def test_wait_is_capped(self):
+        """Test models updated rarely are still checked regularly."""
+        now = datetime(2026, 2, 12, 10, 0, tzinfo=dt_util.UTC)
+        run = _model_run(now, update_interval=timedelta(hours=12))
+        assert model_run_refresh_interval(now, run) == timedelta(hours=3)
+
+
 class TestBraCoordinator:
     """Test BraCoordinator."""
 
@@ -163,7 +754,7 @@ class TestBraCoordinator:
 
         with patch(
             "custom_components.serac.coordinator.async_retry_with_backoff",
-            side_effect=lambda func, **kwargs: func(),
+            new=_call_without_retry,
         ):
             data = await coordinator._async_update_data()
 
@@ -193,7 +784,7 @@ class TestBraCoordinator:
 
         with patch(
             "custom_components.serac.coordinator.async_retry_with_backoff",
-            side_effect=lambda func, **kwargs: func(),
+            new=_call_without_retry,
         ):
             data = await coordinator._async_update_data()
 
@@ -221,3 +812,275 @@ class TestBraCoordinator:
                 side_effect=error,
             ):
                 await coordinator._async_update_data()
+
+
+    @pytest.mark.asyncio
+    async def test_first_refresh_uses_cached_bulletin(self, mock_hass, mock_bra_client):
+        """Test a cached bulletin is reused until its next scheduled refresh."""
+        cache = _cache()
+        cached = {"has_data": True, "bulletin_date": "cached"}
+        validators = {"etag": '"abc"', "last_modified": None, "content_hash": "0f"}
+        cache.async_set("bra:1", {"bulletin": cached, "validators": validators})
+        mock_bra_client.validators = {"etag": '"def"', "last_modified": None, "content_hash": "1e"}
+        coordinator = BraCoordinator(
+            hass=mock_hass,
+            client=mock_bra_client,
+            location_name="Test Location",
+            massif_id=1,
+            massif_name="Chablais",
+            cache=cache,
+        )
+
+        # Fetched just now: no refresh is due yet
+        with patch(
+            "custom_components.serac.coordinator.bra_refresh_interval",
+            return_value=timedelta(hours=1),
+        ):
+            data = await coordinator._async_update_data()
+        assert data["bulletin_date"] == "cached"
+        mock_bra_client.async_get_bulletin.assert_not_called()
+        # The client's next download is conditional on the cached validators
+        mock_bra_client.restore.assert_called_once_with(cached, validators)
+
+        # Once the scheduled refresh has passed, the API is called again
+        with patch(
+            "custom_components.serac.coordinator.bra_refresh_interval",
+            return_value=timedelta(0),
+        ), patch(
+            "custom_components.serac.coordinator.async_retry_with_backoff",
+            new=_call_without_retry,
+        ):
+            coordinator.data = None
+            data = await coordinator._async_update_data()
+        assert data["massif_name"] == "Aravis"
+        assert cache.get("bra:1") == {
+            "bulletin": data,
+            "validators": {"etag": '"def"', "last_modified": None, "content_hash": "1e"},
+        }
+
+
+class TestStaleData:
+    """Test serving the last good data while updates fail."""
+
+    @pytest.mark.asyncio
+    async def test_failure_serves_stale_data(self, mock_hass, mock_bra_client):
+        """Test a failed update keeps the bulletin, flags its age and backs off."""
+        coordinator = BraCoordinator(
+            hass=mock_hass,
+            client=mock_bra_client,
+            location_name="Test Location",
+            massif_id=1,
+            massif_name="Chablais",
+        )
+
+        with patch(
+            "custom_components.serac.coordinator.async_retry_with_backoff",
+            new=_call_without_retry,
+        ):
+            coordinator.data = await coordinator._async_update_data()
+            assert coordinator.stale_attributes == {}
+
+            mock_bra_client.async_get_bulletin.side_effect = BraApiError("down")
+            coordinator.data_fetched_at -= timedelta(minutes=90)
+            with patch.object(coordinator, "async_update_listeners") as update_listeners:
+                data = await coordinator._async_update_data()
+            assert data["massif_name"] == "Aravis"
+            assert coordinator.stale_attributes == {"data_age": 90}
+            assert coordinator.update_interval == STALE_RETRY_INTERVAL
+            # Listeners are told even though the bulletin did not change
+            update_listeners.assert_called_once()
+
+            await coordinator._async_update_data()
+            assert coordinator.update_interval == STALE_RETRY_INTERVAL * 2
+
+            mock_bra_client.async_get_bulletin.side_effect = None
+            await coordinator._async_update_data()
+
+        assert coordinator.stale is False
+        assert coordinator.stale_attributes == {}
+
+    @pytest.mark.asyncio
+    async def test_too_old_data_is_not_served(self, mock_hass, mock_bra_client):
+        """Test the update fails once the data is older than its tolerance."""
+        coordinator = BraCoordinator(
+            hass=mock_hass,
+            client=mock_bra_client,
+            location_name="Test Location",
+            massif_id=1,
+            massif_name="Chablais",
+        )
+
+        with patch(
+            "custom_components.serac.coordinator.async_retry_with_backoff",
+            new=_call_without_retry,
+        ):
+            coordinator.data = await coordinator._async_update_data()
+            mock_bra_client.async_get_bulletin.side_effect = BraApiError("down")
+            coordinator.data_fetched_at -= BRA_STALE_MAX_AGE + timedelta(minutes=1)
+
+            with pytest.raises(UpdateFailed):
+                await coordinator._async_update_data()
+
+        assert coordinator.stale is False
+
+    @pytest.mark.asyncio
+    async def test_vigilance_tolerance_counts_from_scheduled_refresh(self, mock_hass):
+        """Test alerts are served for at most an hour past their refresh."""
+        client = MagicMock(_latitude=45.9237, _longitude=6.8694, _department="74")
+        client.async_get_current_vigilance = AsyncMock(
+            return_value={"has_data": True, "department": "74", "phenomena": {}}
+        )
+        coordinator = VigilanceCoordinator(
+            hass=mock_hass, client=client, location_name="Test Location"
+        )
+
+        with patch(
+            "custom_components.serac.coordinator.async_retry_with_backoff",
+            new=_call_without_retry,
+        ):
+            coordinator.data = await coordinator._async_update_data()
+            client.async_get_current_vigilance.side_effect = VigilanceApiError("down")
+
+            coordinator.data_fetched_at -= VIGILANCE_UPDATE_INTERVAL
+            data = await coordinator._async_update_data()
+            assert data["department"] == "74"
+            assert coordinator.stale is True
+
+            coordinator.data_fetched_at -= VIGILANCE_STALE_MAX_AGE
+            with pytest.raises(UpdateFailed):
+                await coordinator._async_update_data()
+
+
+class TestBraRefreshInterval:
+    """Test the publication-aware BRA schedule."""
+
+    def test_waits_for_window_before_publication(self):
+        """Test a morning refresh sleeps until shortly before 16:00."""
+        now = datetime(2026, 1, 15, 9, 0, tzinfo=PARIS)
+        bulletin = {"has_data": True, "bulletin_date": "2026-01-14T16:00:00"}
+
+        assert bra_refresh_interval(now, bulletin) == timedelta(hours=6)
+        now = datetime(2026, 1, 15, 13, 0, tzinfo=PARIS)
+        assert bra_refresh_interval(now, bulletin) == timedelta(hours=2, minutes=45)
+
+    def test_polls_densely_in_window(self):
+        """Test polling every 15 minutes until today's bulletin appears."""
+        now = datetime(2026, 1, 15, 16, 5, tzinfo=PARIS)
+        bulletin = {"has_data": True, "bulletin_date": "2026-01-14T16:00:00"}
+
+        assert bra_refresh_interval(now, bulletin) == timedelta(minutes=15)
+        assert bra_refresh_interval(now, None) == timedelta(minutes=15)
+
+    def test_sleeps_until_tomorrow_once_published(self):
+        """Test no polling once today's bulletin has been fetched."""
+        now = datetime(2026, 1, 15, 16, 10, tzinfo=PARIS)
+        bulletin = {"has_data": True, "bulletin_date": "2026-01-15T16:00:00"}
+
+        assert bra_refresh_interval(now, bulletin) == timedelta(hours=23, minutes=35)
+
+    def test_out_of_season_probes_daily(self):
+        """Test an empty bulletin is only probed at the next window."""
+        now = datetime(2026, 7, 1, 18, 0, tzinfo=PARIS)
+
+        assert bra_refresh_interval(now, {"has_data": False}) == timedelta(hours=21, minutes=45)
+
+    def test_dst_change(self):
+        """Test the delay accounts for the spring DST change."""
+        now = datetime(2026, 3, 28, 16, 10, tzinfo=PARIS)
+        bulletin = {"has_data": True, "bulletin_date": "2026-03-28T16:00:00"}
+
+        assert bra_refresh_interval(now, bulletin) == timedelta(hours=22, minutes=35)
+
+
+class TestBraSeason:
+    """Test out-of-season dormancy."""
+
+    def test_bra_in_season(self):
+        """Test the bulletin season spans December to May."""
+        assert bra_in_season(datetime(2026, 1, 15, 12, 0, tzinfo=PARIS))
+        assert bra_in_season(datetime(2026, 12, 1, 0, 30, tzinfo=PARIS))
+        assert not bra_in_season(datetime(2026, 7, 15, 12, 0, tzinfo=PARIS))
+
+    def test_start_dormant(self, mock_hass, mock_bra_client):
+        """Test starting dormant holds an empty bulletin until the next window."""
+        coordinator = BraCoordinator(
+            hass=mock_hass,
+            client=mock_bra_client,
+            location_name="Test Location",
+            massif_id=1,
+            massif_name="Chablais",
+        )
+
+        coordinator.async_start_dormant()
+
+        assert coordinator.dormant is True
+        assert coordinator.data == {"has_data": False}
+        assert coordinator.update_interval <= timedelta(days=1)
+        mock_bra_client.async_get_bulletin.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_wakes_up_when_bulletin_returns(self, mock_hass, mock_bra_client):
+        """Test a published bulletin ends dormancy."""
+        coordinator = BraCoordinator(
+            hass=mock_hass,
+            client=mock_bra_client,
+            location_name="Test Location",
+            massif_id=1,
+            massif_name="Chablais",
+        )
+        coordinator.async_start_dormant()
+
+        with patch(
+            "custom_components.serac.coordinator.async_retry_with_backoff",
+            new=_call_without_retry,
+        ):
+            await coordinator._async_update_data()
+
+        assert coordinator.dormant is False
+
+
+class TestListenerFiltering:
+    """Test listeners are only notified of changes to the data they read."""
+
+    def test_only_changed_sections_are_notified(self, mock_hass, mock_openmeteo_client):
+        """Test a listener is skipped when its data keys did not change."""
+        coordinator = AromeCoordinator(
+            hass=mock_hass,
+            client=mock_openmeteo_client,
+            location_name="Test Location",
+        )
+        current_listener = MagicMock()
+        air_quality_listener = MagicMock()
+        other_listener = MagicMock()
+        with patch.object(coordinator, "_schedule_refresh"):
+            coordinator.async_add_listener(current_listener, frozenset({"current"}))
+            coordinator.async_add_listener(air_quality_listener, frozenset({"air_quality"}))
+            coordinator.async_add_listener(other_listener)
+
+        coordinator.data = {"current": {"temperature": 1}, "air_quality": {}}
+        coordinator.async_update_listeners()
+        assert current_listener.call_count == 1
+        assert air_quality_listener.call_count == 1
+
+        coordinator.data = {"current": {"temperature": 2}, "air_quality": {}}
+        coordinator.async_update_listeners()
+        assert current_listener.call_count == 2
+        assert air_quality_listener.call_count == 1
+        assert other_listener.call_count == 2
+
+        # A stale section keeps notifying its listeners (data_age changes)
+        coordinator.stale = True
+        coordinator._failed_sections = {"air_quality"}
+        coordinator._sections = {"air_quality": ({}, dt_util.utcnow())}
+        coordinator.async_update_listeners()
+        assert current_listener.call_count == 2
+        assert air_quality_listener.call_count == 2
+        coordinator.stale = False
+        coordinator._failed_sections = set()
+        coordinator.async_update_listeners()
+        assert air_quality_listener.call_count == 3
+
+        # Losing availability notifies everyone
+        coordinator.last_update_success = False
+        coordinator.async_update_listeners()
+        assert air_quality_listener.call_count == 4
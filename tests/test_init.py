@@ -0,0 +1,231 @@
+"""Tests for Serac integration setup helpers."""
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.serac import (
+    _configured_massifs,
+    async_first_refresh_concurrently,
+    async_reload_entry,
+)
+from custom_components.serac.const import DOMAIN
+
+
+@pytest.fixture
+def mock_entry():
+    """Config entry whose background tasks run on the test loop."""
+    entry = MagicMock()
+    tasks = []
+
+    def create_task(hass, target, name):
+        tasks.append(asyncio.ensure_future(target))
+        return tasks[-1]
+
+    create_task.tasks = tasks
+    entry.async_create_background_task = MagicMock(side_effect=create_task)
+    return entry
+
+
+def _coordinator(delay: float = 0, error: Exception | None = None) -> MagicMock:
+    """Build a coordinator whose refresh sleeps then optionally fails."""
+
+    async def refresh():
+        await asyncio.sleep(delay)
+        coordinator.last_update_success = error is None
+        coordinator.last_exception = error
+
+    coordinator = MagicMock()
+    coordinator.async_refresh = AsyncMock(side_effect=refresh)
+    coordinator.async_config_entry_first_refresh = AsyncMock()
+    return coordinator
+
+
+class TestConcurrentFirstRefresh:
+    """Test concurrent startup refreshes."""
+
+    @pytest.mark.asyncio
+    async def test_refreshes_run_concurrently(self, mock_hass, mock_entry):
+        """Test setup waits for the slowest refresh, not the sum."""
+        coordinators = {f"BRA {i}": _coordinator(delay=0.05) for i in range(4)}
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        failed = await async_first_refresh_concurrently(
+            mock_hass, mock_entry, "Test", coordinators
+        )
+
+        assert failed == set()
+        assert loop.time() - start < 0.15
+        for coordinator in coordinators.values():
+            coordinator.async_refresh.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failures_are_reported(self, mock_hass, mock_entry):
+        """Test failed refreshes are returned without failing the others."""
+        coordinators = {
+            "BRA Chablais": _coordinator(),
+            "Vigilance": _coordinator(error=RuntimeError("boom")),
+        }
+
+        failed = await async_first_refresh_concurrently(
+            mock_hass, mock_entry, "Test", coordinators
+        )
+
+        assert failed == {"Vigilance"}
+
+    @pytest.mark.asyncio
+    async def test_deadline_leaves_refresh_in_background(self, mock_hass, mock_entry):
+        """Test setup stops waiting after the startup deadline."""
+        slow = _coordinator(delay=0.2)
+
+        failed = await async_first_refresh_concurrently(
+            mock_hass,
+            mock_entry,
+            "Test",
+            {"BRA Chablais": slow, "Vigilance": _coordinator()},
+            timeout=timedelta(seconds=0.02),
+        )
+
+        slow_task = mock_entry.async_create_background_task.side_effect.tasks[0]
+        assert failed == set()
+        assert not slow_task.done()
+        await slow_task
+        # Finishing in the background never raises ConfigEntryNotReady
+        slow.async_config_entry_first_refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fast_start_failure_stays_in_background(
+        self, mock_hass, mock_entry
+    ):
+        """Test a refresh failing after setup stopped waiting is only retried."""
+        failing = _coordinator(delay=0.01, error=RuntimeError("boom"))
+
+        failed = await async_first_refresh_concurrently(
+            mock_hass,
+            mock_entry,
+            "Test",
+            {"Vigilance": failing},
+            timeout=timedelta(0),
+        )
+        await mock_entry.async_create_background_task.side_effect.tasks[0]
+
+        assert failed == set()
+        failing.async_refresh.assert_awaited_once()
+        failing.async_config_entry_first_refresh.assert_not_called()
+
+
+class TestIncrementalReload:
+    """Test applying options changes without a full reload."""
+
+    @pytest.fixture
+    def setup_entry(self, mock_hass, mock_config_entry):
+        """Entry set up with BRA coordinators for massifs 1 and 2."""
+        mock_hass.config_entries.async_reload = AsyncMock()
+        coordinators = {}
+        for massif_id in (1, 2):
+            coordinators[massif_id] = MagicMock(massif_name=f"Massif {massif_id}")
+            coordinators[massif_id].async_shutdown = AsyncMock()
+        mock_hass.data[DOMAIN] = {
+            mock_config_entry.entry_id: {
+                "config": dict(mock_config_entry.data),
+                "arome_coordinator": MagicMock(),
+                "bra_coordinators": coordinators,
+            }
+        }
+        return mock_config_entry
+
+    @pytest.mark.asyncio
+    async def test_token_change_reloads(self, mock_hass, setup_entry):
+        """Test changes other than the massif selection reload the entry."""
+        setup_entry.data = {**setup_entry.data, "vigilance_token": "new"}
+
+        await async_reload_entry(mock_hass, setup_entry)
+
+        mock_hass.config_entries.async_reload.assert_awaited_once_with(
+            setup_entry.entry_id
+        )
+
+    @pytest.mark.asyncio
+    async def test_massif_change_is_incremental(self, mock_hass, setup_entry):
+        """Test only the BRA coordinators of changed massifs are touched."""
+        entry_data = mock_hass.data[DOMAIN][setup_entry.entry_id]
+        arome_coordinator = entry_data["arome_coordinator"]
+        removed = entry_data["bra_coordinators"][2]
+        kept = entry_data["bra_coordinators"][1]
+        setup_entry.data = {**setup_entry.data, "massif_ids": ["1", "3"]}
+
+        with patch(
+            "custom_components.serac.async_get_clientsession",
+            return_value=MagicMock(),
+        ), patch(
+            "custom_components.serac.async_cleanup_removed_massifs", new=AsyncMock()
+        ) as cleanup, patch(
+            "custom_components.serac.bra_in_season", return_value=False
+        ), patch(
+            "custom_components.serac.async_dispatcher_send"
+        ) as dispatcher_send:
+            await async_reload_entry(mock_hass, setup_entry)
+
+        mock_hass.config_entries.async_reload.assert_not_called()
+        removed.async_shutdown.assert_awaited_once()
+        cleanup.assert_awaited_once()
+        bra_coordinators = entry_data["bra_coordinators"]
+        assert set(bra_coordinators) == {1, 3}
+        assert bra_coordinators[1] is kept
+        assert bra_coordinators[3].dormant is True
+        assert entry_data["arome_coordinator"] is arome_coordinator
+        added = dispatcher_send.call_args.args[2]
+        assert list(added) == [3]
+
+    @pytest.mark.asyncio
+    async def test_added_massif_is_refreshed(self, mock_hass, setup_entry):
+        """Test massifs added to a loaded entry get a plain refresh."""
+        setup_entry.data = {**setup_entry.data, "massif_ids": ["1", "2", "3", "4"]}
+        created = {}
+
+        def create_coordinators(hass, entry, massif_ids):
+            for massif_id in massif_ids:
+                coordinator = MagicMock(massif_name=f"Massif {massif_id}")
+                coordinator.async_refresh = AsyncMock()
+                coordinator.async_config_entry_first_refresh = AsyncMock()
+                coordinator.last_update_success = massif_id == 3
+                created[massif_id] = coordinator
+            return dict(created)
+
+        with patch(
+            "custom_components.serac._create_bra_coordinators",
+            side_effect=create_coordinators,
+        ), patch(
+            "custom_components.serac.async_cleanup_removed_massifs", new=AsyncMock()
+        ), patch(
+            "custom_components.serac.bra_in_season", return_value=True
+        ), patch(
+            "custom_components.serac.async_dispatcher_send"
+        ) as dispatcher_send:
+            await async_reload_entry(mock_hass, setup_entry)
+
+        for coordinator in created.values():
+            coordinator.async_refresh.assert_awaited_once()
+            coordinator.async_config_entry_first_refresh.assert_not_called()
+        # The massif whose refresh failed is left out, as during setup
+        added = dispatcher_send.call_args.args[2]
+        assert list(added) == [3]
+        bra_coordinators = mock_hass.data[DOMAIN][setup_entry.entry_id][
+            "bra_coordinators"
+        ]
+        assert set(bra_coordinators) == {1, 2, 3}
+
+
+class TestSensorGroups:
+    """Test sensor groups turned off in the options flow."""
+
+    def test_avalanche_group_disables_massifs(self):
+        """Test no massif is set up while the avalanche group is off."""
+        entry = MagicMock()
+        entry.data = {"massif_ids": ["1", "3"]}
+        assert _configured_massifs(entry) == ["1", "3"]
+
+        entry.data = {"massif_ids": ["1", "3"], "sensor_groups": ["current", "daily"]}
+        assert _configured_massifs(entry) == []
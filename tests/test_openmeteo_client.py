@@ -0,0 +1,278 @@
+"""Tests for the Open-Meteo API client."""
+import asyncio
+from datetime import datetime, timedelta, timezone
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.serac.api.forecast_table import ForecastTable
+from custom_components.serac.api.openmeteo_client import (
+    OpenMeteoApiError,
+    OpenMeteoBatchClient,
+    OpenMeteoClient,
+)
+from custom_components.serac.api.session import async_read_json
+
+
+def _forecast_response() -> dict:
+    """Build a combined forecast response starting at local midnight."""
+    now = datetime.now()
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    hours = 8 * 24
+    hourly_times = [(midnight + timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M") for i in range(hours)]
+    daily_times = [(midnight + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(8)]
+
+    hourly_fields = (
+        "temperature_2m", "precipitation", "cloud_cover", "wind_speed_10m",
+        "wind_gusts_10m", "wind_direction_10m", "snowfall", "rain",
+    )
+    daily_fields = (
+        "temperature_2m_max", "temperature_2m_min", "precipitation_sum",
+        "wind_speed_10m_max", "wind_gusts_10m_max", "wind_direction_10m_dominant",
+        "sunshine_duration", "daylight_duration", "uv_index_max", "rain_sum",
+        "showers_sum", "snowfall_sum", "precipitation_hours",
+    )
+
+    return {
+        "elevation": 1035.0,
+        "current": {
+            "time": now.strftime("%Y-%m-%dT%H:%M"),
+            "temperature_2m": 3.2,
+            "cloud_cover": 10,
+            "is_day": 1,
+        },
+        "hourly": {
+            "time": hourly_times,
+            "weather_code": [3] * hours,
+            **{field: [float(i) for i in range(hours)] for field in hourly_fields},
+        },
+        "daily": {
+            "time": daily_times,
+            "weather_code": [0] * 8,
+            "sunrise": [f"{day}T07:30" for day in daily_times],
+            "sunset": [f"{day}T17:30" for day in daily_times],
+            **{field: [float(i) for i in range(8)] for field in daily_fields},
+        },
+    }
+
+
+class TestParseForecast:
+    """Test slicing of the combined forecast response."""
+
+    def test_parse_forecast_shapes(self):
+        """Test the combined response is sliced into the coordinator shapes."""
+        data = OpenMeteoClient.parse_forecast(_forecast_response())
+
+        assert data["elevation"] == 1035.0
+        assert data["current"]["temperature"] == 3.2
+        assert data["current"]["condition"] == "sunny"
+        assert len(data["daily_forecast"]) == 8
+        assert len(data["hourly_forecast"]) == 48
+        assert len(data["hourly_6h"]) == 6
+        assert [hour["hour"] for hour in data["hourly_6h"]] == [1, 2, 3, 4, 5, 6]
+        assert data["hourly_forecast"][0]["datetime"] > datetime.now()
+        assert data["daily_forecast"][0]["sunrise"].tzinfo is not None
+
+    def test_reused_response_takes_current_hour(self):
+        """Test a response parsed hours after its fetch uses the current hour's row."""
+        payload = _forecast_response()
+        fetched = datetime.now() - timedelta(hours=3)
+        payload["current"]["time"] = fetched.strftime("%Y-%m-%dT%H:%M")
+
+        current = OpenMeteoClient.parse_forecast(payload)["current"]
+
+        # The hourly values are their index from local midnight
+        assert current["temperature"] == float(datetime.now().hour)
+        assert current["wind_speed"] == float(datetime.now().hour)
+        assert current["timestamp"] == datetime.now().strftime("%Y-%m-%dT%H:00")
+        # Values missing from the hourly table are kept from the fetch
+        assert current["is_day"] is True
+
+    def test_forecast_rows_behave_like_dicts(self):
+        """Test table rows expose the same fields as the former per-step dicts."""
+        data = OpenMeteoClient.parse_forecast(_forecast_response())
+        daily = data["daily_forecast"]
+        hourly = data["hourly_forecast"]
+
+        assert isinstance(daily, ForecastTable)
+        assert daily[1].get("temperature") == 1.0
+        assert daily[1]["precipitation"] == daily[1]["precipitation_sum"]
+        assert daily[-1]["condition"] == "sunny"
+        assert daily[0].get("missing") is None
+        assert dict(hourly[0])["condition"] == "cloudy"
+        assert hourly[0]["temperature"] == hourly.column("temperature")[0]
+        assert len(daily[2:5]) == 3
+        with pytest.raises(IndexError):
+            daily[8]
+
+    def test_hourly_tables_share_columns(self):
+        """Test the 6h table reads the same time index as the hourly table."""
+        data = OpenMeteoClient.parse_forecast(_forecast_response())
+
+        assert data["hourly_6h"].column("datetime") == data["hourly_forecast"].column("datetime")[:6]
+        assert data["hourly_6h"][5]["wind_gust"] == data["hourly_forecast"][5]["wind_gust_speed"]
+        assert data["hourly_6h"].as_dicts()[0]["hour"] == 1
+
+    def test_tables_compare_by_value(self):
+        """Test tables parsed from the same response are equal."""
+        first = OpenMeteoClient.parse_forecast(_forecast_response())
+        second = OpenMeteoClient.parse_forecast(_forecast_response())
+
+        assert first["daily_forecast"] == second["daily_forecast"]
+        assert first["daily_forecast"] != second["daily_forecast"][:3]
+
+
+class TestRequestCoalescing:
+    """Test sharing of concurrent forecast requests."""
+
+    @pytest.mark.asyncio
+    async def test_same_location_shares_request(self):
+        """Test concurrent requests for the same location issue one HTTP call."""
+        first = OpenMeteoClient(latitude=45.9237, longitude=6.8694)
+        second = OpenMeteoClient(latitude=45.9237, longitude=6.8694)
+
+        async def slow_response(params, parse):
+            await asyncio.sleep(0.01)
+            return parse(_forecast_response())
+
+        mock_request = AsyncMock(side_effect=slow_response)
+        with patch.object(OpenMeteoClient, "_async_request", mock_request):
+            results = await asyncio.gather(
+                first.async_get_forecast(), second.async_get_forecast()
+            )
+
+        assert mock_request.call_count == 1
+        assert results[0] is results[1]
+
+    @pytest.mark.asyncio
+    async def test_nearby_locations_do_not_share(self):
+        """Test requests for nearby locations are not coalesced (own elevation)."""
+        first = OpenMeteoClient(latitude=45.9237, longitude=6.8694)
+        second = OpenMeteoClient(latitude=45.9238, longitude=6.8694)
+
+        mock_request = AsyncMock(side_effect=lambda params, parse: parse(_forecast_response()))
+        with patch.object(OpenMeteoClient, "_async_request", mock_request):
+            await asyncio.gather(first.async_get_forecast(), second.async_get_forecast())
+
+        assert mock_request.call_count == 2
+
+
+class TestBatchClient:
+    """Test multi-location forecast requests."""
+
+    @pytest.mark.asyncio
+    async def test_locations_are_chunked(self):
+        """Test locations are split into chunks and mapped back to their results."""
+        client = OpenMeteoBatchClient(batch_size=2)
+        locations = [(45.9, 6.8), (45.2, 6.1), (42.8, 0.1), (45.9, 6.8)]
+
+        mock_request = AsyncMock(
+            side_effect=lambda chunk, parse: parse([_forecast_response() for _ in chunk])
+        )
+        with patch.object(OpenMeteoBatchClient, "_async_request", mock_request):
+            forecasts = await client.async_get_forecasts(locations)
+
+        assert mock_request.call_count == 2
+        assert set(forecasts) == {(45.9, 6.8), (45.2, 6.1), (42.8, 0.1)}
+        assert forecasts[(42.8, 0.1)]["elevation"] == 1035.0
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_drops_only_its_locations(self):
+        """Test a failing chunk does not discard the other chunks."""
+        client = OpenMeteoBatchClient(batch_size=1)
+
+        async def request(chunk, parse):
+            if chunk[0] == (42.8, 0.1):
+                raise OpenMeteoApiError("boom")
+            return parse([_forecast_response()])
+
+        with patch.object(OpenMeteoBatchClient, "_async_request", side_effect=request):
+            forecasts = await client.async_get_forecasts([(45.9, 6.8), (42.8, 0.1)])
+
+        assert set(forecasts) == {(45.9, 6.8)}
+
+    @pytest.mark.asyncio
+    async def test_all_chunks_failing_raises(self):
+        """Test an error is raised when no location could be fetched."""
+        client = OpenMeteoBatchClient()
+
+        with patch.object(
+            OpenMeteoBatchClient,
+            "_async_request",
+            AsyncMock(side_effect=OpenMeteoApiError("boom")),
+        ):
+            with pytest.raises(OpenMeteoApiError):
+                await client.async_get_forecasts([(45.9, 6.8)])
+
+    @pytest.mark.asyncio
+    async def test_model_run_metadata(self):
+        """Test the latest model run is read from the model metadata."""
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.json = AsyncMock(
+            return_value={
+                "last_run_initialisation_time": 1770890400,
+                "last_run_availability_time": 1770897600,
+                "update_interval_seconds": 3600,
+            }
+        )
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=False)
+        session = MagicMock()
+        session.get = MagicMock(return_value=response)
+
+        run = await OpenMeteoBatchClient(session=session).async_get_model_run()
+
+        assert "meteofrance_arome_france_hd" in session.get.call_args.args[0]
+        assert run.initialisation == datetime(2026, 2, 12, 10, 0, tzinfo=timezone.utc)
+        assert run.available - run.initialisation == timedelta(hours=2)
+        assert run.update_interval == timedelta(hours=1)
+
+    @pytest.mark.asyncio
+    async def test_invalid_model_metadata_raises(self):
+        """Test unreadable metadata raises an API error."""
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.json = AsyncMock(return_value={})
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=False)
+        session = MagicMock()
+        session.get = MagicMock(return_value=response)
+
+        with pytest.raises(OpenMeteoApiError):
+            await OpenMeteoBatchClient(session=session).async_get_model_run()
+
+
+class TestResponseParsing:
+    """Test where response bodies are decoded and parsed."""
+
+    @staticmethod
+    def _response(data) -> MagicMock:
+        """Build a response whose body is the JSON encoding of data."""
+        response = MagicMock()
+        response.read = AsyncMock(return_value=json.dumps(data).encode())
+        return response
+
+    @pytest.mark.asyncio
+    async def test_large_forecast_parsed_in_executor(self):
+        """Test a full forecast response is decoded and parsed off the event loop."""
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "run_in_executor", wraps=loop.run_in_executor) as executor:
+            forecast = await async_read_json(
+                self._response(_forecast_response()), OpenMeteoClient.parse_forecast
+            )
+
+        executor.assert_called_once()
+        assert forecast["elevation"] == 1035.0
+        assert len(forecast["daily_forecast"]) == 8
+
+    @pytest.mark.asyncio
+    async def test_small_body_parsed_inline(self):
+        """Test tiny responses skip the executor."""
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "run_in_executor") as executor:
+            data = await async_read_json(self._response({"elevation": 1035.0}))
+
+        executor.assert_not_called()
+        assert data == {"elevation": 1035.0}
@@ -0,0 +1,61 @@
+"""Tests for the Météo-France API rate limiter."""
+import asyncio
+import time
+
+import pytest
+
+from custom_components.serac.api.rate_limiter import RateLimiter, get_rate_limiter
+
+
+class TestRateLimiter:
+    """Test RateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_wait(self):
+        """Test requests beyond the burst wait for the bucket to refill."""
+        limiter = RateLimiter(rate=20, capacity=2)
+        start = time.monotonic()
+
+        await limiter.acquire()
+        await limiter.acquire()
+        assert time.monotonic() - start < 0.04
+
+        await limiter.acquire()
+        assert time.monotonic() - start >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_priority_requests_go_first(self):
+        """Test user-triggered requests overtake queued background polls."""
+        limiter = RateLimiter(rate=50, capacity=1)
+        await limiter.acquire()
+        order = []
+
+        async def request(name, priority=False):
+            await limiter.acquire(priority=priority)
+            order.append(name)
+
+        background = [asyncio.create_task(request(f"poll {i}")) for i in range(2)]
+        await asyncio.sleep(0)
+        user = asyncio.create_task(request("user", priority=True))
+        await asyncio.gather(*background, user)
+
+        assert order == ["user", "poll 0", "poll 1"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_leaves_queue(self):
+        """Test a cancelled request does not block the ones behind it."""
+        limiter = RateLimiter(rate=50, capacity=1)
+        await limiter.acquire()
+
+        first = asyncio.create_task(limiter.acquire())
+        second = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        first.cancel()
+
+        await asyncio.wait_for(second, 1)
+        assert limiter._queue == []
+
+    def test_shared_per_key(self):
+        """Test clients using the same API key share one limiter."""
+        assert get_rate_limiter("key") is get_rate_limiter("key")
+        assert get_rate_limiter("key") is not get_rate_limiter("other")
@@ -0,0 +1,216 @@
+"""Tests for Serac sensor entities."""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.serac import binary_sensor
+from custom_components.serac.api.openmeteo_client import OpenMeteoClient
+from custom_components.serac.const import DOMAIN
+from custom_components.serac.sensor import (
+    AIR_QUALITY_CURRENT_SENSORS,
+    CURRENT_SENSORS,
+    DAILY_AQI_SENSORS,
+    DAILY_SENSORS,
+    SensorValues,
+    SeracSensor,
+    SeracSensorDescription,
+    async_setup_entry,
+)
+from custom_components.serac.utils import compile_value_path
+
+from .test_openmeteo_client import _forecast_response
+
+AROME_DESCRIPTIONS = (
+    *CURRENT_SENSORS,
+    *DAILY_SENSORS,
+    *AIR_QUALITY_CURRENT_SENSORS,
+    *DAILY_AQI_SENSORS,
+)
+
+
+def _arome_data() -> dict:
+    """Build coordinator data with two days of air quality forecast."""
+    return {
+        **OpenMeteoClient.parse_forecast(_forecast_response()),
+        "air_quality": {
+            "current": {"european_aqi": 25, "pm2_5": 8.5},
+            "daily_forecast": [
+                {"aqi_max": 30, "pm25_max": 9.0, "pm10_max": 14.0},
+                {"aqi_max": 41, "pm25_max": None, "pm10_max": 12.0},
+            ],
+        },
+    }
+
+
+class TestCachedValue:
+    """Test sensor values are computed once per coordinator update."""
+
+    def test_value_computed_once_per_update(self):
+        """Test native_value and available share one value_fn call."""
+        value_fn = MagicMock(return_value=12.5)
+        coordinator = MagicMock()
+        coordinator.data = {"current": {"temperature": 12.5}}
+        coordinator.last_update_success = True
+        sensor = SeracSensor(
+            coordinator,
+            SeracSensorDescription(key="temperature", name="Temperature", value_fn=value_fn),
+            "Test Location",
+            "test",
+            45.9237,
+            6.8694,
+        )
+
+        assert sensor.available is True
+        assert sensor.native_value == 12.5
+        assert value_fn.call_count == 1
+
+        value_fn.return_value = 13.0
+        with patch.object(sensor, "async_write_ha_state"):
+            sensor._handle_coordinator_update()
+
+        assert sensor.native_value == 13.0
+        assert sensor.available is True
+        assert value_fn.call_count == 2
+
+
+class TestValuePaths:
+    """Test path-based sensor values."""
+
+    def test_compiled_path(self):
+        """Test a compiled path reads nested values and tolerates gaps."""
+        get = compile_value_path(("daily_forecast", 1, "uv_index"))
+
+        assert get({"daily_forecast": [{}, {"uv_index": 4}]}) == 4
+        assert get({"daily_forecast": [{}]}) is None
+        assert get({"daily_forecast": None}) is None
+        assert get({}) is None
+
+    def test_descriptions_derive_data_key(self):
+        """Test path descriptions get a value_fn and a data key."""
+        description = SeracSensorDescription(
+            key="uv", value_path=("daily_forecast", 0, "uv_index")
+        )
+
+        assert description.data_key == "daily_forecast"
+        assert description.value_fn({"daily_forecast": [{"uv_index": 3}]}) == 3
+
+    def test_bulk_extraction_matches_value_fn(self):
+        """Test values extracted together equal each description's own value."""
+        data = _arome_data()
+        values = SensorValues(AROME_DESCRIPTIONS)
+
+        for description in AROME_DESCRIPTIONS:
+            assert values.get(data, description.key) == description.value_fn(data), description.key
+
+        assert values.get(data, "sunshine_duration_day0") == data["daily_forecast"][0]["sunshine_duration"] / 3600
+        assert values.get(data, "european_aqi_max_day1") == 41
+        assert values.get(data, "pm2_5_max_day1") is None
+        assert values.get(data, "european_aqi_max_day4") is None
+
+
+class TestSensorGroups:
+    """Test sensor groups selected in the options flow."""
+
+    @pytest.mark.asyncio
+    async def test_only_enabled_groups_are_created(self):
+        """Test disabled AROME groups are neither created nor kept in the registry."""
+        entry = MagicMock(entry_id="entry")
+        entry.data = {
+            "location_name": "Test Location",
+            "entity_prefix": "test",
+            "latitude": 45.9237,
+            "longitude": 6.8694,
+            "sensor_groups": ["current"],
+        }
+        hass = MagicMock()
+        hass.data = {DOMAIN: {"entry": {"arome_coordinator": MagicMock()}}}
+        stale = MagicMock(
+            domain="sensor",
+            entity_id="sensor.test_uv_index_day0",
+            unique_id="serac_45.9237_6.8694_uv_index_day0",
+        )
+        kept = MagicMock(
+            domain="sensor",
+            entity_id="sensor.test_temperature",
+            unique_id="serac_45.9237_6.8694_temperature",
+        )
+        async_add_entities = MagicMock()
+
+        with patch("custom_components.serac.utils.er") as er, patch(
+            "custom_components.serac.sensor.async_dispatcher_connect"
+        ):
+            er.async_entries_for_config_entry.return_value = [stale, kept]
+            await async_setup_entry(hass, entry, async_add_entities)
+
+        keys = {
+            entity.entity_description.key
+            for entity in async_add_entities.call_args.args[0]
+        }
+        assert keys == {"elevation"} | {d.key for d in CURRENT_SENSORS}
+        er.async_get.return_value.async_remove.assert_called_once_with(
+            "sensor.test_uv_index_day0"
+        )
+
+    @pytest.mark.asyncio
+    async def test_disabled_vigilance_group_is_removed(self):
+        """Test turning off Vigilance removes its sensors and binary sensors."""
+        entry = MagicMock(entry_id="entry")
+        entry.data = {
+            "location_name": "Test Location",
+            "entity_prefix": "test",
+            "latitude": 45.9237,
+            "longitude": 6.8694,
+            "sensor_groups": ["current", "avalanche"],
+        }
+        hass = MagicMock()
+        hass.data = {DOMAIN: {"entry": {"arome_coordinator": MagicMock()}}}
+        registry_entries = [
+            MagicMock(
+                domain="sensor",
+                entity_id="sensor.test_vigilance_level",
+                unique_id="serac_45.9237_6.8694_vigilance_level",
+            ),
+            MagicMock(
+                domain="sensor",
+                entity_id="sensor.test_vigilance_thunderstorm",
+                unique_id="serac_45.9237_6.8694_vigilance_phenom_thunderstorm",
+            ),
+            MagicMock(
+                domain="binary_sensor",
+                entity_id="binary_sensor.test_vigilance_red_alert",
+                unique_id="serac_45.9237_6.8694_has_red_alert",
+            ),
+            MagicMock(
+                domain="sensor",
+                entity_id="sensor.test_temperature",
+                unique_id="serac_45.9237_6.8694_temperature",
+            ),
+        ]
+
+        with patch("custom_components.serac.utils.er") as er, patch(
+            "custom_components.serac.sensor.async_dispatcher_connect"
+        ):
+            er.async_entries_for_config_entry.return_value = registry_entries
+            await async_setup_entry(hass, entry, MagicMock())
+            await binary_sensor.async_setup_entry(hass, entry, MagicMock())
+
+        removed = {
+            call.args[0] for call in er.async_get.return_value.async_remove.call_args_list
+        }
+        assert removed == {
+            "sensor.test_vigilance_level",
+            "sensor.test_vigilance_thunderstorm",
+            "binary_sensor.test_vigilance_red_alert",
+        }
+
+    def test_later_days_disabled_by_default(self):
+        """Test only today's and tomorrow's forecast sensors start enabled."""
+        enabled = {
+            d.key for d in (*DAILY_SENSORS, *DAILY_AQI_SENSORS)
+            if d.entity_registry_enabled_default
+        }
+
+        assert "wind_speed_max_day1" in enabled
+        assert "european_aqi_max_day1" in enabled
+        assert "wind_speed_max_day2" not in enabled
+        assert "pm10_max_day4" not in enabled
@@ -0,0 +1,211 @@
+"""Tests for the Météo-France Vigilance API client."""
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from custom_components.serac.api import vigilance_client
+from custom_components.serac.api.departments import (
+    DepartmentIndex,
+    _point_in_polygon,
+    find_department,
+)
+from custom_components.serac.api.vigilance_client import (
+    VigilanceClient,
+    VigilanceFeed,
+    build_department_index,
+    invalidate_vigilance_feeds,
+)
+from custom_components.serac.const import DEPARTMENT_BOUNDARIES
+
+
+def _national_map() -> dict:
+    """Build a minimal national vigilance map with two departments."""
+    return {
+        "update_time": "2026-01-15T06:00:00Z",
+        "product": {
+            "periods": [
+                {
+                    "echeance": "J",
+                    "timelaps": {
+                        "domain_ids": [
+                            {
+                                "domain_id": "74",
+                                "max_color_id": 3,
+                                "phenomenon_items": [
+                                    {"phenomenon_id": "8", "phenomenon_max_color_id": 3},
+                                    {"phenomenon_id": "1", "phenomenon_max_color_id": 2},
+                                ],
+                            },
+                            {
+                                "domain_id": "38",
+                                "max_color_id": 1,
+                                "phenomenon_items": [],
+                            },
+                        ]
+                    },
+                }
+            ]
+        },
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_feeds():
+    """Isolate the module-level feed registry between tests."""
+    with patch.dict(vigilance_client._FEEDS, clear=True):
+        yield
+
+
+class TestDepartmentLookup:
+    """Test the spatial department index."""
+
+    @pytest.mark.parametrize(
+        ("lat", "lon", "expected"),
+        [
+            (45.9237, 6.8694, "74"),  # Chamonix
+            (45.8992, 6.1294, "74"),  # Annecy
+            (45.857, 6.617, "74"),  # Megève, next to Savoie
+            (45.866, 5.944, "74"),  # Rumilly
+            (46.3705, 6.4794, "74"),  # Thonon-les-Bains, on Lake Geneva
+            (46.4008, 6.5898, "74"),  # Évian, on Lake Geneva
+            (45.566, 5.921, "73"),  # Chambéry
+            (45.676, 6.392, "73"),  # Albertville
+            (45.688, 5.909, "73"),  # Aix-les-Bains
+            (45.751, 6.415, "73"),  # Ugine, next to Haute-Savoie
+            (45.44, 5.75, "73"),  # Les Échelles, next to Isère
+            (45.1885, 5.7245, "38"),  # Grenoble
+            (45.435, 6.018, "38"),  # Pontcharra, next to Savoie
+            (45.01, 6.12, "38"),  # Les Deux Alpes, next to Hautes-Alpes
+            (45.046, 6.306, "05"),  # La Grave, between Isère and Savoie
+            (44.899, 6.643, "05"),  # Briançon
+            (44.785, 6.03, "05"),  # Saint-Firmin, next to Isère
+            (46.333, 6.058, "01"),  # Gex, also inside the Jura box
+            (46.20, 6.15, "74"),  # Geneva: in no outline, falls back to the 74 box
+            (42.8, 0.1, "65"),  # Gavarnie
+            (42.889, -0.113, "65"),  # Cauterets
+            (42.817, 0.322, "65"),  # Saint-Lary-Soulan
+            (42.988, -0.427, "64"),  # Laruns, next to Hautes-Pyrénées
+            (43.358, -1.774, "64"),  # Hendaye, on the Basque coast
+            (43.483, -1.559, "64"),  # Biarritz
+            (42.790, 0.594, "31"),  # Bagnères-de-Luchon
+            (42.985, 1.147, "09"),  # Saint-Girons, next to Haute-Garonne
+            (42.720, 1.838, "09"),  # Ax-les-Thermes
+            (42.505, 2.035, "66"),  # Font-Romeu
+            (42.876, 2.183, "11"),  # Quillan, next to Ariège
+            (42.443, 3.166, "66"),  # Cerbère, on the Mediterranean coast
+            (43.776, 7.504, "06"),  # Menton
+            (42.507, 1.52, None),  # Andorra la Vella
+            (48.8566, 2.3522, None),  # Paris is not indexed
+        ],
+    )
+    def test_find_department(self, lat, lon, expected):
+        """Test border locations resolve to the department they lie in."""
+        assert find_department(lat, lon) == expected
+
+    def test_outlines_do_not_overlap(self):
+        """Test no point of the mountain regions lies in two outlines."""
+        outlines = [
+            info["polygon"]
+            for info in DEPARTMENT_BOUNDARIES.values()
+            if "polygon" in info
+        ]
+        # 0.05° grid over the Alps and the Pyrenees
+        points = [
+            (lat / 100, lon / 100)
+            for lat_range, lon_range in (
+                (range(4352, 4645, 5), range(452, 775, 5)),
+                (range(4232, 4395, 5), range(-180, 320, 5)),
+            )
+            for lat in lat_range
+            for lon in lon_range
+        ]
+
+        for lat, lon in points:
+            matches = sum(_point_in_polygon(lat, lon, ring) for ring in outlines)
+            assert matches <= 1, (lat, lon)
+
+    def test_polygon_containment(self):
+        """Test a polygon ring takes precedence over its bounding box."""
+        index = DepartmentIndex(
+            {
+                # Triangle covering the lower-left half of its box
+                "AA": {
+                    "name": "A",
+                    "bounds": (0.0, 1.0, 0.0, 1.0),
+                    "polygon": [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)],
+                },
+                "BB": {"name": "B", "bounds": (0.0, 2.0, 0.0, 2.0)},
+            }
+        )
+
+        assert index.lookup(0.2, 0.2) == "AA"
+        assert index.lookup(0.9, 0.9) == "BB"
+
+    def test_bounding_box_fallback(self):
+        """Test a point outside every outline falls back to the bounding boxes."""
+        index = DepartmentIndex(
+            {"AA": {"name": "A", "polygon": [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]}}
+        )
+
+        assert index.lookup(0.9, 0.9) == "AA"
+        assert index.lookup(1.5, 0.5) is None
+
+
+class TestDepartmentIndex:
+    """Test indexing of the national map."""
+
+    def test_build_department_index(self):
+        """Test every department of the current period is indexed."""
+        index = build_department_index(_national_map())
+
+        assert set(index) == {"74", "38"}
+        assert index["74"]["overall_level"] == 3
+        assert index["74"]["phenomena"]["avalanche"] == {"level": 3, "color": "orange"}
+        assert index["38"]["phenomena"] == {}
+
+    def test_build_department_index_empty(self):
+        """Test a response without periods yields an empty index."""
+        assert build_department_index({"product": {"periods": []}}) == {}
+
+
+class TestSharedFeed:
+    """Test sharing of the national map between clients."""
+
+    @pytest.mark.asyncio
+    async def test_clients_share_one_download(self):
+        """Test clients in different departments download the map once."""
+        annecy = VigilanceClient("token", latitude=46.1, longitude=6.6)
+        voiron = VigilanceClient("token", latitude=45.3, longitude=5.5)
+
+        mock_download = AsyncMock(
+            return_value=vigilance_client._index_national_map(_national_map())
+        )
+        with patch.object(VigilanceFeed, "_async_download", mock_download):
+            first, second = await asyncio.gather(
+                annecy.async_get_current_vigilance(),
+                voiron.async_get_current_vigilance(),
+            )
+            await annecy.async_get_current_vigilance()
+
+        assert mock_download.call_count == 1
+        assert first["department"] == "74"
+        assert first["overall_color"] == "orange"
+        assert second["department"] == "38"
+        assert second["overall_level"] == 1
+        assert first["update_time"] == "2026-01-15T06:00:00Z"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_download(self):
+        """Test invalidating the feeds triggers a new download."""
+        client = VigilanceClient("token", latitude=46.1, longitude=6.6)
+
+        mock_download = AsyncMock(
+            return_value=vigilance_client._index_national_map(_national_map())
+        )
+        with patch.object(VigilanceFeed, "_async_download", mock_download):
+            await client.async_get_current_vigilance()
+            invalidate_vigilance_feeds()
+            await client.async_get_current_vigilance()
+
+        assert mock_download.call_count == 2
@@ -0,0 +1,76 @@
+"""Tests for the Serac weather entity."""
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.serac.api.openmeteo_client import OpenMeteoClient
+from custom_components.serac.weather import SeracWeather
+
+from .test_openmeteo_client import _forecast_response
+
+
+def _weather(compact_attributes: bool) -> SeracWeather:
+    """Build a weather entity over parsed forecast data."""
+    coordinator = MagicMock()
+    coordinator.stale_attributes_for.return_value = {}
+    coordinator.data = {
+        **OpenMeteoClient.parse_forecast(_forecast_response()),
+        "air_quality": {},
+    }
+    return SeracWeather(
+        coordinator, "Test Location", "test", 45.9237, 6.8694, compact_attributes
+    )
+
+
+class TestWeatherAttributes:
+    """Test the weather entity state attributes."""
+
+    def test_full_attributes(self):
+        """Test forecasts are included by default."""
+        attrs = _weather(compact_attributes=False).extra_state_attributes
+
+        assert attrs["current_temperature"] is not None
+        assert "today_wind_speed_max" in attrs
+        assert "hour_6_temperature" in attrs
+        assert "day_7_sunrise" in attrs
+
+    def test_compact_attributes(self):
+        """Test compact attributes only hold the current conditions."""
+        attrs = _weather(compact_attributes=True).extra_state_attributes
+
+        assert attrs["location_name"] == "Test Location"
+        assert attrs["current_temperature"] is not None
+        assert "today_wind_speed_max" not in attrs
+        assert "hour_1_temperature" not in attrs
+
+    def test_section_fetch_times(self):
+        """Test the fetch time of each section is exposed."""
+        weather = _weather(compact_attributes=True)
+        fetched_at = datetime(2026, 2, 12, 10, 0, tzinfo=timezone.utc)
+        weather.coordinator.data = {
+            **weather.coordinator.data,
+            "updated": {"forecast": fetched_at},
+        }
+
+        assert weather.extra_state_attributes["forecast_updated"] == fetched_at.isoformat()
+        # Exposed, but kept out of the recorder
+        assert "forecast_updated" in weather._unrecorded_attributes
+
+    def test_attributes_built_once_per_update(self):
+        """Test attributes are reused until the coordinator data changes."""
+        weather = _weather(compact_attributes=False)
+        first = weather.extra_state_attributes
+        assert weather.extra_state_attributes is first
+
+        weather.coordinator.data = {**weather.coordinator.data, "elevation": 2000}
+        assert weather.extra_state_attributes["elevation"] == "2000m"
+
+    @pytest.mark.asyncio
+    async def test_forecast_details_service(self):
+        """Test the on-demand service returns the forecast attributes."""
+        details = await _weather(compact_attributes=True).async_get_forecast_details()
+
+        assert "today_wind_speed_max" in details
+        assert "hour_1_temperature" in details
+        assert "current_temperature" not in details